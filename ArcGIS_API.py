@@ -4,13 +4,26 @@ Methods for working within AGOL/Portal and the ArcGIS API.
 """
 #Import Required Dependices
 import os, sys, traceback
+import io
+import json
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 import generalDM as dm
 import logging
-import arcgis
-from arcgis.gis import GIS
-from arcgis.features import FeatureLayerCollection
 import pandas as pd
 
+# ArcGIS API - the direct feature service query (see 'queryFeatureService') runs over REST without it
+try:
+    import arcgis
+    from arcgis.gis import GIS
+    from arcgis.features import FeatureLayerCollection
+except ImportError:
+    arcgis = None
+    GIS = None
+    FeatureLayerCollection = None
+
 #from ETL import etlInstance
 
 
@@ -52,6 +65,7 @@ class generalArcGIS:
 
         try:
 
+            cache = None
             if etlInstance.AGOLDownload == 'Yes':
 
                 # Connect to the Cloud via passed credentials workflow
@@ -61,6 +75,30 @@ class generalArcGIS:
                 else:
                     outGIS = connectAGOL_ArcGIS(generalArcGIS=generalArcGIS, dmInstance=dmInstance)
 
+                # Query the layers/tables of the feature service directly rather than exporting the item
+                if etlInstance.extractMode == 'Query':
+                    return queryFeatureLayer(outGIS, generalArcGIS, etlInstance, dmInstance)
+
+                # Query the features created/edited since the last successful run and merge with the local base
+                if etlInstance.extractMode == 'Incremental':
+                    return incrementalFeatureLayer(outGIS, generalArcGIS, etlInstance, dmInstance)
+
+                # Reuse the cached extraction of the export when the service is unchanged since it was exported
+                if etlInstance.exportCache == 'Yes':
+                    cache = dm.exportCache(os.path.join(etlInstance.outDir, 'workspace', 'exportCache'))
+                    layerIDs, version = serviceVersion(outGIS.content.get(generalArcGIS.layerID))
+                    if version is None:
+                        logMsg = (f'Export cache skipped - {generalArcGIS.layerID} - the service reports no last edit'
+                                  f' date, data edits can not be detected')
+                        dm.generalDMClass.messageLogFile(dmInstance, logMsg=logMsg)
+                        logging.warning(logMsg)
+                        cache = None
+                    else:
+                        cachedDir = cache.get(generalArcGIS.layerID, layerIDs, version)
+                        dm.generalDMClass.messageLogFile(dmInstance, logMsg=cache.summary())
+                        if cachedDir is not None:
+                            return dm.generalDMClass.importFilesToDF(inDir=cachedDir)
+
                 # Import the feature layer
                 outFeatureLayer = importFeatureLayer(outGIS, generalArcGIS, etlInstance, dmInstance)
                 outzipPath = outFeatureLayer[0]
@@ -76,6 +114,14 @@ class generalArcGIS:
             dm.generalDMClass.unZipZip(zipPath=outzipPath, outName=outName,outDir=etlInstance.outDir)
             # Path to Unzipped files
             fullPathZipped = f"{etlInstance.outDir}\\{outName}"
+
+            # Cache the extraction for the service version exported
+            if cache is not None:
+                try:
+                    cache.put(generalArcGIS.layerID, layerIDs, version, fullPathZipped, title=outName)
+                except Exception as e:
+                    logging.warning(f'Unable to cache the export - {outName} - {e}')
+
             # Import Extracted Files to Dataframes
             outDFDic = dm.generalDMClass.importFilesToDF(inDir=fullPathZipped)
 
@@ -259,6 +305,301 @@ class generalArcGIS:
             traceback.print_exc(file=sys.stdout)
 
 
+def serviceVersion(item):
+    """
+    Layer/table ids and version of a feature layer item, used to key the export cache (see 'generalDM.exportCache').
+    The version is the latest 'editingInfo.lastEditDate' of the service and its layers/tables, None when the service
+    reports no edit date (the item 'modified' time doesn't change on data edits, so the export isn't cached).
+
+    :param item: AGOL/Portal feature layer item
+
+    :return: layerIDs: List of the layer/table ids in the service
+    version: Service version (epoch milliseconds), None if the service reports no edit date
+    """
+
+    flc = FeatureLayerCollection.fromitem(item)
+    layers = list(flc.layers or []) + list(flc.tables or [])
+    layerIDs = sorted(layer.properties.id for layer in layers)
+
+    editDates = []
+    for properties in [flc.properties] + [layer.properties for layer in layers]:
+        editingInfo = properties.get('editingInfo') or {}
+        if editingInfo.get('lastEditDate'):
+            editDates.append(editingInfo['lastEditDate'])
+
+    version = max(editDates) if editDates else None
+
+    return layerIDs, version
+
+
+def featureRecords(features, properties):
+    """
+    Dataframe of queried layer features - attribute fields in the layer field order, point coordinates as 'x'/'y'.
+
+    :param features: List of feature dictionaries ({'attributes': {}, 'geometry': {}})
+    :param properties: Layer properties (fields, geometryType)
+
+    :return: recordsDF: Dataframe of the feature records
+    """
+
+    fieldNames = [field['name'] for field in properties['fields']]
+    recordsDF = pd.DataFrame([feature['attributes'] for feature in features], columns=fieldNames)
+
+    if properties.get('geometryType') == 'esriGeometryPoint':
+        recordsDF['x'] = [(feature.get('geometry') or {}).get('x') for feature in features]
+        recordsDF['y'] = [(feature.get('geometry') or {}).get('y') for feature in features]
+
+    return recordsDF
+
+
+def exportFrame(recordsDF, properties):
+    """
+    Shape queried layer records as the CSV export of the layer (see 'importFeatureLayer') so the protocol routines
+    are unchanged - columns named by the field aliases, dates as text (UTC) and read back via CSV so the column types
+    match 'importFilesToDF'.
+
+    :param recordsDF: Dataframe of the layer records (see 'featureRecords')
+    :param properties: Layer properties (fields)
+
+    :return: outDF: Dataframe as imported from the CSV export
+    """
+
+    outDF = recordsDF.copy()
+    for field in properties['fields']:
+        if field['type'] == 'esriFieldTypeDate' and field['name'] in outDF.columns:
+            outDF[field['name']] = pd.to_datetime(outDF[field['name']], unit='ms').dt.strftime('%m/%d/%Y %I:%M:%S %p')
+
+    outDF = outDF.rename(columns={field['name']: field.get('alias') or field['name'] for field in properties['fields']})
+
+    return pd.read_csv(io.StringIO(outDF.to_csv(index=False)))
+
+
+def incrementalFeatureLayer(outGIS, generalArcGIS, etlInstance, dmInstance, chunkSize=500):
+    """
+    Incremental extraction of the feature layer.  Per layer/table only the features created/edited since the layer
+    watermark (see 'generalDM.extractWatermark') are queried, child (repeat) layers also return the records of the
+    parents created/edited since the watermark (ParentGlobalID).  Queried features are merged with the local base of
+    the prior runs and features deleted from the layer are dropped.  The merged bases are staged on
+    'etlInstance.extractStore' and the watermarks advance only when the run loads successfully (see 'ETL.py').
+
+    :param outGIS: GIS Connection
+    :param generalArcGIS: ArcGIS instance
+    :param etlInstance: ETL processing instance
+    :param dmInstance: Data Management instance
+    :param chunkSize: Number of parent GlobalIDs per ParentGlobalID query
+
+    :return: outDFDic - Dictionary layer name_layer id: dataframe as imported from the CSV export
+    """
+
+    item = outGIS.content.get(generalArcGIS.layerID)
+    flc = FeatureLayerCollection.fromitem(item)
+    store = dm.extractWatermark(os.path.join(etlInstance.outDir, 'workspace', 'extractWatermark'),
+                                generalArcGIS.layerID)
+
+    outDFDic = {}
+    changedGlobalIDs = []
+    layers = sorted(list(flc.layers or []) + list(flc.tables or []), key=lambda layer: layer.properties.id)
+    for layer in layers:
+        properties = layer.properties
+        layerKey = f'{properties.name}_{properties.id}'
+        oidField = properties.objectIdField
+        editField = (properties.get('editFieldsInfo') or {}).get('editDateField')
+        fieldNames = [field['name'] for field in properties.fields]
+
+        whereClauses = [store.whereClause(layerKey, editField=editField, oidField=oidField)]
+        if whereClauses[0] != '1=1' and 'ParentGlobalID' in fieldNames and changedGlobalIDs:
+            for start in range(0, len(changedGlobalIDs), chunkSize):
+                parentIDs = ', '.join(f"'{globalID}'" for globalID in changedGlobalIDs[start:start + chunkSize])
+                whereClauses.append(f'ParentGlobalID IN ({parentIDs})')
+
+        features = []
+        for whereClause in whereClauses:
+            featureSet = layer.query(where=whereClause, out_fields='*', return_all_records=True)
+            features.extend({'attributes': feature.attributes, 'geometry': feature.geometry}
+                            for feature in featureSet.features)
+        deltaDF = featureRecords(features, properties)
+
+        globalIDField = properties.get('globalIdField')
+        if globalIDField and not deltaDF.empty:
+            changedGlobalIDs.extend(deltaDF[globalIDField].dropna().unique().tolist())
+
+        # ObjectIDs currently in the layer - base records no longer in the layer have been deleted
+        currentIDs = layer.query(where='1=1', return_ids_only=True)['objectIds']
+        mergedDF = store.merge(layerKey, deltaDF, oidField=oidField, editField=editField, currentIDs=currentIDs)
+        outDFDic[layerKey] = exportFrame(mergedDF, properties)
+
+        logMsg = (f'Incremental extract - {layerKey} - {len(deltaDF)} new/edited record(s) since the watermark,'
+                  f' {len(mergedDF)} record(s)')
+        dm.generalDMClass.messageLogFile(dmInstance, logMsg=logMsg)
+        logging.info(logMsg)
+
+    etlInstance.extractStore = store
+
+    return outDFDic
+
+
+def restRequest(url, params, token=None, timeout=120):
+    """
+    POST a request to an ArcGIS REST endpoint and return the JSON response.
+
+    :param url: REST endpoint URL
+    :param params: Dictionary of request parameters ('f' defaults to 'json')
+    :param token: Optional AGOL/Portal token
+    :param timeout: Request timeout in seconds
+
+    :return: Dictionary of the JSON response, RuntimeError is raised for a REST error response
+    """
+
+    params = {'f': 'json', **params}
+    if token:
+        params['token'] = token
+
+    request = urllib.request.Request(url, data=urllib.parse.urlencode(params).encode())
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        outJSON = json.loads(response.read().decode('utf-8'))
+
+    if 'error' in outJSON:
+        raise RuntimeError(f"{url} - {outJSON['error'].get('code')} - {outJSON['error'].get('message')}")
+
+    return outJSON
+
+
+def objectIDRanges(objectIDs, maxRecordCount):
+    """
+    Split ObjectIDs into ranges of at most 'maxRecordCount' features.
+
+    :param objectIDs: List of ObjectIDs
+    :param maxRecordCount: Maximum features returned per query by the layer
+
+    :return: List of (first ObjectID, last ObjectID) ranges
+    """
+
+    objectIDs = sorted(objectIDs or [])
+    return [(objectIDs[start], objectIDs[min(start + maxRecordCount, len(objectIDs)) - 1])
+            for start in range(0, len(objectIDs), maxRecordCount)]
+
+
+def queryRange(layerURL, oidField, firstID, lastID, token=None, timeout=120):
+    """
+    Query the features of a layer in an ObjectID range, geometry in WGS84 (outSR 4326) as in the CSV export.  Ranges
+    exceeding the transfer limit (e.g. features added since the ObjectIDs were read) are split in half and queried
+    again.
+
+    :param layerURL: Layer/table REST URL
+    :param oidField: ObjectID field of the layer
+    :param firstID: First ObjectID of the range
+    :param lastID: Last ObjectID of the range
+    :param token: Optional AGOL/Portal token
+    :param timeout: Request timeout in seconds
+
+    :return: List of feature dictionaries ({'attributes': {}, 'geometry': {}})
+    """
+
+    outJSON = restRequest(f'{layerURL}/query', {'where': f'{oidField} >= {firstID} AND {oidField} <= {lastID}',
+                                                'outFields': '*', 'returnGeometry': 'true', 'outSR': 4326},
+                          token=token, timeout=timeout)
+
+    if outJSON.get('exceededTransferLimit') and lastID > firstID:
+        midID = (firstID + lastID) // 2
+        return (queryRange(layerURL, oidField, firstID, midID, token=token, timeout=timeout)
+                + queryRange(layerURL, oidField, midID + 1, lastID, token=token, timeout=timeout))
+
+    return outJSON.get('features', [])
+
+
+def queryFeatureService(serviceURL, token=None, maxWorkers=4, timeout=120):
+    """
+    Extract the layers/tables of a feature service by querying them directly (no item export).  Per layer the
+    ObjectIDs are read ('returnIdsOnly'), split into ranges within the layer 'maxRecordCount' and the ranges of all
+    layers are queried concurrently on a bounded thread pool.
+
+    :param serviceURL: Feature service REST URL (.../FeatureServer)
+    :param token: Optional AGOL/Portal token
+    :param maxWorkers: Maximum number of concurrent range queries
+    :param timeout: Request timeout in seconds
+
+    :return: outDFDic - Dictionary layer name_layer id: dataframe as imported from the CSV export
+    """
+
+    serviceURL = serviceURL.rstrip('/')
+    serviceJSON = restRequest(serviceURL, {}, token=token, timeout=timeout)
+    layerIDs = sorted(layer['id'] for layer in serviceJSON.get('layers', []) + serviceJSON.get('tables', []))
+
+    with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+        layerProperties = {}
+        rangeFutures = {}
+        for layerID in layerIDs:
+            layerURL = f'{serviceURL}/{layerID}'
+            properties = restRequest(layerURL, {}, token=token, timeout=timeout)
+            idJSON = restRequest(f'{layerURL}/query', {'where': '1=1', 'returnIdsOnly': 'true'}, token=token,
+                                 timeout=timeout)
+
+            layerProperties[layerID] = properties
+            maxRecordCount = properties.get('maxRecordCount') or 1000
+            rangeFutures[layerID] = [executor.submit(queryRange, layerURL, properties['objectIdField'], firstID,
+                                                     lastID, token, timeout)
+                                     for firstID, lastID in objectIDRanges(idJSON.get('objectIds'), maxRecordCount)]
+
+        outDFDic = {}
+        for layerID in layerIDs:
+            properties = layerProperties[layerID]
+            features = [feature for future in rangeFutures[layerID] for feature in future.result()]
+            outDFDic[f"{properties['name']}_{layerID}"] = exportFrame(featureRecords(features, properties), properties)
+
+    return outDFDic
+
+
+def queryFeatureLayer(outGIS, generalArcGIS, etlInstance, dmInstance):
+    """
+    Extract the feature layer item by querying its feature service directly (see 'queryFeatureService') rather than
+    exporting the item to CSV - no temporary export item is created on the portal.
+
+    :param outGIS: GIS Connection
+    :param generalArcGIS: ArcGIS instance
+    :param etlInstance: ETL processing instance
+    :param dmInstance: Data Management instance
+
+    :return: outDFDic - Dictionary layer name_layer id: dataframe as imported from the CSV export
+    """
+
+    item = outGIS.content.get(generalArcGIS.layerID)
+    token = getattr(outGIS._con, 'token', None)
+
+    start = time.perf_counter()
+    outDFDic = queryFeatureService(item.url, token=token, maxWorkers=etlInstance.queryWorkers)
+
+    recordCount = sum(len(df) for df in outDFDic.values())
+    logMsg = (f'Successfully Queried from - {generalArcGIS.cloudPath} - {item.title} - {len(outDFDic)} layer(s),'
+              f' {recordCount} record(s) in {time.perf_counter() - start:.1f}s')
+    dm.generalDMClass.messageLogFile(dmInstance, logMsg=logMsg)
+    logging.info(logMsg)
+
+    return outDFDic
+
+
+def benchmarkFeatureService(serviceURL, token=None, workerCounts=(1, 4, 8)):
+    """
+    Time the direct feature service query (see 'queryFeatureService') for each number of concurrent range queries.
+
+    :param serviceURL: Feature service REST URL (.../FeatureServer)
+    :param token: Optional AGOL/Portal token
+    :param workerCounts: Numbers of concurrent range queries timed
+
+    :return: Dictionary number of workers: seconds
+    """
+
+    timings = {}
+    for maxWorkers in workerCounts:
+        start = time.perf_counter()
+        queryFeatureService(serviceURL, token=token, maxWorkers=maxWorkers)
+        timings[maxWorkers] = time.perf_counter() - start
+
+        logMsg = f'Feature service query - {maxWorkers} worker(s) - {timings[maxWorkers]:.2f}s'
+        logging.info(logMsg)
+
+    return timings
+
+
 def importFeatureLayer(outGIS, generalArcGIS, etlInstance, dmInstance):
     """
     Workflow for processing of the passed AGOL/Portal ID
@@ -4,6 +4,7 @@ Extract Transform and Load (ETL) Methods/Functions to be used for general AGOL/P
 """
 #Import Required Dependices
 import os, sys, traceback
+from concurrent.futures import ThreadPoolExecutor
 import generalDM as dm
 import ArcGIS_API as agl
 import logging
@@ -19,7 +20,21 @@ class etlInstance:
     # Class Variables
     numETLInstances = 0
 
-    def __init__(self, protocol, inDBBE, inDBFE, flID, yearLU, inUser, outDir, AGOLDownload, photoDir, elephantSeason):
+    # Backend tables copied to the local read mirror per protocol when 'readMirror' is 'Yes'
+    readMirrorTables = {'pinn-elephant': ('tblEvents', 'tblEventObservers', 'tblResights', 'tblResightEvents')}
+
+    # Protocols processing an AGOL/Portal feature layer export
+    featureLayerProtocols = ('snplpore', 'salmonids-efish', 'salmonids-smolts', 'pinn-elephant', 'nsow')
+
+    # Threads in the startup prefetch pool when 'prefetch' is 'Yes'
+    prefetchWorkers = 4
+
+    # Concurrent ObjectID range queries per feature service when 'extractMode' is 'Query'
+    queryWorkers = 4
+
+    def __init__(self, protocol, inDBBE, inDBFE, flID, yearLU, inUser, outDir, AGOLDownload, photoDir, elephantSeason,
+                 unitOfWork='No', lookupSnapshot='Yes', readMirror='No', indexAdvisor='Report',
+                 bulkTextImport='No', prefetch='Yes', exportCache='Yes', extractMode='Export'):
         """
         Define the instantiated etlInstance attributes
         
@@ -33,6 +48,23 @@ class etlInstance:
         :param AGOLDownload: Define if the AGOL/Portal Feature Layers need to be download, used in when developing code.
         :param photoDir: Directory where exported photos from survey 123 will be export (SFAN Server, Local Directory
         :param elephantSeason: Defines which Elephant Season is being processed.
+        :param unitOfWork: Backend transaction scope - 'No' each step commits, 'Run' single transaction for the run,
+        'Stage' single transaction per protocol stage with failures rolling back only the current stage.
+        :param lookupSnapshot: 'Yes' lookup tables are snapshotted in the workspace and reused by the next run when
+        unchanged in the backend, 'No' lookup tables are read from the backend each run.
+        :param readMirror: 'Yes' the protocol tables in 'readMirrorTables' are copied to a local SQLite file at the
+        start of the run and read-only queries on them are served locally, 'No' all reads go to the backend.
+        :param indexAdvisor: 'Report' logs the backend columns joined/filtered on during the run without an index,
+        'Create' also creates the missing indexes (maintenance mode), 'No' no index advice.
+        :param bulkTextImport: 'Yes' table writer appends are bulk loaded by the Access engine from CSV files in the
+        workspace (falls back to the ODBC append when not possible), 'No' appends via ODBC.
+        :param prefetch: 'Yes' the AGOL/Portal export and the lookup/reference tables read by the prior run are
+        fetched concurrently on a thread pool at startup, 'No' each step is run in turn.
+        :param exportCache: 'Yes' the extracted AGOL/Portal export is cached in the workspace and reused while the
+        service is unchanged (edit date/modified time), 'No' the item is exported each run.
+        :param extractMode: 'Export' the item is exported to CSV, 'Query' the layers/tables of the feature service are
+        queried directly in concurrent ObjectID ranges, 'Incremental' the features created/edited since the last
+        successful run (edit date/ObjectID watermark) are queried and merged with the local base in the workspace.
 
         :return: instantiated self object
         """
@@ -46,6 +78,21 @@ class etlInstance:
         self.AGOLDownload = AGOLDownload
         self.photoDir = photoDir
         self.elephantSeason = elephantSeason
+        self.unitOfWork = unitOfWork
+        self.lookupSnapshot = lookupSnapshot
+        self.readMirror = readMirror
+        self.indexAdvisor = indexAdvisor
+        self.bulkTextImport = bulkTextImport
+        self.prefetch = prefetch
+        self.exportCache = exportCache
+        self.extractMode = extractMode
+        # Incremental extraction store staged by the feature layer extraction, committed when the run succeeds
+        self.extractStore = None
+
+        # Backend session with the pooled backend connections shared by all generalDM helpers during the run
+        self.backendSession = dm.backendSession()
+        if bulkTextImport == 'Yes':
+            self.backendSession.textImportDir = os.path.join(outDir, 'workspace', 'textImport')
 
         # Update the Class Variable
         etlInstance.numETLInstances += 1
@@ -63,36 +110,75 @@ class etlInstance:
         :return:
         """
 
+        prefetchExecutor = None
+        featureLayerFuture = None
+        runCompleted = False
+        protocolLower = etlInstance.protocol.lower()
+        prefetchPath = os.path.join(etlInstance.outDir, 'workspace', f'lookupPrefetch_{protocolLower}.json')
+
         try:
             #Configure Logging:
             logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+            # Prefetch - start the AGOL/Portal export and download on a daemon thread (not joined at exit if the run
+            # fails), the local backend steps below run while AGOL prepares the export
+            if etlInstance.prefetch == 'Yes':
+                prefetchExecutor = ThreadPoolExecutor(max_workers=etlInstance.prefetchWorkers,
+                                                      thread_name_prefix='prefetch')
+                if protocolLower in etlInstance.featureLayerProtocols:
+                    featureLayerFuture = dm.generalDMClass.submitDaemon('prefetchExport',
+                                                                        agl.generalArcGIS.processFeatureLayer,
+                                                                        generalArcGIS, etlInstance, dmInstance)
+
+            # Drop staging tables left in the backend by a prior run that did not finish
+            etlInstance.backendSession.sweepStagingTables(etlInstance.inDBBE)
+
+            # Load the lookup tables unchanged since the prior run from the workspace snapshot
+            if etlInstance.lookupSnapshot == 'Yes':
+                snapshotDir = os.path.join(etlInstance.outDir, 'workspace', 'lookupSnapshot')
+                dm.generalDMClass.loadLookupSnapshot(etlInstance.inDBBE, snapshotDir,
+                                                     session=etlInstance.backendSession)
+
+            # Prefetch the lookup/reference tables read by the prior run for the protocol (not in the snapshot)
+            if prefetchExecutor is not None:
+                dm.generalDMClass.prefetchLookups(etlInstance.inDBBE, prefetchPath, prefetchExecutor)
+
+            # Copy the protocol tables read by the joins of the run to the local read mirror
+            mirrorTables = etlInstance.readMirrorTables.get(etlInstance.protocol.lower())
+            if etlInstance.readMirror == 'Yes' and mirrorTables:
+                mirrorPath = os.path.join(etlInstance.outDir, 'workspace', 'readMirror.sqlite')
+                etlInstance.backendSession.openReadMirror(etlInstance.inDBBE, mirrorPath, mirrorTables)
+
+            # Start the opt-in backend unit of work (if defined)
+            etlInstance.backendSession.beginUnitOfWork(etlInstance.unitOfWork)
+
+            # Pull the Feature Layer for the defined return as dataframe(s) in dictionary outDFDic - blocks on the
+            # prefetched export
+            if protocolLower in etlInstance.featureLayerProtocols:
+                if featureLayerFuture is not None:
+                    outDFDic = featureLayerFuture.result()
+                else:
+                    outDFDic = agl.generalArcGIS.processFeatureLayer(generalArcGIS, etlInstance, dmInstance)
+
             # Create the protocol specific ETL instance
             # ETL Routine Snowy Plover PORE
             if etlInstance.protocol.lower() == 'snplpore':
-                # Pull the Feature Layer for the defined return as dataframe(s) in list variable outDFList
-                outDFDic = agl.generalArcGIS.processFeatureLayer(generalArcGIS, etlInstance, dmInstance)
                 outETL = SNPLP.etl_SNPLPORE.process_ETLSNPLPORE(outDFDic, etlInstance, dmInstance, generalArcGIS)
 
             # ETL Routine Salmonids Electrofishing
             elif etlInstance.protocol.lower() == 'salmonids-efish':
-                # Pull the Feature Layer for the defined return as dataframe(s) in list variable outDFList
-                outDFDic = agl.generalArcGIS.processFeatureLayer(generalArcGIS, etlInstance, dmInstance)
                 outETL = SEfish.etl_SalmonidsElectro.process_ETLElectro(outDFDic, etlInstance, dmInstance)
 
             # ETL Routine Salmonids Smolts
             elif etlInstance.protocol.lower() == 'salmonids-smolts':
-                outDFDic = agl.generalArcGIS.processFeatureLayer(generalArcGIS, etlInstance, dmInstance)
                 outETL = SSmolt.etl_SalmonidsSmolts.process_ETLSmolts(outDFDic, etlInstance, dmInstance)
 
             # ETL Routine Pinnipeds Elephant Seal
             elif etlInstance.protocol.lower() == 'pinn-elephant':
-                outDFDic = agl.generalArcGIS.processFeatureLayer(generalArcGIS, etlInstance, dmInstance)
                 outETL = PElephant.etl_PINNElephant.process_PINNElephant(outDFDic, etlInstance, dmInstance,
                                                                          generalArcGIS)
             # ELT Routine Northern Spotted Owl
             elif etlInstance.protocol.lower() == 'nsow':
-                outDFDic = agl.generalArcGIS.processFeatureLayer(generalArcGIS, etlInstance, dmInstance)
                 outETL = nsow.etl_NSOW.process_ETLNSOW(outDFDic, etlInstance, dmInstance, generalArcGIS)
 
             # PCM Plot Locations Manual
@@ -106,9 +192,40 @@ class etlInstance:
                 traceback.print_exc(file=sys.stdout)
                 sys.exit()
 
+            # Protocol routines return a 'Success' string, commit the unit of work only on success
+            etlInstance.backendSession.endUnitOfWork(commit=str(outETL).startswith('Success'))
+
+            # Advance the incremental extraction watermarks only once the extracted features are loaded
+            if etlInstance.extractStore is not None and str(outETL).startswith('Success'):
+                etlInstance.extractStore.commit()
+
+            # Save the lookups read by the run to be prefetched by the next run
+            if etlInstance.prefetch == 'Yes' and str(outETL).startswith('Success'):
+                dm.generalDMClass.saveLookupPrefetch(etlInstance.inDBBE, prefetchPath)
+
+            runCompleted = True
+
         except Exception as e:
 
             logMsg = f'ERROR - An error occurred process_ETLRequest: {e}'
             dm.generalDMClass.messageLogFile(dmInstance, logMsg=logMsg)
             logging.critical(logMsg)
-            traceback.print_exc(file=sys.stdout)
\ No newline at end of file
+            traceback.print_exc(file=sys.stdout)
+
+        finally:
+            # Stop the lookup prefetch pool, prefetches not yet started are cancelled
+            if prefetchExecutor is not None:
+                prefetchExecutor.shutdown(wait=runCompleted, cancel_futures=True)
+
+            # Report (and in maintenance mode create) the missing backend indexes on the join/filter columns of the run
+            if etlInstance.indexAdvisor in ('Report', 'Create'):
+                try:
+                    for logMsg in etlInstance.backendSession.adviseIndexes(
+                            etlInstance.inDBBE, createIndexes=etlInstance.indexAdvisor == 'Create'):
+                        dm.generalDMClass.messageLogFile(dmInstance, logMsg=logMsg)
+                except Exception as e:
+                    logging.warning(f'Index advisor failed: {e}')
+
+            # Close the pooled backend connections and log the connection counts for the run
+            logMsg = etlInstance.backendSession.close()
+            dm.generalDMClass.messageLogFile(dmInstance, logMsg=logMsg)
\ No newline at end of file
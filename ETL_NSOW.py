@@ -60,19 +60,22 @@ class etl_NSOW:
             # Process Species Detections - speciesdetectionrepeat_2.csv
             ############################
 
-            etl_NSOW.process_SpeciesDetections(outDFDic, etlInstance, dmInstance)
+            etlInstance.backendSession.runStage('process_SpeciesDetections', etl_NSOW.process_SpeciesDetections,
+                                                outDFDic, etlInstance, dmInstance)
 
             ############################
             # Process Other Species  - otherrspecies_3.csv
             ############################
 
-            etl_NSOW.process_OtherSpecies(outDFDic, etlInstance, dmInstance)
+            etlInstance.backendSession.runStage('process_OtherSpecies', etl_NSOW.process_OtherSpecies, outDFDic,
+                                                etlInstance, dmInstance)
 
             ####
             # Process tblMouseOffer table - Survey 123 table - mouseofferingrepeat_4
             ####
 
-            etl_NSOW.processMouseOffer(outDFDic, etlInstance, dmInstance)
+            etlInstance.backendSession.runStage('processMouseOffer', etl_NSOW.processMouseOffer, outDFDic, etlInstance,
+                                                dmInstance)
 
             ####
             # Process the Observers Repeat table - Survey 123 table - observersrepeat_1
@@ -80,34 +83,39 @@ class etl_NSOW:
             # with Other Observers that need to be added to the tblEventPersonnel table post ETL processing.
             ####
 
-            etl_NSOW.processObservers(outDFDic, etlInstance, dmInstance, surveyType="MonitoringSurvey")
+            etlInstance.backendSession.runStage('processObservers', etl_NSOW.processObservers, outDFDic, etlInstance,
+                                                dmInstance, surveyType="MonitoringSurvey")
 
             ####
             # Process Inventory Call Response table - Survey 123 table - inventorycallrepeat_5
             # Use ParentGlobalID - to join on the GlobalID in the tblEventSurvey to get the EventSurveyID in tblCallPointResponse
             ####
 
-            etl_NSOW.processInventoryCall(outDFDic, etlInstance, dmInstance)
+            etlInstance.backendSession.runStage('processInventoryCall', etl_NSOW.processInventoryCall, outDFDic,
+                                                etlInstance, dmInstance)
 
             ######
             # Process New Tree Nest  - in the SFAN_NSOW_AGOL_{YearVersion}- table - these should be done prior to the
             # Nest Tree Survey so the new tree is in the database when Nest Surveys are performed
             ######
 
-            etl_NSOW.process_NewTreeNest(outDFDic, etlInstance, dmInstance)
+            etlInstance.backendSession.runStage('process_NewTreeNest', etl_NSOW.process_NewTreeNest, outDFDic,
+                                                etlInstance, dmInstance)
 
             ######
             # Process Nest Survey - in the SFAN_NSOW_AGOL_{YearVersion}- table
             ######
 
-            etl_NSOW.process_NestSurveys(outDFDic, etlInstance, dmInstance)
+            etlInstance.backendSession.runStage('process_NestSurveys', etl_NSOW.process_NestSurveys, outDFDic,
+                                                etlInstance, dmInstance)
 
 
             #####################
             # Process Nest Survey Observations in the 'observersrepeatnestsurvey' table - starting in 2026v1.3
             #####################
 
-            etl_NSOW.processObservers(outDFDic, etlInstance, dmInstance, surveyType="NestSurvey")
+            etlInstance.backendSession.runStage('processObservers', etl_NSOW.processObservers, outDFDic, etlInstance,
+                                                dmInstance, surveyType="NestSurvey")
 
             func_name = inspect.currentframe().f_code.co_name
             logMsg = f"Success ETL_NSOW.py - {func_name}"
@@ -196,7 +204,8 @@ class etl_NSOW:
             # Import the refSite lookup
             inQuery = f"SELECT refSite.ID, refSite.SiteName FROM refSite;"
 
-            outDFrefSite = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+            outDFrefSite = dm.generalDMClass.readLookup(inQuery, "refSite", etlInstance.inDBBE,
+                                                        session=etlInstance.backendSession)
 
             # Define the SiteID via lookup in refSite table - SiteName to ID
             site_lookup = outDFrefSite.set_index('SiteName')['ID']
@@ -259,16 +268,8 @@ class etl_NSOW:
                 sys.exit(1)
 
 
-            # Grab all column names from the dataframe
-            cols = outDFSubset2.columns.tolist()
-
-            # Build the SQL query dynamically
-            insertQuery = (
-                f"INSERT INTO tblEventSurvey ({', '.join(cols)}) "
-                f"VALUES ({', '.join(['?'] * len(cols))})")
-
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-            dm.generalDMClass.appendDataSet(cnxn, outDFSubset2, "tblEvents", insertQuery, dmInstance)
+            writer = etlInstance.backendSession.getTableWriter("tblEventSurvey", etlInstance.inDBBE)
+            writer.append(outDFSubset2, dmInstance)
 
             ##########
             # Function to Populate the tblMonitoringOwlCal
@@ -331,7 +332,7 @@ class etl_NSOW:
         :param etlInstance: ETL processing instance
         :param dmInstance: Data Management instance:
 
-        :return
+        :return: String denoting 'Success', None on failure
         """
 
         try:
@@ -359,9 +360,8 @@ class etl_NSOW:
             outDFSubset['MergedDate'] = iso_date
 
             # Define the EventID via the ParentGlobalID field
-            # Read in the tblEventSurvey table
-            inQuery = f"SELECT tblEventSurvey.* FROM tblEventSurvey;"
-            dfEventSurvey = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+            # GlobalID to ID keys of tblEventSurvey from the run level key resolver
+            dfEventSurvey = etlInstance.backendSession.getKeyResolver("tblEventSurvey", etlInstance.inDBBE).frame()
 
             # Define the EvenetSurveyID via join on the 'GlobalID' and 'ParentGlobalID' fields
             inDFAppend = outDFSubset.merge(
@@ -384,31 +384,18 @@ class etl_NSOW:
 
                 sys.exit(1)
 
-            # Update any 'nan' string or np.nan values to None to consistently handle null values.
-            pd.set_option('mode.copy_on_write', False)
-            inDFAppendFinalClean = inDFAppendFinal.replace([np.nan, 'nan'], None)
-
             ########
             # Append to tblMousingOffer
             ########
-
-            # Grab all column names from the dataframe
-            cols = inDFAppendFinalClean.columns.tolist()
-
-            # Build the SQL query dynamically
-            insertQuery = (
-                f"INSERT INTO tblMousingOffer ({', '.join(cols)}) "
-                f"VALUES ({', '.join(['?'] * len(cols))})")
-
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-            dm.generalDMClass.appendDataSet(cnxn, inDFAppendFinalClean, "tblMousingOffer", insertQuery, dmInstance)
+            writer = etlInstance.backendSession.getTableWriter("tblMousingOffer", etlInstance.inDBBE)
+            writer.append(inDFAppendFinal, dmInstance)
 
             func_name = inspect.currentframe().f_code.co_name
             logMsg = f"Success ETL Survey/Event Form ETL_NSOW.py - {func_name}"
             logging.info(logMsg)
             print(logMsg)
 
-            return
+            return "Success"
 
         except Exception as e:
 
@@ -430,7 +417,7 @@ class etl_NSOW:
         :param dmInstance: Data Management instance
         :param surveyType: Variable defines if processing is for MonitoringSurvey or NestSurvey (
 
-        :return
+        :return: String denoting 'Success', None on failure
 
         Updates: 8/17/2026 - Update logic to handle Monitoring and Nest Survey Observer field schema names.
 
@@ -480,9 +467,9 @@ class etl_NSOW:
             outDFSubset['MergedDate'] = iso_date
 
             # Define the EventID via the ParentGlobalID fields
-            # Read in the tblEventSurvey table
-            inQuery = f"SELECT tblEventSurvey.* FROM tblEventSurvey;"
-            dfEventSurvey = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+            # GlobalID to ID keys of tblEventSurvey from the run level key resolver
+            dfEventSurvey = etlInstance.backendSession.getKeyResolver("tblEventSurvey", etlInstance.inDBBE,
+                                                                      fields=['EventDate']).frame()
 
             # Define the EvenetSurveyID via join on the 'GlobalID' and 'ParentGlobalID' fields
             inDFAppend = outDFSubset.merge(
@@ -559,23 +546,15 @@ class etl_NSOW:
             # Drop the EventDate field
             inDFAppendwEventIDCleaned = inDFAppendwEventID.drop(columns=['EventDate', 'OtherObserver', 'OtherObserverRole', 'GlobalID'])
 
-            # Grab all column names from the dataframe
-            cols = inDFAppendwEventIDCleaned.columns.tolist()
-
-            # Build the SQL query dynamically
-            insertQuery = (
-                f"INSERT INTO tblEventPersonnel ({', '.join(cols)}) "
-                f"VALUES ({', '.join(['?'] * len(cols))})")
-
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-            dm.generalDMClass.appendDataSet(cnxn, inDFAppendwEventIDCleaned, "tblEventPersonnel", insertQuery, dmInstance)
+            writer = etlInstance.backendSession.getTableWriter("tblEventPersonnel", etlInstance.inDBBE)
+            writer.append(inDFAppendwEventIDCleaned, dmInstance)
 
             func_name = inspect.currentframe().f_code.co_name
             logMsg = f"Success ETL Survey/Event Form ETL_NSOW.py - {func_name} - for - {surveyType}"
             logging.info(logMsg)
             print(logMsg)
 
-            return
+            return "Success"
 
         except Exception as e:
 
@@ -598,9 +577,8 @@ class etl_NSOW:
 
         try:
 
-            # Read in the tblEventSurvey table
-            inQuery = f"SELECT tblEventSurvey.* FROM tblEventSurvey;"
-            dfEventSurvey = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+            # GlobalID to ID keys of tblEventSurvey from the run level key resolver
+            dfEventSurvey = etlInstance.backendSession.getKeyResolver("tblEventSurvey", etlInstance.inDBBE).frame()
 
             #Subset to the fieldList
             inDFSubset = inDF[[col for col in fieldList if col in inDF.columns]]
@@ -622,21 +600,8 @@ class etl_NSOW:
             iso_date = now.strftime("%Y-%m-%d")
             inDFAppendFinal['MergedDate'] = iso_date
 
-            # Update any 'nan' string or np.nan values to None to consistently handle null values.
-            pd.set_option('mode.copy_on_write', False)
-            inDFAppendFinal = inDFAppendFinal.replace([np.nan, 'nan'], None)
-
-
-            # Grab all column names from the dataframe
-            cols = inDFAppendFinal.columns.tolist()
-
-            # Build the SQL query dynamically
-            insertQuery = (
-                f"INSERT INTO tblMonitoringOwlCall ({', '.join(cols)}) "
-                f"VALUES ({', '.join(['?'] * len(cols))})")
-
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-            dm.generalDMClass.appendDataSet(cnxn, inDFAppendFinal, "tblMonitoringOwlCall", insertQuery, dmInstance)
+            writer = etlInstance.backendSession.getTableWriter("tblMonitoringOwlCall", etlInstance.inDBBE)
+            writer.append(inDFAppendFinal, dmInstance)
 
             func_name = inspect.currentframe().f_code.co_name
             logMsg = f'Success Method - {func_name}'
@@ -664,9 +629,8 @@ class etl_NSOW:
 
         try:
 
-            # Read in the tblEventSurvey table
-            inQuery = f"SELECT tblEventSurvey.* FROM tblEventSurvey;"
-            dfEventSurvey = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+            # GlobalID to ID keys of tblEventSurvey from the run level key resolver
+            dfEventSurvey = etlInstance.backendSession.getKeyResolver("tblEventSurvey", etlInstance.inDBBE).frame()
 
             #Subset to the fieldList
             inDFSubset = inDF[[col for col in fieldList if col in inDF.columns]]
@@ -694,16 +658,8 @@ class etl_NSOW:
             cols_to_check = [c for c in inDFAppendFinal.columns if c != 'EventSurveyID']
             inDFAppendFinalwData = inDFAppendFinal.dropna(subset=cols_to_check, how='all')
 
-            # Grab all column names from the dataframe
-            cols = inDFAppendFinalwData.columns.tolist()
-
-            # Build the SQL query dynamically
-            insertQuery = (
-                f"INSERT INTO tblWeather ({', '.join(cols)}) "
-                f"VALUES ({', '.join(['?'] * len(cols))})")
-
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-            dm.generalDMClass.appendDataSet(cnxn, inDFAppendFinalwData, "tblWeather", insertQuery, dmInstance)
+            writer = etlInstance.backendSession.getTableWriter("tblWeather", etlInstance.inDBBE)
+            writer.append(inDFAppendFinalwData, dmInstance)
 
             func_name = inspect.currentframe().f_code.co_name
             logMsg = f'Success Method - {func_name}'
@@ -736,9 +692,8 @@ class etl_NSOW:
 
         try:
 
-            # Read in the tblEventSurvey table
-            inQuery = f"SELECT tblEventSurvey.* FROM tblEventSurvey;"
-            dfEventSurvey = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+            # GlobalID to ID keys of tblEventSurvey from the run level key resolver
+            dfEventSurvey = etlInstance.backendSession.getKeyResolver("tblEventSurvey", etlInstance.inDBBE).frame()
 
             #Subset to the fieldList
             inDFSubset = inDF[[col for col in fieldList if col in inDF.columns]]
@@ -775,16 +730,8 @@ class etl_NSOW:
             iso_date = now.strftime("%Y-%m-%d")
             inDFEvidence['MergedDate'] = iso_date
 
-            # Grab all column names from the dataframe
-            cols = inDFEvidence.columns.tolist()
-
-            # Build the SQL query dynamically
-            insertQuery = (
-                f"INSERT INTO tblEvidence ({', '.join(cols)}) "
-                f"VALUES ({', '.join(['?'] * len(cols))})")
-
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-            dm.generalDMClass.appendDataSet(cnxn, inDFEvidence, "tblEvidence", insertQuery, dmInstance)
+            writer = etlInstance.backendSession.getTableWriter("tblEvidence", etlInstance.inDBBE)
+            writer.append(inDFEvidence, dmInstance)
 
             func_name = inspect.currentframe().f_code.co_name
             logMsg = f'Success Method - {func_name}'
@@ -806,7 +753,7 @@ class etl_NSOW:
         :param etlInstance - etl instance
         :param dmInstance: Data Management instance
 
-        :return
+        :return: String denoting 'Success', None on failure
         """
 
         try:
@@ -825,9 +772,8 @@ class etl_NSOW:
                                 'ParentGlobalID']]
 
             # Define the EventID via the ParentGlobalID field
-            # Read in the tblEventSurvey table
-            inQuery = f"SELECT tblEventSurvey.* FROM tblEventSurvey;"
-            dfEventSurvey = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+            # GlobalID to ID keys of tblEventSurvey from the run level key resolver
+            dfEventSurvey = etlInstance.backendSession.getKeyResolver("tblEventSurvey", etlInstance.inDBBE).frame()
 
             # Define the EventSurveyID via join on the 'GlobalID' and 'ParentGlobalID' fields
             inDFAppend = outDFSubset.merge(
@@ -849,27 +795,17 @@ class etl_NSOW:
             iso_date = now.strftime("%Y-%m-%d")
             inDFAppendFinalwData['MergedDate'] = iso_date
 
-            # Grab all column names from the dataframe
-            cols = inDFAppendFinalwData.columns.tolist()
 
-            # Update any 'nan' string or np.nan values to None to consistently handle null values.
-            pd.set_option('mode.copy_on_write', False)
-            inDFAppendFinalwData = inDFAppendFinalwData.replace([np.nan, 'nan', ''], None)
-
-            # Build the SQL query dynamically
-            insertQuery = (
-                f"INSERT INTO tblCallPointResponse ({', '.join(cols)}) "
-                f"VALUES ({', '.join(['?'] * len(cols))})")
-
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-            dm.generalDMClass.appendDataSet(cnxn, inDFAppendFinalwData, "tblCallPointResponse",
-                                            insertQuery, dmInstance)
+            writer = etlInstance.backendSession.getTableWriter("tblCallPointResponse", etlInstance.inDBBE)
+            writer.append(inDFAppendFinalwData, dmInstance, nullStrings=('nan', ''))
 
             func_name = inspect.currentframe().f_code.co_name
             logMsg = f'Success Method - {func_name}'
             logging.info(logMsg, exc_info=True)
             print(logMsg)
 
+            return "Success"
+
         except Exception as e:
 
             func_name = inspect.currentframe().f_code.co_name
@@ -891,9 +827,8 @@ class etl_NSOW:
         """
 
         try:
-            # Read in the tblEventSurvey table
-            inQuery = f"SELECT tblEventSurvey.* FROM tblEventSurvey;"
-            dfEventSurvey = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+            # GlobalID to ID keys of tblEventSurvey from the run level key resolver
+            dfEventSurvey = etlInstance.backendSession.getKeyResolver("tblEventSurvey", etlInstance.inDBBE).frame()
 
             # Subset to the fieldList
             inDFSubset = inDF[[col for col in fieldList if col in inDF.columns]]
@@ -917,21 +852,9 @@ class etl_NSOW:
             iso_date = now.strftime("%Y-%m-%d")
             inDFAppendFinalwData['MergedDate'] = iso_date
 
-            # Grab all column names from the dataframe
-            cols = inDFAppendFinalwData.columns.tolist()
 
-            # Update any 'nan' string or np.nan values to None to consistently handle null values.
-            pd.set_option('mode.copy_on_write', False)
-            inDFAppendFinalwData = inDFAppendFinalwData.replace([np.nan, 'nan', ''], None)
-
-            # Build the SQL query dynamically
-            insertQuery = (
-                f"INSERT INTO tblStatusIndicators ({', '.join(cols)}) "
-                f"VALUES ({', '.join(['?'] * len(cols))})")
-
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-            dm.generalDMClass.appendDataSet(cnxn, inDFAppendFinalwData, "tblStatusIndicators",
-                                            insertQuery, dmInstance)
+            writer = etlInstance.backendSession.getTableWriter("tblStatusIndicators", etlInstance.inDBBE)
+            writer.append(inDFAppendFinalwData, dmInstance, nullStrings=('nan', ''))
 
             func_name = inspect.currentframe().f_code.co_name
             logMsg = f'Success Method - {func_name}'
@@ -955,7 +878,7 @@ class etl_NSOW:
         :param etlInstance - etl instance
         :param dmInstance: Data Management instance
 
-        :return
+        :return: String denoting 'Success', None on failure
         """
 
         try:
@@ -1017,7 +940,8 @@ class etl_NSOW:
             # Define the SiteID via the ParentGlobalID field
             # Read in the tblEventSurvey table
             inQuery = f"SELECT refSite.* FROM refSite;"
-            dfRefSite = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+            dfRefSite = dm.generalDMClass.readLookup(inQuery, "refSite", etlInstance.inDBBE,
+                                                     session=etlInstance.backendSession)
 
             # Define the SiteID via join on the 'SiteName'fields
             outDFSubsetwSiteID = outDFSubset.merge(
@@ -1073,17 +997,9 @@ class etl_NSOW:
             outDFNestTreeToAppend = outDFNestTreeToAppend.drop(columns={'IsActive'})
 
 
-            # Grab all column names from the dataframe
-            cols = outDFNestTreeToAppend.columns.tolist()
-
-            # Build the SQL query dynamically
-            insertQuery = (
-                f"INSERT INTO refNestTree ({', '.join(cols)}) "
-                f"VALUES ({', '.join(['?'] * len(cols))})")
-
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-            dm.generalDMClass.appendDataSet(cnxn, outDFNestTreeToAppend, "refNestTree",
-                                            insertQuery, dmInstance)
+            # Append via the schema driven table writer returning the GlobalID to ID keys of the new nest trees
+            writer = etlInstance.backendSession.getTableWriter("refNestTree", etlInstance.inDBBE)
+            dfNestTreeKeys = writer.append(outDFNestTreeToAppend, dmInstance, returnKeys=('GlobalID', 'ID'))
 
             ##########
             # Process the refNestTreeDetails attributes
@@ -1094,7 +1010,8 @@ class etl_NSOW:
             refNestTreeDetailsList.append('GlobalID')
             inDFNestTreeDetails = outDFSubsetwSiteIDCleaned[refNestTreeDetailsList]
 
-            etl_NSOW.process_NestTreeDetails(inDFNestTreeDetails, etlInstance, dmInstance)
+            if etl_NSOW.process_NestTreeDetails(inDFNestTreeDetails, etlInstance, dmInstance, dfNestTreeKeys) is None:
+                raise RuntimeError('process_NestTreeDetails failed')
 
             logMsg = f'Completed New Nest Tree - and Nest Tree Details processing'
             print(logMsg)
@@ -1105,7 +1022,7 @@ class etl_NSOW:
             logging.info(logMsg, exc_info=True)
             print(logMsg)
 
-            return
+            return "Success"
 
         except Exception as e:
 
@@ -1114,15 +1031,17 @@ class etl_NSOW:
             logging.critical(logMsg, exc_info=True)
 
 
-    def process_NestTreeDetails(inDF, etlInstance, dmInstance):
+    def process_NestTreeDetails(inDF, etlInstance, dmInstance, dfNestTreeKeys=None):
         """
         Routine to for ETL for refNestTreeDetails - these are applicable when it is a New Nest Tree
 
         :param inDF - Dataframe Nest Tree Details to be processed
         :param etlInstance - etl instance
         :param dmInstance: Data Management instance
+        :param dfNestTreeKeys: Optional GlobalID to ID keys of the inserted refNestTree records, if not passed the keys
+        are defined via the run level key resolver
 
-        :return
+        :return: String denoting 'Success', None on failure
         """
         try:
 
@@ -1133,10 +1052,11 @@ class etl_NSOW:
             # Define the NestTreeID via lookup on the refNestTree table
             ########
 
-            # Define the EventID via the ParentGlobalID field
-            # Read in the tblEventSurvey table
-            inQuery = f"SELECT refNestTree.* FROM refNestTree;"
-            dfrefNestTree = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+            # GlobalID to ID keys of the inserted refNestTree records, else from the run level key resolver
+            if dfNestTreeKeys is not None:
+                dfrefNestTree = dfNestTreeKeys
+            else:
+                dfrefNestTree = etlInstance.backendSession.getKeyResolver("refNestTree", etlInstance.inDBBE).frame()
 
             # Define the SiteID via join on the 'SiteName'fields
             outDFwNestTreeID = inDF.merge(
@@ -1150,27 +1070,15 @@ class etl_NSOW:
                 columns=['GlobalID']).rename(
                 columns={'ID': 'NestTreeID'})
 
-            # Update any 'nan' string or np.nan values to None to consistently handle null values.
-            pd.set_option('mode.copy_on_write', False)
-            outDFwNestTreeIDCleaned = outDFwNestTreeID.replace([np.nan, 'nan', ''], None)
-
-            # Grab all column names from the dataframe
-            cols = outDFwNestTreeIDCleaned.columns.tolist()
-
-            # Build the SQL query dynamically
-            insertQuery = (
-                f"INSERT INTO refNestTreeDetails ({', '.join(cols)}) "
-                f"VALUES ({', '.join(['?'] * len(cols))})")
-
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-            dm.generalDMClass.appendDataSet(cnxn, outDFwNestTreeIDCleaned, "refNestTreeDetails",
-                                            insertQuery, dmInstance)
+            writer = etlInstance.backendSession.getTableWriter("refNestTreeDetails", etlInstance.inDBBE)
+            writer.append(outDFwNestTreeID, dmInstance, nullStrings=('nan', ''))
 
             func_name = inspect.currentframe().f_code.co_name
             logMsg = f'Success Method - {func_name}'
             logging.info(logMsg, exc_info=True)
             print(logMsg)
 
+            return "Success"
 
         except Exception as e:
 
@@ -1191,7 +1099,7 @@ class etl_NSOW:
         :param etlInstance: ETL processing instance
         :param dmInstance: Data Management instance
 
-        :return
+        :return: String denoting 'Success', None on failure
         """
         try:
 
@@ -1245,25 +1153,29 @@ class etl_NSOW:
             # Process tblNestTreeSurvey
             #############################
 
-            etl_NSOW.process_NestTreeSurveyAppend(outDFSubset, etlInstance, dmInstance)
+            if etl_NSOW.process_NestTreeSurveyAppend(outDFSubset, etlInstance, dmInstance) is None:
+                raise RuntimeError('process_NestTreeSurveyAppend failed')
 
             #############################
             # Process tblHabitatFeatures
             #############################
 
-            etl_NSOW.process_NestTreeHabitatFeatures(outDFSubset, etlInstance, dmInstance)
+            if etl_NSOW.process_NestTreeHabitatFeatures(outDFSubset, etlInstance, dmInstance) is None:
+                raise RuntimeError('process_NestTreeHabitatFeatures failed')
 
             #############################
             # Process tblNestTreeFeatures
             #############################
 
-            etl_NSOW.process_NestTreeFeatures(outDFSubset, etlInstance, dmInstance)
+            if etl_NSOW.process_NestTreeFeatures(outDFSubset, etlInstance, dmInstance) is None:
+                raise RuntimeError('process_NestTreeFeatures failed')
 
             #############################
             # Process tblOverStory and tblUnderstory
             #############################
 
-            etl_NSOW.process_OverUnderStory(outDFSubset, etlInstance, dmInstance)
+            if etl_NSOW.process_OverUnderStory(outDFSubset, etlInstance, dmInstance) is None:
+                raise RuntimeError('process_OverUnderStory failed')
 
             logMsg = (f'Successfully Processed all Methods for Nest Tree Surveys - tblNestTreeSurvey, tblHabitatFeatures,\n'
                       f'tblNestTreeFeatures, tblOverStory and tblUnderstory')
@@ -1275,6 +1187,7 @@ class etl_NSOW:
             logging.info(logMsg, exc_info=True)
             print(logMsg)
 
+            return "Success"
 
         except Exception as e:
 
@@ -1292,7 +1205,7 @@ class etl_NSOW:
         :param etlInstance - etl instance
         :param dmInstance: Data Management instance
 
-        :return
+        :return: String denoting 'Success', None on failure
         """
 
         try:
@@ -1309,9 +1222,8 @@ class etl_NSOW:
             ########
 
             # Define the EventID via the ParentGlobalID field
-            # Read in the tblEventSurvey table
-            inQuery = f"SELECT refNestTree.* FROM refNestTree;"
-            dfrefNestTree = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+            # GlobalID to ID keys of refNestTree from the run level key resolver
+            dfrefNestTree = etlInstance.backendSession.getKeyResolver("refNestTree", etlInstance.inDBBE).frame()
 
             # Define the NestTreeID via join on the 'SiteName' fields
             outDFwNestTreeID = dfToAppend.merge(
@@ -1337,23 +1249,16 @@ class etl_NSOW:
             outDFwNestTreeIDToAppend = outDFwNestTreeIDCleaned.drop(
                 columns={'NestTreeIDExisting', 'NestTreeIDNew', 'NestTreeNameNew'})
 
-            # Grab all column names from the dataframe
-            cols = outDFwNestTreeIDToAppend.columns.tolist()
-
-            # Build the SQL query dynamically
-            insertQuery = (
-                f"INSERT INTO tblNestTreeSurvey ({', '.join(cols)}) "
-                f"VALUES ({', '.join(['?'] * len(cols))})")
-
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-            dm.generalDMClass.appendDataSet(cnxn, outDFwNestTreeIDToAppend, "tblNestTreeSurvey",
-                                            insertQuery, dmInstance)
+            writer = etlInstance.backendSession.getTableWriter("tblNestTreeSurvey", etlInstance.inDBBE)
+            writer.append(outDFwNestTreeIDToAppend, dmInstance)
 
             func_name = inspect.currentframe().f_code.co_name
             logMsg = f'Success Method - {func_name}'
             logging.info(logMsg, exc_info=True)
             print(logMsg)
 
+            return "Success"
+
         except Exception as e:
 
             func_name = inspect.currentframe().f_code.co_name
@@ -1369,7 +1274,7 @@ class etl_NSOW:
         :param etlInstance - etl instance
         :param dmInstance: Data Management instance
 
-        :return
+        :return: String denoting 'Success', None on failure
         """
 
         try:
@@ -1395,9 +1300,9 @@ class etl_NSOW:
             ########
 
             # Define the EventID via the ParentGlobalID field
-            # Read in the tblEventSurvey table
-            inQuery = f"SELECT tblNestTreeSurvey.* FROM tblNestTreeSurvey;"
-            dfNestTreeSurvey = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+            # GlobalID to ID keys of tblNestTreeSurvey from the run level key resolver
+            dfNestTreeSurvey = etlInstance.backendSession.getKeyResolver("tblNestTreeSurvey",
+                                                                         etlInstance.inDBBE).frame()
 
             # Define the NestTreeID via join on the 'SiteName' fields
             outDFwNestTreeSurveyID = dfToAppend.merge(
@@ -1412,22 +1317,8 @@ class etl_NSOW:
                 columns={'ID': 'NestTreeSurveyID'})
 
 
-            # Update any 'nan' string or np.nan values to None to consistently handle null values.
-            pd.set_option('mode.copy_on_write', False)
-            outDFwNestTreeSurveyIDCleanded = outDFwNestTreeSurveyID.replace([np.nan, 'nan', ''], None)
-
-
-            # Grab all column names from the dataframe
-            cols = outDFwNestTreeSurveyIDCleanded.columns.tolist()
-
-            # Build the SQL query dynamically
-            insertQuery = (
-                f"INSERT INTO tblHabitatFeatures ({', '.join(cols)}) "
-                f"VALUES ({', '.join(['?'] * len(cols))})")
-
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-            dm.generalDMClass.appendDataSet(cnxn, outDFwNestTreeSurveyIDCleanded, "tblHabitatFeatures",
-                                            insertQuery, dmInstance)
+            writer = etlInstance.backendSession.getTableWriter("tblHabitatFeatures", etlInstance.inDBBE)
+            writer.append(outDFwNestTreeSurveyID, dmInstance, nullStrings=('nan', ''))
 
 
             func_name = inspect.currentframe().f_code.co_name
@@ -1435,6 +1326,7 @@ class etl_NSOW:
             logging.info(logMsg, exc_info=True)
             print(logMsg)
 
+            return "Success"
 
         except Exception as e:
 
@@ -1450,7 +1342,7 @@ class etl_NSOW:
         :param etlInstance - etl instance
         :param dmInstance: Data Management instance
 
-        :return
+        :return: String denoting 'Success', None on failure
         """
 
         try:
@@ -1474,9 +1366,9 @@ class etl_NSOW:
             ########
 
             # Define the EventID via the ParentGlobalID field
-            # Read in the tblEventSurvey table
-            inQuery = f"SELECT tblNestTreeSurvey.* FROM tblNestTreeSurvey;"
-            dfNestTreeSurvey = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+            # GlobalID to ID keys of tblNestTreeSurvey from the run level key resolver
+            dfNestTreeSurvey = etlInstance.backendSession.getKeyResolver("tblNestTreeSurvey",
+                                                                         etlInstance.inDBBE).frame()
 
             # Define the NestTreeID via join on the 'SiteName' fields
             outDFwNestTreeSurveyID = dfToAppend.merge(
@@ -1490,29 +1382,15 @@ class etl_NSOW:
                 columns=['GlobalID']).rename(
                 columns={'ID': 'NestTreeSurveyID'})
 
-            # Update any 'nan' string or np.nan values to None to consistently handle null values.
-            pd.set_option('mode.copy_on_write', False)
-            outDFwNestTreeSurveyIDCleanded = outDFwNestTreeSurveyID.replace([np.nan, 'nan', ''], None)
-
-
-            # Grab all column names from the dataframe
-            cols = outDFwNestTreeSurveyIDCleanded.columns.tolist()
-
-
-            # Build the SQL query dynamically
-            insertQuery = (
-                f"INSERT INTO tblNestTreeFeatures ({', '.join(cols)}) "
-                f"VALUES ({', '.join(['?'] * len(cols))})")
-
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-            dm.generalDMClass.appendDataSet(cnxn, outDFwNestTreeSurveyIDCleanded, "tblNestTreeFeatures",
-                                            insertQuery, dmInstance)
+            writer = etlInstance.backendSession.getTableWriter("tblNestTreeFeatures", etlInstance.inDBBE)
+            writer.append(outDFwNestTreeSurveyID, dmInstance, nullStrings=('nan', ''))
 
             func_name = inspect.currentframe().f_code.co_name
             logMsg = f'Success Method - {func_name}'
             logging.info(logMsg, exc_info=True)
             print(logMsg)
 
+            return "Success"
 
         except Exception as e:
 
@@ -1530,7 +1408,7 @@ class etl_NSOW:
         :param etlInstance - etl instance
         :param dmInstance: Data Management instance
 
-        :return
+        :return: String denoting 'Success', None on failure
         """
 
         try:
@@ -1550,9 +1428,9 @@ class etl_NSOW:
             ########
 
             # Define the EventID via the ParentGlobalID field
-            # Read in the tblEventSurvey table
-            inQuery = f"SELECT tblNestTreeSurvey.* FROM tblNestTreeSurvey;"
-            dfNestTreeSurvey = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+            # GlobalID to ID keys of tblNestTreeSurvey from the run level key resolver
+            dfNestTreeSurvey = etlInstance.backendSession.getKeyResolver("tblNestTreeSurvey",
+                                                                         etlInstance.inDBBE).frame()
 
             # Define the NestTreeID via join on the 'SiteName' fields
             outDFwNestTreeSurveyID = dfToAppend.merge(
@@ -1592,41 +1470,14 @@ class etl_NSOW:
             dfUnderStory = dfUnderStory.explode('UnderstoryID').reset_index(drop=True)
             dfUnderStoryFinal = dfUnderStory[dfUnderStory['UnderstoryID'].notna() & (dfUnderStory['UnderstoryID'] != '')]
 
-            # Update any 'nan' string or np.nan values to None to consistently handle null values.
-            pd.set_option('mode.copy_on_write', False)
-            dfOverStoryFinalCleaned = dfOverStoryFinal.replace([np.nan, 'nan', ''], None)
-
-            # Update any 'nan' string or np.nan values to None to consistently handle null values.
-            pd.set_option('mode.copy_on_write', False)
-            dfUnderStoryFinalCleaned = dfUnderStoryFinal.replace([np.nan, 'nan', ''], None)
-
-
             ### Append Understory
-            # Grab all column names from the dataframe
-            cols = dfUnderStoryFinalCleaned.columns.tolist()
-
-            # Build the SQL query dynamically
-            insertQuery = (
-                f"INSERT INTO tblUnderstoryVegetation ({', '.join(cols)}) "
-                f"VALUES ({', '.join(['?'] * len(cols))})")
-
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-            dm.generalDMClass.appendDataSet(cnxn, dfUnderStoryFinalCleaned, "tblUnderstoryVegetation",
-                                            insertQuery, dmInstance)
+            writer = etlInstance.backendSession.getTableWriter("tblUnderstoryVegetation", etlInstance.inDBBE)
+            writer.append(dfUnderStoryFinal, dmInstance, nullStrings=('nan', ''))
 
 
             #### Append Overstory
-            # Grab all column names from the dataframe
-            cols = dfOverStoryFinalCleaned.columns.tolist()
-
-            # Build the SQL query dynamically
-            insertQuery = (
-                f"INSERT INTO tblOverstoryVegetation ({', '.join(cols)}) "
-                f"VALUES ({', '.join(['?'] * len(cols))})")
-
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-            dm.generalDMClass.appendDataSet(cnxn, dfOverStoryFinalCleaned, "tblOverstoryVegetation",
-                                            insertQuery, dmInstance)
+            writer = etlInstance.backendSession.getTableWriter("tblOverstoryVegetation", etlInstance.inDBBE)
+            writer.append(dfOverStoryFinal, dmInstance, nullStrings=('nan', ''))
 
 
             func_name = inspect.currentframe().f_code.co_name
@@ -1634,6 +1485,7 @@ class etl_NSOW:
             logging.info(logMsg, exc_info=True)
             print(logMsg)
 
+            return "Success"
 
         except Exception as e:
 
@@ -1650,7 +1502,7 @@ class etl_NSOW:
         :param etlInstance - etl instance
         :param dmInstance: Data Management instance
 
-        :return
+        :return: String denoting 'Success', None on failure
         """
 
         try:
@@ -1694,9 +1546,8 @@ class etl_NSOW:
             ########
 
             # Define the SiteID via the ParentGlobalID field
-            # Read in the tblEventSurvey table
-            inQuery = f"SELECT tblEventSurvey.* FROM tblEventSurvey;"
-            dfEventSurvey = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+            # GlobalID to ID keys of tblEventSurvey from the run level key resolver
+            dfEventSurvey = etlInstance.backendSession.getKeyResolver("tblEventSurvey", etlInstance.inDBBE).frame()
 
             # Define EventID
             outDFSubsetwEventID = outDFSubset.merge(
@@ -1738,23 +1589,15 @@ class etl_NSOW:
             outDFSubsetwCoordsToAppend = outDFSubsetwCoords[outDFSubsetwCoords['EventSurveyID'].notna()]
 
             ### Append Species Detection Records
-            # Grab all column names from the dataframe
-            cols = outDFSubsetwCoordsToAppend.columns.tolist()
-
-            # Build the SQL query dynamically
-            insertQuery = (
-                f"INSERT INTO tblSpeciesDetection ({', '.join(cols)}) "
-                f"VALUES ({', '.join(['?'] * len(cols))})")
-
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-            dm.generalDMClass.appendDataSet(cnxn, outDFSubsetwCoordsToAppend, "tblSpeciesDetection",
-                                            insertQuery, dmInstance)
+            writer = etlInstance.backendSession.getTableWriter("tblSpeciesDetection", etlInstance.inDBBE)
+            writer.append(outDFSubsetwCoordsToAppend, dmInstance)
 
             func_name = inspect.currentframe().f_code.co_name
             logMsg = f'Success Method - {func_name}'
             logging.info(logMsg, exc_info=True)
             print(logMsg)
 
+            return "Success"
 
         except Exception as e:
 
@@ -1771,7 +1614,7 @@ class etl_NSOW:
         :param etlInstance - etl instance
         :param dmInstance: Data Management instance
 
-        :return
+        :return: String denoting 'Success', None on failure
         """
 
         try:
@@ -1793,9 +1636,8 @@ class etl_NSOW:
             ########
 
             # Define the EventID via the ParentGlobalID field
-            # Read in the tblEventSurvey table
-            inQuery = f"SELECT tblEventSurvey.* FROM tblEventSurvey;"
-            dfEventSurvey = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+            # GlobalID to ID keys of tblEventSurvey from the run level key resolver
+            dfEventSurvey = etlInstance.backendSession.getKeyResolver("tblEventSurvey", etlInstance.inDBBE).frame()
 
             # Define the NestTreeID via join on the 'SiteName' fields
             outOtherSpeciesToAppend = dfToAppend.merge(
@@ -1809,26 +1651,15 @@ class etl_NSOW:
                 columns=['GlobalID', 'ParentGlobalID']).rename(
                 columns={'ID': 'EventSurveyID'})
 
-            # Update any 'nan' string or np.nan values to None to consistently handle null values.
-            pd.set_option('mode.copy_on_write', False)
-            outOtherSpeciesToAppendCleaned = outOtherSpeciesToAppend.replace([np.nan, 'nan', ''], None)
-
-            # Grab all column names from the dataframe
-            cols = outOtherSpeciesToAppendCleaned.columns.tolist()
-
-            # Build the SQL query dynamically
-            insertQuery = (f"INSERT INTO tblOtherSpeciesPresent ({', '.join(cols)}) "
-                f"VALUES ({', '.join(['?'] * len(cols))})")
-
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-            dm.generalDMClass.appendDataSet(cnxn, outOtherSpeciesToAppendCleaned, "tblOtherSpeciesPresent",
-                                            insertQuery, dmInstance)
+            writer = etlInstance.backendSession.getTableWriter("tblOtherSpeciesPresent", etlInstance.inDBBE)
+            writer.append(outOtherSpeciesToAppend, dmInstance, nullStrings=('nan', ''))
 
             func_name = inspect.currentframe().f_code.co_name
             logMsg = f'Success Method - {func_name}'
             logging.info(logMsg, exc_info=True)
             print(logMsg)
 
+            return "Success"
 
         except Exception as e:
 
@@ -67,7 +67,7 @@ class etl_PCMLocations:
             # Import the 'qrpt_PlotLocationsManual' summary query routine to DataFrame
             inQuery = f'SELECT * FROM {etlPCMInstance.QueryToSummarize};'
             # PUll Summary
-            outDFPCM = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBFE)
+            outDFPCM = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBFE, session=etlInstance.backendSession)
 
             # Create the LocationManual and LocationPark Data Frame Subsets
             locFieldList = ['LocationID', 'LocName', 'UnitCode', 'VegCode', 'VegDescription',
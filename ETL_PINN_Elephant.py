@@ -66,7 +66,9 @@ class etl_PINNElephant:
             ######
             # Process Survey Metadata Form - tblEvents
             ######
-            outFun = etl_PINNElephant.process_SurveyMetadata(outFCDicSub, etlInstance, dmInstance)
+            outFun = etlInstance.backendSession.runStage('process_SurveyMetadata',
+                                                         etl_PINNElephant.process_SurveyMetadata, outFCDicSub,
+                                                         etlInstance, dmInstance)
 
             outDFEvents = outFun[0]
             outDFElephantEvents = outFun[1]
@@ -74,12 +76,14 @@ class etl_PINNElephant:
             ######
             # Process Counts Form - tblSealCount and tblPhocaSealCount-(RedFur and Shark Bite)
             ######
-            outDFCounts = etl_PINNElephant.process_Counts(outFCDicSub, outDFEvents, etlInstance, dmInstance)
+            outDFCounts = etlInstance.backendSession.runStage('process_Counts', etl_PINNElephant.process_Counts,
+                                                              outFCDicSub, outDFEvents, etlInstance, dmInstance)
 
             ######
             # Process Resights Form - Create Resight Events and Resight Records
             ######
-            outFun = etl_PINNElephant.process_Resights(outFCDicSub, outDFEvents, etlInstance, dmInstance)
+            outFun = etlInstance.backendSession.runStage('process_Resights', etl_PINNElephant.process_Resights,
+                                                         outFCDicSub, outDFEvents, etlInstance, dmInstance)
 
             outDFResightEvents = outFun[0]
             outDFResightRec = outFun[1]
@@ -87,19 +91,24 @@ class etl_PINNElephant:
             ######
             # Process Observations Form
             ######
-            outDFDisturbance = etl_PINNElephant.process_Disturbance(outFCDicSub, outDFEvents, etlInstance, dmInstance)
+            outDFDisturbance = etlInstance.backendSession.runStage('process_Disturbance',
+                                                                   etl_PINNElephant.process_Disturbance, outFCDicSub,
+                                                                   outDFEvents, etlInstance, dmInstance)
 
             ######
             # Consolidate Events collected on multiple tablets
             ######
-            outDFEventsConsolidated = etl_PINNElephant.process_MultipleTabletEvents(outDFEvents, outDFElephantEvents,
-                                                                                    outDFResightEvents, etlInstance,
-                                                                                    dmInstance)
+            outDFEventsConsolidated = etlInstance.backendSession.runStage('process_MultipleTabletEvents',
+                                                                          etl_PINNElephant.process_MultipleTabletEvents,
+                                                                          outDFEvents, outDFElephantEvents,
+                                                                          outDFResightEvents, etlInstance, dmInstance)
 
             ########
             # Process the Images in the Resight Form - requires direct hit of the ArcGIS API
             ########
-            outFun = etl_PINNElephant.process_ResightPhotos(outDFResightRec, etlInstance, dmInstance, generalArcGIS)
+            outFun = etlInstance.backendSession.runStage('process_ResightPhotos',
+                                                         etl_PINNElephant.process_ResightPhotos, outDFResightRec,
+                                                         etlInstance, dmInstance, generalArcGIS)
 
             logMsg = f"Success ETL_PINN_Elephant.py - process_PINNElephant."
             dm.generalDMClass.messageLogFile(dmInstance, logMsg=logMsg)
@@ -239,8 +248,11 @@ class etl_PINNElephant:
                            f'DataProcessingLevelUser, Project, ProtocolID) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, '
                            f'?)')
 
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-            dm.generalDMClass.appendDataSet(cnxn, outDFSurveyAppend, "tblEvents", insertQuery, dmInstance)
+            # Append returning the GlobalID, ProjectCode to EventID keys of the inserted events
+            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
+            outDFEventKeys = dm.generalDMClass.appendDataSet(cnxn, outDFSurveyAppend, "tblEvents", insertQuery,
+                                                             dmInstance, returnKeys=('GlobalID', 'EventID',
+                                                                                     'ProjectCode'))
 
             print("Successfully imported initial Events to tblEvents")
 
@@ -266,9 +278,10 @@ class etl_PINNElephant:
                            f'DataProcessingLevelUser, Project, ProtocolID) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, '
                            f'?)')
 
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-            dm.generalDMClass.appendDataSet(cnxn, outDFSurveyResight2ndAppend, "tblEvents", insertQuery,
-                                            dmInstance)
+            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
+            outDFEventKeys2nd = dm.generalDMClass.appendDataSet(cnxn, outDFSurveyResight2ndAppend, "tblEvents",
+                                                                insertQuery, dmInstance,
+                                                                returnKeys=('GlobalID', 'EventID', 'ProjectCode'))
 
             print("Successfully imported 2nd set of events for concurrent 'E_Seal' and 'Resight_Events', these are "
                   "Seal_Resight events.")
@@ -284,13 +297,8 @@ class etl_PINNElephant:
             # Lookup the EventID field via the GlobalID field
             # outContactsDF.insert(0, "EventID", None)
 
-            # Import Event Table to define the EventID via the GlobalID
-            inQuery = (f"SELECT tblEvents.EventID, tblEvents.GlobalID, tblEvents.ProjectCode FROM tblEvents WHERE"
-                       f" ((Not (tblEvents.GlobalID)"
-                       f" Is Null));")
-
-            # Import Events
-            outDFEventsLU = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+            # GlobalID, ProjectCode to EventID keys of the events inserted above
+            outDFEventsLU = pd.concat([outDFEventKeys, outDFEventKeys2nd], ignore_index=True)
 
             # Lookup the EventID via the Global ID field
             dfObsEvents_wEventID = pd.merge(
@@ -306,7 +314,7 @@ class etl_PINNElephant:
 
             insertQuery = f'INSERT INTO tblEventObservers (EventID, ObserverID, CreatedDate) VALUES (?, ?, ?)'
 
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
             # Append the Contacts to the tblEventObserers table
             dm.generalDMClass.appendDataSet(cnxn, dfObsEvents_wEventID, "tblEventObservers", insertQuery,
                                             dmInstance)
@@ -368,7 +376,8 @@ class etl_PINNElephant:
             inQuery = f"SELECT tluDevices.* FROM tluDevices;"
 
             # Import Devices Table
-            outDFDevices = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+            outDFDevices = dm.generalDMClass.readLookup(inQuery, "tluDevices", etlInstance.inDBBE,
+                                                        session=etlInstance.backendSession)
 
             # Lookup the CollectionDeviceID via the Global ID field
             dfElephantEvents_append2 = pd.merge(
@@ -398,7 +407,8 @@ class etl_PINNElephant:
             uniqueSeasonsDF = pd.DataFrame(dfElephantEvents_append['Season'].unique(), columns=['Season'])
             uniqueSeasonsDF.insert(0, "SeasonToDefine", None)
 
-            outDFSeasons = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+            outDFSeasons = dm.generalDMClass.readLookup(inQuery, "tluESealSeasons", etlInstance.inDBBE,
+                                                        session=etlInstance.backendSession)
 
             # Lookup the Season
             dfSeasonsDefined = pd.merge(
@@ -444,7 +454,7 @@ class etl_PINNElephant:
                            f'RegionalCountCode, Comments, CreatedDate, EventID, CollectionDeviceID) '
                            f'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)')
 
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
             # Append the Contacts to the tblEventObserers table
             dm.generalDMClass.appendDataSet(cnxn, dfElephantEvents_append3, "tblElephantEvents", insertQuery,
                                             dmInstance)
@@ -709,7 +719,7 @@ class etl_PINNElephant:
             insertQuery = (f'INSERT INTO tblSealCount (CreatedDate, EventID, ObservationTime, LocationID, '
                            f'MatureCode, Enumeration, QCNotes, Qualifier, QCFlag) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)')
 
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
             dm.generalDMClass.appendDataSet(cnxn, combinedAllCountsDF, "tblSealCount", insertQuery, dmInstance)
 
             logMsg = f"Successfully imported Count Data to tblSealCount"
@@ -1053,8 +1063,9 @@ class etl_PINNElephant:
             inQuery = (f"SELECT tblResightEvents.Season, tblResights.ResightID, tblResights.GlobalID FROM tblResights INNER JOIN"
                        f" tblResightEvents ON tblResights.EventID = tblResightEvents.EventID;")
 
-            # Import Resights
-            resightsDF = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+            # Import Resights - from the read mirror when enabled
+            resightsDF = dm.generalDMClass.readMirrored(inQuery, ['tblResights', 'tblResightEvents'],
+                                                        etlInstance.inDBBE, session=etlInstance.backendSession)
 
             # This will get the Resight Records processed with the ResightID
             resightDF2 = pd.merge(
@@ -1106,20 +1117,11 @@ class etl_PINNElephant:
             outPhotosDFwAtt.drop(fieldListDrop, axis=1, inplace=True)
 
             # Append the records that had photo attachments
-            # Grab all column names from the dataframe
-            cols = outPhotosDFwAtt.columns.tolist()
-
             recCount = outPhotosDFwAtt.shape[0]
 
             # Append to table
-            # Build the SQL query dynamically
-            insertQuery = (
-               f"INSERT INTO tblResightPhotos ({', '.join(cols)}) "
-               f"VALUES ({', '.join(['?'] * len(cols))})")
-
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-            dm.generalDMClass.appendDataSet(cnxn, outPhotosDFwAtt, "tblResightPhotos", insertQuery,
-                                           dmInstance)
+            writer = etlInstance.backendSession.getTableWriter("tblResightPhotos", etlInstance.inDBBE)
+            writer.append(outPhotosDFwAtt, dmInstance)
 
             logMsg = f"Success process_ResightPhotos - appended - {recCount} - records to the tblResightPhotos table."
             dm.generalDMClass.messageLogFile(dmInstance, logMsg=logMsg)
@@ -1165,7 +1167,7 @@ def processRedFurShark(inDF, etlInstance, dmInstance):
         insertQuery = (f'INSERT INTO tblPhocaSealCount (EventID, LocationID, ObservationTime, RedFurPhoca, '
                        f'SharkBitePhoca, CreatedDate) VALUES (?, ?, ?, ?, ?, ?)')
 
-        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
         dm.generalDMClass.appendDataSet(cnxn, dfRedFurSharkNA, "tblPhocaSealCount", insertQuery, dmInstance)
 
         logMsg = f'Success processRedFurShark ETL Routine'
@@ -1254,7 +1256,8 @@ def processElephantContacts(inDF, etlInstance, dmInstance):
         # Read in 'Lookup Table - tlu Contacts'
         inQuery = f"SELECT tluObservers.ObserverID, [FirstName] & '_' & [LastName] AS First_Last FROM tluObservers;"
 
-        outDFContactsLU = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+        outDFContactsLU = dm.generalDMClass.readLookup(inQuery, "tluObservers", etlInstance.inDBBE,
+                                                       session=etlInstance.backendSession)
 
         # Join Obersvers with tluObservers lookup table
         dfObserversOtherwLK = pd.merge(
@@ -1348,7 +1351,7 @@ def tblSubSitesNotSurveyed(inDF, inDFEvents, etlInstance, dmInstance):
                    f"tblLocations WHERE tblLocations.ESealLocation=True;")
 
         # Import Locations Table
-        outDFLocations = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+        outDFLocations = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE, session=etlInstance.backendSession)
 
         # Lookup the LocationID value via SubSiteCode
         subSiteDFwEventID = pd.merge(
@@ -1368,7 +1371,7 @@ def tblSubSitesNotSurveyed(inDF, inDFEvents, etlInstance, dmInstance):
 
         insertQuery = f'INSERT INTO tblSubSitesNotSurveyed (EventID, LocationID) VALUES (?, ?)'
 
-        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
         # Append the Contacts to the tblEventObserers table
         dm.generalDMClass.appendDataSet(cnxn, subSiteDFAppend, "tblSubSitesNotSurveyed", insertQuery,
                                         dmInstance)
@@ -1401,12 +1404,10 @@ def processResightEvents(inDF, etlInstance, dmInstance):
 
     try:
 
-        # Read in the Event Table to get the CreatedDate, and Comments Fields
-        inQuery = (f"SELECT tblEvents.EventID, tblEvents.CreatedDate"
-                   f" FROM tblEvents;")
-
-        # Import Events
-        outDFEvents_misc = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+        # Read in the Event Table to get the CreatedDate field - only the Events being processed
+        outDFEvents_misc = dm.generalDMClass.readFiltered("tblEvents", ['EventID', 'CreatedDate'], 'EventID',
+                                                          inDF['EventID'], etlInstance.inDBBE,
+                                                          session=etlInstance.backendSession)
 
         # Merge on the Event Data Frame to get the CreatedDate
         inDFwVisSeason = pd.merge(inDF, outDFEvents_misc[['EventID', 'CreatedDate']]
@@ -1423,7 +1424,7 @@ def processResightEvents(inDF, etlInstance, dmInstance):
         insertQuery = (f'INSERT INTO tblResightEvents (EventID, Visibility, Season, ParkCode, CreatedDate, Comments)'
                        f' VALUES (?, ?, ?, ?, ?, ?)')
 
-        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
         dm.generalDMClass.appendDataSet(cnxn, inDFwVisSeasonAppend2, "tblResightEvents", insertQuery, dmInstance)
 
         logMsg = f"Successfully completed ETL_PINN_ELephant.py - processResightEvents."
@@ -1489,7 +1490,7 @@ def processResightRecords(inDF, etlInstance, dmInstance):
 
 
 
-        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
         dm.generalDMClass.appendDataSet(cnxn, inDFResightRec2, "tblResights", insertQuery, dmInstance)
 
         logMsg = f"Successfully completed ETL_PINN_ELephant.py - processResightRecords."
@@ -1531,7 +1532,7 @@ def processDistRec(inDF, etlInstance, dmInstance):
                        f'DisturbanceNumber, CreatedDate, GlobalID)'
                        f' VALUES (?, ?, ?, ?, ?, ?, ?)')
 
-        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
         dm.generalDMClass.appendDataSet(cnxn, inDFDistRec2, "tblDisturbances", insertQuery, dmInstance)
 
         logMsg = f"Successfully completed ETL_PINN_ELephant.py - processDistRec."
@@ -1567,13 +1568,10 @@ def processDistBehavior(inDF, etlInstance, dmInstance):
                                "GlobalID"]]
 
         # Connect to the Database import the tblDisturbance - need to get the DisturbanceID foreign key for
-        # records just pushed in 'processDistRec' function. Joining on "DisturbanceTime", "Source", "SpecificSource",
-        #                                                   "DisturbanceNumber"
-        inQuery = (f"SELECT tblDisturbances.DisturbanceID, tblDisturbances.EventID, tblDisturbances.DisturbanceTime,"
-                   f"tblDisturbances.Source, tblDisturbances.SpecificSource, tblDisturbances.DisturbanceNumber, "
-                   f"tblDisturbances.GlobalID FROM tblDisturbances;")
-
-        outDFDisturbanceAll = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+        # records just pushed in 'processDistRec' function. Read only the records with the GlobalIDs being processed
+        outDFDisturbanceAll = dm.generalDMClass.readFiltered("tblDisturbances", ['GlobalID', 'DisturbanceID'],
+                                                             'GlobalID', inDFDistBehave['GlobalID'],
+                                                             etlInstance.inDBBE, session=etlInstance.backendSession)
 
         outDFDisturbanceAll2 = pd.merge(inDFDistBehave, outDFDisturbanceAll[["GlobalID", "DisturbanceID"]], how='left',
                                          left_on=["GlobalID"],
@@ -1592,7 +1590,7 @@ def processDistBehavior(inDF, etlInstance, dmInstance):
                        f'RehaulTime, WhereRehaul, Comments, CreatedDate, DisturbanceID)'
                        f' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)')
 
-        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
         dm.generalDMClass.appendDataSet(cnxn, outDFDisturbanceAll2, "tblDisturbanceBehav", insertQuery,
                                         dmInstance)
 
@@ -1721,25 +1719,15 @@ def deleteNotMasterEvents(notMasterEventsFinal, etlInstance, dmInstance):
 
     try:
 
-        # Temporary Table Created for Updated Query Processing
-        tempTable = 'tmpTable_ETL'
-
-        # Create the temp table
-        dm.generalDMClass.createTableFromDF(notMasterEventsFinal, tempTable, etlInstance.inDBBE)
-
         # Event tables to be processed
         tableList = ['tblEvents', 'tblElephantEvents', 'tblResightEvents']
 
-        for table in tableList:
-
-            # Define the Delete Query
-            update_sql = (f'DELETE {table}.* FROM {table} INNER JOIN tmpTable_ETL ON '
-                          f'{table}.EventID = tmpTable_ETL.EventID;')
+        # Delete the Not Master Events from all Event tables in one pass
+        deletedCounts = dm.generalDMClass.delete_by_keys(tableList, 'EventID', notMasterEventsFinal,
+                                                         etlInstance.inDBBE, session=etlInstance.backendSession)
 
-            # Apply the Delete Query to the Access DB using the passed temp table
-            dm.generalDMClass.excuteQuery(update_sql, etlInstance.inDBBE)
-
-            logMsg = f'Successfully Deleted Not Master Events from - {table}'
+        for table in tableList:
+            logMsg = f'Successfully Deleted - {deletedCounts[table]} - Not Master Events from - {table}'
             print(logMsg)
             logging.info(logMsg)
 
@@ -1772,12 +1760,11 @@ def removeEventObserersDuplicates(notMasterEventsFinal, etlInstance, dmInstance)
 
     try:
 
-        # Import the tblEventObservers
-        # Import Event Table to define the EventID via the GlobalID
-        inQuery = f"SELECT tblEventObservers.* FROM tblEventObservers;"
-
-        # Import tblEventObservers
-        eventObserversDF = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+        # Import the tblEventObservers - only the Not Master and Master Events being harmonized
+        eventIDs = pd.concat([notMasterEventsFinal['EventID'], notMasterEventsFinal['MasterEventID']])
+        eventObserversDF = dm.generalDMClass.readFiltered("tblEventObservers", ['EventID', 'ObserverID'], 'EventID',
+                                                          eventIDs, etlInstance.inDBBE,
+                                                          session=etlInstance.backendSession)
 
 
         # Get Observers by EventID in the Not Master Events
@@ -1809,19 +1796,9 @@ def removeEventObserersDuplicates(notMasterEventsFinal, etlInstance, dmInstance)
 
 
         # Delete the duplicate observers
-        # Temporary Table Created for Updated Query Processing
-        tempTable = 'tmpTable_ETL'
-
-        # Create the temp table
-        dm.generalDMClass.createTableFromDF(duplicatesByEventIDNotMasterDF, tempTable, etlInstance.inDBBE)
-
-        # Define the Delete Query
-        update_sql = (f'DELETE tblEventObservers.* FROM tblEventObservers INNER JOIN tmpTable_ETL ON'
-                      f' (tblEventObservers.ObserverID = tmpTable_ETL.ObserverID) AND'
-                      f' (tblEventObservers.EventID = tmpTable_ETL.EventID);')
-
-        # Apply the Delete Query to the Access DB using the passed temp table
-        dm.generalDMClass.excuteQuery(update_sql, etlInstance.inDBBE)
+        dm.generalDMClass.delete_by_keys('tblEventObservers', ['ObserverID', 'EventID'],
+                                         duplicatesByEventIDNotMasterDF, etlInstance.inDBBE,
+                                         session=etlInstance.backendSession)
 
         recCount = duplicatesByEventIDNotMasterDF.shape[0]
 
@@ -1862,12 +1839,11 @@ def defineObserversPerUnique(outUniqueEventsDF, etlInstance, dmInstance):
 
     try:
 
-        # Import the tblEventObservers
-
-        inQuery = f"SELECT tblEventObservers.* FROM tblEventObservers;"
-
-        # Import tblEventObservers
-        eventObserversDF = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+        # Import the tblEventObservers for only the Events being processed - key filtered read (from the read mirror
+        # when enabled) rather than pulling the full tblEventObservers table
+        eventObserversDF = dm.generalDMClass.readFiltered("tblEventObservers", ['EventID', 'ObserverID'], 'EventID',
+                                                          outUniqueEventsDF['EventID'], etlInstance.inDBBE,
+                                                          session=etlInstance.backendSession)
 
         # Get Observers for the Events that are being processed
         observersAllRelevant = pd.merge(
@@ -1884,31 +1860,12 @@ def defineObserversPerUnique(outUniqueEventsDF, etlInstance, dmInstance):
             [['ProjectCode', 'StartDate', 'ObserverID']]
             .reset_index(drop=True))
 
-        # Get the Observers Already Defined in the Master Event
-        observersMasterAlready = observersAllRelevant.loc[
-            observersAllRelevant['MasterEvent'] == 'Yes',
-            ['EventID', 'ProjectCode', 'StartDate', 'ObserverID', 'MasterEvent']
-        ]
-
-        # Left Join to see which Observers Still Need to be appended to the Master Event, retain on the missing records
-        observersToAppend = (
-            obsByUniqueEvent
-            .merge(
-                observersMasterAlready,
-                on=['ProjectCode', 'StartDate', 'ObserverID'],
-                how='left',
-                indicator=True
-            )
-            .query("_merge == 'left_only'")
-            .drop(columns=['_merge', 'EventID', 'MasterEvent'])
-        )
-
         # Subset to only the Master Events
         masterEventsDF = outUniqueEventsDF[outUniqueEventsDF['MasterEvent']=='Yes']
 
         # Redefine the Master EventID
         observersToAppendwMasterID = pd.merge(
-            observersToAppend,
+            obsByUniqueEvent,
             masterEventsDF[['ProjectCode', 'StartDate', 'EventID']],
             left_on=['ProjectCode', 'StartDate'],
             right_on=['ProjectCode', 'StartDate'],
@@ -1918,21 +1875,11 @@ def defineObserversPerUnique(outUniqueEventsDF, etlInstance, dmInstance):
         observersToAppendwMasterID = (observersToAppendwMasterID.drop(columns=['ProjectCode']).
                                       rename(columns={'StartDate': 'CreatedDate'}))
 
-        # Append the records that had photo attachments
-        # Grab all column names from the dataframe
-        cols = observersToAppendwMasterID.columns.tolist()
-
-        recCount = observersToAppend.shape[0]
-
-        # Append to the Masters Event the missing Observers.
-        # Build the SQL query dynamically
-        insertQuery = (
-            f"INSERT INTO tblEventObservers ({', '.join(cols)}) "
-            f"VALUES ({', '.join(['?'] * len(cols))})")
-
-        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-        dm.generalDMClass.appendDataSet(cnxn, observersToAppendwMasterID, "tblEventObservers", insertQuery,
-                                        dmInstance)
+        # Append to the Masters Event the Observers not already defined in the Master Event - set based insert only
+        # upsert on EventID/ObserverID.
+        updatedCount, recCount = dm.generalDMClass.upsertDataSet(observersToAppendwMasterID, 'tblEventObservers',
+                                                                 ['EventID', 'ObserverID'], etlInstance.inDBBE,
+                                                                 session=etlInstance.backendSession, updateFields=[])
 
         logMsg = (f"Added - {recCount} - Observers to Master Events to Get the Compiled across all Surveys) - to table"
                   f" 'tblEventObservers'")
@@ -2021,10 +1968,11 @@ def updateToMasterEventID(notMasterEventsFinal, etlInstance, dmInstance, tableLi
 
 
         # Temporary Table Created for Updated Query Processing
-        tempTable = 'tmpTable_ETL'
+        tempTable = etlInstance.backendSession.stagingTable('updateToMasterEventID', etlInstance.inDBBE)
 
         # Create the temp table
-        dm.generalDMClass.createTableFromDF(notMasterEventsFinal, tempTable, etlInstance.inDBBE)
+        dm.generalDMClass.createTableFromDF(notMasterEventsFinal, tempTable, etlInstance.inDBBE,
+                                            session=etlInstance.backendSession, indexFields='EventID')
 
         # Process the tables in need of update
         for table in tableList:
@@ -2036,7 +1984,7 @@ def updateToMasterEventID(notMasterEventsFinal, etlInstance, dmInstance, tableLi
                                                                    join_field="EventID")
 
             # Apply the Update Query to the Access DB using the passed temp table
-            dm.generalDMClass.excuteQuery(update_sql, etlInstance.inDBBE)
+            dm.generalDMClass.excuteQuery(update_sql, etlInstance.inDBBE, session=etlInstance.backendSession)
 
             logMsg = f'Successfully Updated EventID to the MasterEventID in - {table}.'
             logging.info(logMsg)
@@ -2083,7 +2031,7 @@ def updateSealCountObservationSplitEvent(inDF, etlInstance, dmInstance):
 
         # Perform the Update Query
         # Temporary Table Created for Updated Query Processing
-        tempTable = 'tmpTable_ETL'
+        tempTable = etlInstance.backendSession.stagingTable('updateSealCountObservationSplitEvent', etlInstance.inDBBE)
 
         # Create the update SQL Statement
         update_sql = dm.generalDMClass.build_access_update_sql(df=eventsDFToUpdate, target_table="tblSealCount",
@@ -2091,10 +2039,11 @@ def updateSealCountObservationSplitEvent(inDF, etlInstance, dmInstance):
                                                                join_field="EventID")
 
         # Create the temp table
-        dm.generalDMClass.createTableFromDF(eventsDFToUpdate, tempTable, etlInstance.inDBBE)
+        dm.generalDMClass.createTableFromDF(eventsDFToUpdate, tempTable, etlInstance.inDBBE,
+                                            session=etlInstance.backendSession, indexFields='EventID')
 
         # Apply the Update Query to the Access DB using the passed temp table
-        dm.generalDMClass.excuteQuery(update_sql, etlInstance.inDBBE)
+        dm.generalDMClass.excuteQuery(update_sql, etlInstance.inDBBE, session=etlInstance.backendSession)
 
 
         # Next Reimport the updated records for the event - and perform the Aggregrate query - then delete the existing
@@ -2106,12 +2055,12 @@ def updateSealCountObservationSplitEvent(inDF, etlInstance, dmInstance):
             "SELECT tblSealCount.SealCountID, tblSealCount.EventID, tblSealCount.LocationID, "
             "tblSealCount.ObservationTime, tblSealCount.MatureCode, tblSealCount.Qualifier, tblSealCount.QCFlag, "
             "tblSealCount.Enumeration, tblSealCount.CreatedDate "
-            "FROM tmpTable_ETL "
-            "INNER JOIN tblSealCount ON tmpTable_ETL.EventID = tblSealCount.EventID;"
+            f"FROM {tempTable} "
+            f"INNER JOIN tblSealCount ON {tempTable}.EventID = tblSealCount.EventID;"
         )
 
         # Import Seal Count Table
-        recordsToAggregate = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+        recordsToAggregate = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE, session=etlInstance.backendSession)
 
         # Summarize on the all but the 'SealCountID' field.
         recordsToAggregateNoID = recordsToAggregate.drop(columns=['SealCountID'])
@@ -2145,15 +2094,9 @@ def updateSealCountObservationSplitEvent(inDF, etlInstance, dmInstance):
         # Subset to only SealCountID fields
         recordsBeingAggregated = recordsToAggregate[['SealCountID']]
 
-        # Create the temp table with the DF in the DB
-        dm.generalDMClass.createTableFromDF(recordsBeingAggregated, tempTable, etlInstance.inDBBE)
-
-        # Define the Delete Query
-        update_sql = (f'DELETE tblSealCount.* FROM tblSealCount INNER JOIN tmpTable_ETL ON tblSealCount.SealCountID = '
-                        f'tmpTable_ETL.SealCountID;')
-
-        # Apply the Delete Query to the Access DB using the passed temp table
-        dm.generalDMClass.excuteQuery(update_sql, etlInstance.inDBBE)
+        # Delete the existing records by SealCountID
+        dm.generalDMClass.delete_by_keys('tblSealCount', 'SealCountID', recordsBeingAggregated, etlInstance.inDBBE,
+                                         session=etlInstance.backendSession)
 
         # Add note about Deleting Records
         recCountDeleted = recordsBeingAggregated.shape[0]
@@ -2166,21 +2109,12 @@ def updateSealCountObservationSplitEvent(inDF, etlInstance, dmInstance):
         # Lastly Append the new aggregated records
         ###################################
 
-        cols = recordsToAggregateAgg.columns.tolist()
-
         recCount = recordsToAggregateAgg.shape[0]
 
         # Append to table
-        # Build the SQL query dynamically
-        insertQuery = (f"INSERT INTO tblSealCount ({', '.join(cols)}) "
-        f"VALUES ({', '.join(['?'] * len(cols))})")
-
-        # Set all nan to None
-        recordsToAggregateAgg = recordsToAggregateAgg.replace([np.nan, 'nan'], None)
 
-        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-        dm.generalDMClass.appendDataSet(cnxn, recordsToAggregateAgg, "tblSealCount", insertQuery,
-                                                   dmInstance)
+        writer = etlInstance.backendSession.getTableWriter("tblSealCount", etlInstance.inDBBE)
+        writer.append(recordsToAggregateAgg, dmInstance)
 
         recsAppended = recordsToAggregateAgg.shape[0]
         logMsg = f'For Split Events just appended - {recsAppended} - Aggregated records - to tblSealCount'
@@ -2253,7 +2187,7 @@ def consolidateTblEvents(outUniqueEventsDF, etlInstance, dmInstance):
 
         # Perform the Update Query
         # Temporary Table Created for Updated Query Processing
-        tempTable = 'tmpTable_ETL'
+        tempTable = etlInstance.backendSession.stagingTable('consolidateTblEvents', etlInstance.inDBBE)
 
         #Subset to Only the fields needing update:
         cols_needed = ['EventID', 'StartTime', 'EndTime', 'GlobalID']
@@ -2266,10 +2200,11 @@ def consolidateTblEvents(outUniqueEventsDF, etlInstance, dmInstance):
                                                                join_field="EventID")
 
         # Create the temp table
-        dm.generalDMClass.createTableFromDF(eventsDFToUpdateFinal, tempTable, etlInstance.inDBBE)
+        dm.generalDMClass.createTableFromDF(eventsDFToUpdateFinal, tempTable, etlInstance.inDBBE,
+                                            session=etlInstance.backendSession, indexFields='EventID')
 
         # Apply the Update Query to the Access DB using the passed temp table
-        dm.generalDMClass.excuteQuery(update_sql, etlInstance.inDBBE)
+        dm.generalDMClass.excuteQuery(update_sql, etlInstance.inDBBE, session=etlInstance.backendSession)
 
         # Get Count of records being processed
         recCount = eventsDFToUpdateFinal.shape[0]
@@ -2371,7 +2306,7 @@ def consolidateTblElephantEvents(outUniqueEventsDF, outDFElephantEvents, etlInst
 
         # Perform the Update Query
         # Temporary Table Created for Updated Query Processing
-        tempTable = 'tmpTable_ETL'
+        tempTable = etlInstance.backendSession.stagingTable('consolidateTblElephantEvents', etlInstance.inDBBE)
 
         # Subset to Only the fields needing update:
         cols_needed = ['EventID', 'Comments', 'Visibility', 'SurveyType', 'RegionalSurvey', 'RegionalCountCode']
@@ -2387,10 +2322,11 @@ def consolidateTblElephantEvents(outUniqueEventsDF, outDFElephantEvents, etlInst
                                                                join_field="EventID")
 
         # Create the temp table
-        dm.generalDMClass.createTableFromDF(eventsDFToUpdateFinal, tempTable, etlInstance.inDBBE)
+        dm.generalDMClass.createTableFromDF(eventsDFToUpdateFinal, tempTable, etlInstance.inDBBE,
+                                            session=etlInstance.backendSession, indexFields='EventID')
 
         # Apply the Update Query to the Access DB using the passed temp table
-        dm.generalDMClass.excuteQuery(update_sql, etlInstance.inDBBE)
+        dm.generalDMClass.excuteQuery(update_sql, etlInstance.inDBBE, session=etlInstance.backendSession)
 
         # Get Count of records being processed
         recCount = eventsDFToUpdateFinal.shape[0]
@@ -2471,7 +2407,7 @@ def consolidateTblResightEvents(outUniqueEventsDF, outDFResightEvents, etlInstan
 
         # Perform the Update Query
         # Temporary Table Created for Updated Query Processing
-        tempTable = 'tmpTable_ETL'
+        tempTable = etlInstance.backendSession.stagingTable('consolidateTblResightEvents', etlInstance.inDBBE)
 
         # Subset to Only the fields needing update:
         cols_needed = ['EventID', 'Comments', 'Visibility', 'Season', 'ParkCode']
@@ -2494,10 +2430,11 @@ def consolidateTblResightEvents(outUniqueEventsDF, outDFResightEvents, etlInstan
                                                                join_field="EventID")
 
         # Create the temp table
-        dm.generalDMClass.createTableFromDF(eventsDFToUpdateFinal, tempTable, etlInstance.inDBBE)
+        dm.generalDMClass.createTableFromDF(eventsDFToUpdateFinal, tempTable, etlInstance.inDBBE,
+                                            session=etlInstance.backendSession, indexFields='EventID')
 
         # Apply the Update Query to the Access DB using the passed temp table
-        dm.generalDMClass.excuteQuery(update_sql, etlInstance.inDBBE)
+        dm.generalDMClass.excuteQuery(update_sql, etlInstance.inDBBE, session=etlInstance.backendSession)
 
         # Get Count of records being processed
         recCount = eventsDFToUpdateFinal.shape[0]
@@ -115,7 +115,8 @@ class etlInstance_QC:
             inQuery = f"SELECT tluLengthCategories.* FROM tluLengthCategories;"
 
             # Import Event Table with defined EventID
-            tluLengthCategories_DF = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+            tluLengthCategories_DF = dm.generalDMClass.readLookup(inQuery, "tluLengthCategories", etlInstance.inDBBE,
+                                                                  session=etlInstance.backendSession)
 
             # Via the 'ForkLength' variable lookup the 'LengthCategoryID' value
             outDFwLookUp = etlInstance_QC.lookup_length_category_id(tluLengthCategories_DF, inDF)
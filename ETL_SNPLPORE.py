@@ -51,41 +51,49 @@ class etl_SNPLPORE:
             # Process Survey Metadata Form
             ######
 
-            outDFSurvey = etl_SNPLPORE.process_Survey(outDFDic, etlInstance, dmInstance)
+            outDFSurvey = etlInstance.backendSession.runStage('process_Survey', etl_SNPLPORE.process_Survey, outDFDic,
+                                                              etlInstance, dmInstance)
 
             ######
             # Process SNPL Observations Form
             ######
-            outDFObs = etl_SNPLPORE.process_Observations(outDFDic, etlInstance, dmInstance, outDFSurvey)
+            outDFObs = etlInstance.backendSession.runStage('process_Observations', etl_SNPLPORE.process_Observations,
+                                                           outDFDic, etlInstance, dmInstance, outDFSurvey)
 
             ######
             # Update Event Detail fields post creation of the Survey and Observation records - added 20241205
             ######
-            outDFEvDetails = etl_SNPLPORE.process_EventDetails(etlInstance, dmInstance, outDFSurvey, outDFObs)
+            outDFEvDetails = etlInstance.backendSession.runStage('process_EventDetails',
+                                                                 etl_SNPLPORE.process_EventDetails, etlInstance,
+                                                                 dmInstance, outDFSurvey, outDFObs)
 
             ######
             # Process Bands Sub Form - table 'tbl_SNPL_Bands' and 'tbl_ChickBands'
             ######
 
-            outDBands = etl_SNPLPORE.process_Bands(outDFDic, etlInstance, dmInstance, outDFSurvey, outDFObs)
+            outDBands = etlInstance.backendSession.runStage('process_Bands', etl_SNPLPORE.process_Bands, outDFDic,
+                                                            etlInstance, dmInstance, outDFSurvey, outDFObs)
 
             ######
             # Process Predator
             ######
 
-            outDFPredator = etl_SNPLPORE.process_Predator(outDFDic, etlInstance, dmInstance, outDFSurvey)
+            outDFPredator = etlInstance.backendSession.runStage('process_Predator', etl_SNPLPORE.process_Predator,
+                                                                outDFDic, etlInstance, dmInstance, outDFSurvey)
 
             ######################
             # Process Nest Repeats - Updates pushed to the tbl_Nest_Master
             ######################
 
-            outFun = etl_SNPLPORE.process_NestRepeats(outDFDic, etlInstance, dmInstance, outDFSurvey)
+            outFun = etlInstance.backendSession.runStage('process_NestRepeats', etl_SNPLPORE.process_NestRepeats,
+                                                         outDFDic, etlInstance, dmInstance, outDFSurvey)
 
             ######################
             # Process Nest Photos - Updates pushed to the tbl_Nest_Photos and exported as .jpg
             ######################
 
-            outFun = etl_SNPLPORE.process_NestPhotos(outDFDic, etlInstance, dmInstance, generalArcGIS)
+            outFun = etlInstance.backendSession.runStage('process_NestPhotos', etl_SNPLPORE.process_NestPhotos,
+                                                         outDFDic, etlInstance, dmInstance, generalArcGIS)
 
 
             logMsg = f"Success ETL_SNPLPORE.py - process_ETLSNPLPORE."
@@ -166,7 +174,8 @@ class etl_SNPLPORE:
             # Read in the Lookup Table
             inQuery = f"Select * FROM tbl_Locations';"
 
-            outDFLookup = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+            outDFLookup = dm.generalDMClass.readLookup(inQuery, "tbl_Locations", etlInstance.inDBBE,
+                                                       session=etlInstance.backendSession)
             # Perform the lookup to field 'Location_ID'
 
             outDF_Step2 = pd.merge(outDFSubset, outDFLookup[['Loc_Name', 'Location_ID']], how='left',
@@ -196,17 +205,8 @@ class etl_SNPLPORE:
 
             # Append outDFSurvey to 'tbl_Events'
             # Pass final Query to be appended
-
-            # Grab all column names from the dataframe
-            cols = outDFSurvey.columns.tolist()
-
-            # Build the SQL query dynamically
-            insertQuery = (
-                f"INSERT INTO tbl_Events ({', '.join(cols)}) "
-                f"VALUES ({', '.join(['?'] * len(cols))})")
-
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-            dm.generalDMClass.appendDataSet(cnxn, outDFSurvey, "tblEvents", insertQuery, dmInstance)
+            writer = etlInstance.backendSession.getTableWriter("tbl_Events", etlInstance.inDBBE)
+            writer.append(outDFSurvey, dmInstance)
 
             ##################
             # Define Observers -  table xref_EventContacts
@@ -220,7 +220,7 @@ class etl_SNPLPORE:
 
             insertQuery = (f'INSERT INTO xref_Event_Contacts (Event_ID, Contact_ID, Contact_Role) VALUES (?, ?, ?)')
 
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
             # Append the Contacts to the xref_EventContacts table
             dm.generalDMClass.appendDataSet(cnxn, outContactsDFAppend, "xref_Event_Contacts", insertQuery,
                                             dmInstance)
@@ -252,14 +252,6 @@ class etl_SNPLPORE:
             outDFEventDetails2 = dm.generalDMClass.defineFieldTypesDF(dmInstance, fieldTypeDic=fieldTypeDic2,
                                                                inDF=outDFEventDetails)
 
-            # Convert Nans in Object/String and defined Numeric fields to None, NaN will not import to text
-            # fields in access.  Numeric fields when 'None' is added will turn to 'Object' fields but will import to the
-            # numeric (e.g. Int or Double) fields still when an Object type with numeric only values and the added
-            # none values. A real PITA None and Numeric is.
-            cols_to_update = ["Event_Notes", "LE_Violation", "Violation_Notes", "DeviceName", "PredatorStop"]
-            for col in cols_to_update:
-                outDFEventDetails2[col] = dm.generalDMClass.nan_to_none(outDFEventDetails2[col])
-
             # Change Check Box Field If Yes to True and No to False
             outDFEventDetails2['LE_Violation'] = outDFEventDetails2['LE_Violation'].apply(
                 lambda x: True if x == 'Yes' else False)
@@ -269,7 +261,7 @@ class etl_SNPLPORE:
                            f', PredatorStop, DeviceName) VALUES (?, ?, ?, ?, ?, ?)')
 
             # Connect to DB
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
             # Append misc Event Fields to the tbl_Event_Details table
             dm.generalDMClass.appendDataSet(cnxn, outDFEventDetails2, "tbl_Event_Details", insertQuery, dmInstance)
 
@@ -338,7 +330,7 @@ class etl_SNPLPORE:
             # created before creating the Observation
             ####################
 
-            outDFNewNests = process_NestMasterInitial(etlInstance, dmInstance, outDFSurvey, outDFSubset)
+            process_NestMasterInitial(etlInstance, dmInstance, outDFSurvey, outDFSubset)
 
             ##############################
             # CleanUp Wrangle Steps Observations Table
@@ -399,7 +391,7 @@ class etl_SNPLPORE:
                            f' X_Coord, Y_Coord, SNPL_Bands, Coord_Units, Coord_System, Datum) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?,'
                            f' ?, ?, ?, ?, ?, ?, ?)')
 
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
             dm.generalDMClass.appendDataSet(cnxn, outDFObsOnly, "tbl_SNPL_Observations", insertQuery,
                                             dmInstance)
 
@@ -466,7 +458,7 @@ class etl_SNPLPORE:
                 columns={'Adults': 'SNPL_Adults', 'SNPL_Bands': 'SNPL_Banded'})
 
             # Connect to the Access DB
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
 
             # Create a cursor object
             cursor = cnxn.cursor()
@@ -567,15 +559,6 @@ class etl_SNPLPORE:
                          'SNPL Age': 'SNPL_Age',
                          'Band Notes': 'Band_Notes'})
 
-            # Convert Nans in Object/String and defined Numeric fields to None, NaN will not import to text
-            # fields in access.  Numeric fields when 'None' is added will turn to 'Object' fields but will import to the
-            # numeric (e.g. Int or Double) fields still when an Object type with numeric only values and the added
-            # none values. A real PITA None and Numeric is.
-            cols_to_update = ["Left_Leg", "Right_Leg", "SNPL_Sex",
-                              "SNPL_Age", "Band_Notes"]
-            for col in cols_to_update:
-                outDFBands[col] = dm.generalDMClass.nan_to_none(outDFBands[col])
-
             # Not necessary to redefine field types already all Object.
 
             # Additional Data Clean Up Exercises
@@ -586,7 +569,7 @@ class etl_SNPLPORE:
             insertQuery = (f'INSERT INTO tbl_SNPL_Banded (SNPL_Data_ID, Left_Leg, Right_Leg, SNPL_Sex,'
                            f'SNPL_Age, Band_Notes) VALUES (?, ?, ?, ?, ?, ?)')
 
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
             dm.generalDMClass.appendDataSet(cnxn, outDFBandsAppend, "tbl_SNPL_Banded", insertQuery,
                                             dmInstance)
             logMsg = f"Success processing records  for 'tbl_SNPL_Banded'."
@@ -683,7 +666,7 @@ class etl_SNPLPORE:
                            f' EggToothPresence, YolkSacPresence, USGSBand, BandCombination, Nest_ID) VALUES (?, ?, ?, '
                            f'?, ?, ?, ?)')
 
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
             dm.generalDMClass.appendDataSet(cnxn, outDFChickOnlywNest, "tbl_Chick_BandData", insertQuery,
                                             dmInstance)
             logMsg = f"Success processing records  for 'tbl_Chick_BandData'."
@@ -758,15 +741,6 @@ class etl_SNPLPORE:
 
             outDFPredator = dm.generalDMClass.defineFieldTypesDF(dmInstance, fieldTypeDic=fieldTypeDic, inDF=outDFSubset)
 
-            # Convert Nans in Object/String and defined Numeric fields to None, NaN will not import to text
-            # fields in access.  Numeric fields when 'None' is added will turn to 'Object' fields but will import to the
-            # numeric (e.g. Int or Double) fields still when an Object type with numeric only values and the added
-            # none values. A real PITA None and Numeric is.
-            cols_to_update = ['Event_ID', 'Predator_Data_ID', 'Predator_Type_ID', "GroupSize", "BinNumber", "ACT",
-                              "Flight", "Predator_Notes", "X_Coord", "Y_Coord", "Predator_Type_Other", "ACT_Other"]
-            for col in cols_to_update:
-                outDFPredator[col] = dm.generalDMClass.nan_to_none(outDFPredator[col])
-
             # Change ACT values 'other' to 'O'
             outDFPredator['ACT'] = outDFPredator['ACT'].replace('other', 'O')
 
@@ -784,7 +758,7 @@ class etl_SNPLPORE:
                            f' X_Coord, Y_Coord, Coord_Units, Coord_System, Datum) VALUES'
                            f' (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)')
 
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
             dm.generalDMClass.appendDataSet(cnxn, outDFPredator, "tbl_Predator_Survey", insertQuery,
                                             dmInstance)
             logMsg = f"Success processing records for 'tbl_Predator_Survey'."
@@ -995,20 +969,11 @@ class etl_SNPLPORE:
             outPhotosDFwAtt.drop(fieldListDrop, axis=1, inplace=True)
 
             # Append the records that had photo attachments
-            # Grab all column names from the dataframe
-            cols = outPhotosDFwAtt.columns.tolist()
-
             recCount = outPhotosDFwAtt.shape[0]
 
             # Append to tbl_Nest_Photos'
-            # Build the SQL query dynamically
-            insertQuery = (
-               f"INSERT INTO tbl_Nest_Photos ({', '.join(cols)}) "
-               f"VALUES ({', '.join(['?'] * len(cols))})")
-
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-            dm.generalDMClass.appendDataSet(cnxn, outPhotosDFwAtt, "tbl_Nest_Photos", insertQuery,
-                                           dmInstance)
+            writer = etlInstance.backendSession.getTableWriter("tbl_Nest_Photos", etlInstance.inDBBE)
+            writer.append(outPhotosDFwAtt, dmInstance)
 
             logMsg = f"Success process_NestPhotos - appended - {recCount} - records to the tbl_Nest_Photo table."
             dm.generalDMClass.messageLogFile(dmInstance, logMsg=logMsg)
@@ -1036,7 +1001,7 @@ def process_NestMasterInitial(etlInstance, dmInstance, outDFSurvey, outDFSubset)
     :param outDFSurvey: Survey data frame that was append to the
     :param outDFSubset: Observation dataframe that are been subset in 'process_Observations'
 
-    :return:outDFNestIDNewAppend: Dataframe with the newly append Nests
+    :return:insertedCount: Number of new Nest_IDs appended to tbl_Nest_Master
     """
 
     try:
@@ -1050,20 +1015,7 @@ def process_NestMasterInitial(etlInstance, dmInstance, outDFSurvey, outDFSubset)
         # Retain the first record by 'Nest_ID'
         outDFNestIDFirst = merged_df.drop_duplicates(subset=['Nest_ID'], keep='first')
 
-        # Join to Check which 'Nest_ID, Year, and Location_ID composite primary key is not present Left join.
-        # Pull the Nest Master table
-        inQuery = f"Select * FROM tbl_Nest_Master;"
-        outDFNestMaster = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
-
-        # Perform an outer left join - these are the records to be append
-        outDFNestIDNew = pd.merge(outDFNestIDFirst, outDFNestMaster, on='Nest_ID', how='left', indicator=True)
-
-        # Only Rectain the records that aren't present via '_merge' = 'left_only'.  Necessary is multiple etl happen
-        # per year thus some nests are already present.
-        outDFNestIDNew = outDFNestIDNew[outDFNestIDNew['_merge'] =='left_only']
-
-        outDFNestIDNewAppend = outDFNestIDNew[['Location_ID_x', 'Nest_ID', "Start_Date"]].rename(
-                    columns={'Location_ID_x': 'Location_ID'})
+        outDFNestIDNewAppend = outDFNestIDFirst[['Location_ID', 'Nest_ID', 'Start_Date']]
 
         # Add additional required fields - Created_By, DataProcessingLevelUser. Note DPL_ID is defaulting to 1, and DPL
         # data is defaulting to Now
@@ -1079,19 +1031,19 @@ def process_NestMasterInitial(etlInstance, dmInstance, outDFSurvey, outDFSubset)
         outDFNestIDNewAppend.insert(fieldLen, "Created_By", etlInstance.inUser)
         outDFNestIDNewAppend.insert(fieldLen + 1, "DataProcessingLevelUser", etlInstance.inUser)
 
-        # Append the New Nest_ID values
-        insertQuery = (f'INSERT INTO tbl_Nest_Master (Location_ID, Nest_ID, Year, Created_By, DataProcessingLevelUser)'
-                       f' VALUES (?, ?, ?, ?, ?)')
+        # Append the Nest_ID values not already in tbl_Nest_Master (necessary if multiple etl happen per year thus
+        # some nests are already present).  Set based insert only upsert on Nest_ID in the backend rather than pulling
+        # the full tbl_Nest_Master table.
+        updatedCount, insertedCount = dm.generalDMClass.upsertDataSet(outDFNestIDNewAppend, 'tbl_Nest_Master',
+                                                                      'Nest_ID', etlInstance.inDBBE,
+                                                                      session=etlInstance.backendSession,
+                                                                      updateFields=[])
 
-        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-        dm.generalDMClass.appendDataSet(cnxn, outDFNestIDNewAppend, "tbl_Nest_Master", insertQuery,
-                                        dmInstance)
-
-        logMsg = f"Success process_NestMasterInitial - New Nest_Ids append to tbl_NestMaster."
+        logMsg = f"Success process_NestMasterInitial - {insertedCount} - New Nest_Ids append to tbl_NestMaster."
         dm.generalDMClass.messageLogFile(dmInstance, logMsg=logMsg)
         logging.info(logMsg)
 
-        return outDFNestIDNewAppend
+        return insertedCount
 
     except Exception as e:
 
@@ -1126,17 +1078,18 @@ def process_NestRepeatSingle(etlInstance, dmInstance, outDFSubsetNone):
         recCount = subset_df2.shape[0]
 
         # Temporary Table Created for Updated Query Processing
-        tempTable = 'tmpTable_ETL'
+        tempTable = etlInstance.backendSession.stagingTable('process_NestRepeatSingle', etlInstance.inDBBE)
         # Create the update SQL Statement
         update_sql = dm.generalDMClass.build_access_update_sql(df=subset_df2, target_table="tbl_Nest_Master",
                                                                source_table=tempTable,
                                                                join_field="Nest_ID")
 
         # Create the temp table
-        dm.generalDMClass.createTableFromDF(subset_df2, tempTable, etlInstance.inDBBE)
+        dm.generalDMClass.createTableFromDF(subset_df2, tempTable, etlInstance.inDBBE,
+                                            session=etlInstance.backendSession, indexFields='Nest_ID')
 
         # Apply the Update Query to the Access DB using the passed temp table
-        dm.generalDMClass.excuteQuery(update_sql, etlInstance.inDBBE)
+        dm.generalDMClass.excuteQuery(update_sql, etlInstance.inDBBE, session=etlInstance.backendSession)
 
         logMsg = f'Successfully processed the - {recCount} - records in the nest repeat with 1 Nest ID record'
         logging.info(logMsg)
@@ -1217,17 +1170,18 @@ def process_NestRepeatGTOne(etlInstance, dmInstance, inDF, outDFSurvey):
 
             # After working through the records by nest push the record to the tbl_Nest_Master via and update join
             # Temporary Table Created for Updated Query Processing
-            tempTable = 'tmpTable_ETL'
+            tempTable = etlInstance.backendSession.stagingTable('process_NestRepeatGTOne', etlInstance.inDBBE)
             # Create the update SQL Statement
             update_sql = dm.generalDMClass.build_access_update_sql(df=resultDF, target_table="tbl_Nest_Master",
                                                                    source_table=tempTable,
                                                                    join_field="Nest_ID")
 
             # Create the temp table
-            dm.generalDMClass.createTableFromDF(resultDF, tempTable, etlInstance.inDBBE)
+            dm.generalDMClass.createTableFromDF(resultDF, tempTable, etlInstance.inDBBE,
+                                                session=etlInstance.backendSession, indexFields='Nest_ID')
 
             # Apply the Update Query to the Access DB using the passed temp table
-            dm.generalDMClass.excuteQuery(update_sql, etlInstance.inDBBE)
+            dm.generalDMClass.excuteQuery(update_sql, etlInstance.inDBBE, session=etlInstance.backendSession)
 
             logMsg = f"Successfully applied Updates for Nest_ID - {nest_id}"
             print(logMsg)
@@ -1341,7 +1295,8 @@ def processSNPLContacts(inDF, etlInstance, dmInstance):
         # Read in 'Lookup Table - tlu Contacts'
         inQuery = f"SELECT tlu_Contacts.Contact_ID, [First_Name] & '_' & [Last_Name] AS First_Last FROM tlu_Contacts;"
 
-        outDFContactsLU = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+        outDFContactsLU = dm.generalDMClass.readLookup(inQuery, "tlu_Contacts", etlInstance.inDBBE,
+                                                       session=etlInstance.backendSession)
 
         # Define the Contact_ID via join on First_Last fields
         dfObserversOtherwLK = pd.merge(dfObserversOther, outDFContactsLU[['First_Last', 'Contact_ID']], how='left',
@@ -1403,7 +1358,8 @@ def applyLookups(etlInstance, dmInstance, inDF):
         # Read in the Lookup Table
         inQuery = f"Select * FROM tlu_ExclosureType';"
 
-        outDFLookupExclosure = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+        outDFLookupExclosure = dm.generalDMClass.readLookup(inQuery, "tlu_ExclosureType", etlInstance.inDBBE,
+                                                            session=etlInstance.backendSession)
         # Perform the lookup to field 'Location_ID'
 
         # Set 'ID' field to 'Object' field type
@@ -1432,7 +1388,8 @@ def applyLookups(etlInstance, dmInstance, inDF):
         # Read in the Lookup Table
         inQuery = f"Select * FROM tlu_NestFailure';"
 
-        outDFLookup = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+        outDFLookup = dm.generalDMClass.readLookup(inQuery, "tlu_NestFailure", etlInstance.inDBBE,
+                                                   session=etlInstance.backendSession)
         # Perform the lookup to field 'Location_ID'
 
         # Set 'fields to 'Object' field type
@@ -1494,7 +1451,8 @@ def process_Behaviors(etlInstance, dmInstance, outDFSubset):
 
         # Read in lookup 'tlu_Behavior'
         inQuery = f"Select * FROM tlu_Behavior;"
-        outDFBehaviorLU = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+        outDFBehaviorLU = dm.generalDMClass.readLookup(inQuery, "tlu_Behavior", etlInstance.inDBBE,
+                                                       session=etlInstance.backendSession)
 
         # Iterate through the Fields
         for field in fieldsToProcess:
@@ -1571,16 +1529,11 @@ def process_Behaviors(etlInstance, dmInstance, outDFSubset):
         #################################################################
         outDFBehavior_wOther = pd.concat([outDFBehavior, outDFOtherAppend])
 
-        # Remove nan values from the 'Notes' field
-        cols_to_update = ["Notes"]
-        for col in cols_to_update:
-            outDFBehavior_wOther[col] = dm.generalDMClass.nan_to_none(outDFBehavior_wOther[col])
-
         # Append to tbl_SNPL_Behaviors
         insertQuery = (f'INSERT INTO tbl_SNPL_Behaviors (SNPL_Data_ID, BehaviorClass, Behavior, Notes)'
                        f' VALUES (?, ?, ?, ?)')
 
-        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
         dm.generalDMClass.appendDataSet(cnxn, outDFBehavior_wOther, "tbl_SNPL_Behaviors", insertQuery,
                                         dmInstance)
 
@@ -1644,7 +1597,8 @@ def process_MicroID(etlInstance, dmInstance, inDF):
         inQuery = f"Select * FROM tlu_MicroHabitat';"
 
         # PUll the Micro Habitat Table
-        outDFMicroLookup = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+        outDFMicroLookup = dm.generalDMClass.readLookup(inQuery, "tlu_MicroHabitat", etlInstance.inDBBE,
+                                                        session=etlInstance.backendSession)
 
         # Ensure strings
         inDF['MICRO'] = inDF['MICRO'].astype(str)
@@ -49,19 +49,23 @@ class etl_SalmonidsElectro:
             ######
             # ETL Event/Survey/Observers
             ######
-            outDFEventSurvey = etl_SalmonidsElectro.process_Event_Electrofishing(outDFDic, etlInstance, dmInstance)
+            outDFEventSurvey = etlInstance.backendSession.runStage('process_Event_Electrofishing',
+                                                                   etl_SalmonidsElectro.process_Event_Electrofishing,
+                                                                   outDFDic, etlInstance, dmInstance)
             outDFEvent = outDFEventSurvey[0]
 
             ######
             # ETL Passes
             ######
-            outDFPass = etl_SalmonidsElectro.process_Pass_Electrofishing(outDFDic, outDFEvent, etlInstance,
-                                                                           dmInstance)
+            outDFPass = etlInstance.backendSession.runStage('process_Pass_Electrofishing',
+                                                            etl_SalmonidsElectro.process_Pass_Electrofishing, outDFDic,
+                                                            outDFEvent, etlInstance, dmInstance)
             ######
             # ETL Process Measurements
             ######
-            outDFMeasurements = etl_SalmonidsElectro.process_Measurements_Electrofishing(outDFDic, outDFEvent,
-                                                                                        etlInstance, dmInstance)
+            outDFMeasurements = etlInstance.backendSession.runStage('process_Measurements_Electrofishing',
+                                                                    etl_SalmonidsElectro.process_Measurements_Electrofishing,
+                                                                    outDFDic, outDFEvent, etlInstance, dmInstance)
             ######
             # ETL Process Counts (combined Measurements and Tallied) - Not populating the Summary data of Measurements
             # and Tally data to 'tblSummerCounts' as of 10/10/2024.  Table 'tblSummerCounts' is really a summary table
@@ -221,17 +225,13 @@ class etl_SalmonidsElectro:
                            f'CreatedBy, DataProcessingLevelID, DataProcessingLevelDate,DataProcessingLevelUser) '
                            f'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)')
 
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-            dm.generalDMClass.appendDataSet(cnxn, outDFEvent, "tblEvents", insertQuery,
-                                                        dmInstance)
+            # Append returning the GlobalID to EventID keys of the inserted events
+            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
+            outDFEventIDGlobalID = dm.generalDMClass.appendDataSet(cnxn, outDFEvent, "tblEvents", insertQuery,
+                                                                   dmInstance, returnKeys=('GlobalID', 'EventID'))
 
             ################
-            # Define the EventID Field via lookup
-
-            inQuery = (f"SELECT tblEvents.EventID, tblEvents.GlobalID FROM tblEvents"
-                       f" WHERE ((Not (tblEvents.GlobalID) Is Null));")
-
-            outDFEventIDGlobalID = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+            # Define the EventID Field via the inserted event keys
 
             # # Define the EventID via a join Global ID via lookup approach
             # outDFSubset2wEventID = dm.generalDMClass.applyLookupToDFField(dmInstance, outDFEventIDGlobalID,
@@ -292,7 +292,7 @@ class etl_SalmonidsElectro:
                            f'Conductivity, [Specific Conductance], NumberOfPasses) '
                            f'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)')
 
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
             dm.generalDMClass.appendDataSet(cnxn, outDFSurvey, "tblEfishSurveys", insertQuery,
                                             dmInstance)
 
@@ -314,7 +314,7 @@ class etl_SalmonidsElectro:
 
             insertQuery = f'INSERT INTO tblEventObservers (EventID, OBSCODE, CreatedDate) VALUES (?, ?, ?)'
 
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
             # Append the Contacts to the xref_EventContacts table
             dm.generalDMClass.appendDataSet(cnxn, outContactsDF, "tblEventObservers", insertQuery,
                                             dmInstance)
@@ -392,7 +392,7 @@ class etl_SalmonidsElectro:
             insertQuery = (f'INSERT INTO tblSummerPasses (EventID, QCFlag, QCNotes, Pass, PassType, Volts, [Time], '
                            f'Setting, Comments, CreatedDate) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)')
 
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
             # Append the Contacts to the xref_EventContacts table
             dm.generalDMClass.appendDataSet(cnxn, outDFPass2, "tblSummerPasses", insertQuery,
                                             dmInstance)
@@ -523,7 +523,7 @@ class etl_SalmonidsElectro:
                            f'CreatedDate, EventID, RandomSample) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, '
                            f'?, ?, ?, ?, ?, ?, ?, ?)')
 
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
             # Append the Contacts to the xref_EventContacts table
             dm.generalDMClass.appendDataSet(cnxn, inDFAppend_postQCVal, "tblSummerMeasurements", insertQuery,
                                             dmInstance)
@@ -812,12 +812,6 @@ class etl_SalmonidsElectro:
                                                  right_on='Composite',
                                                  how='left', suffixes=('', '_y'))
 
-            # Set the nan to None
-            cols_to_update = ['Comments', 'QCNotes']
-
-            for col in cols_to_update:
-                outDFCountswPasswComments[col] = dm.generalDMClass.nan_to_none(outDFCountswPasswComments[col])
-
             # Set 'QCFlag' value 'NoValue' to None prior to appending so Access doesn't have issue
             outDFCountswPasswComments.loc[outDFCountswPasswComments['QCFlag'] == 'NoValue', 'QCFlag'] = None
 
@@ -834,7 +828,7 @@ class etl_SalmonidsElectro:
                            f'PassType, Mortality, QCNotes, Comments, CreatedDate) '
                            f'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)')
 
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
             # Append the Contacts to the xref_EventContacts table
             dm.generalDMClass.appendDataSet(cnxn, outDFCountswPasswComments, "tblSummerCounts", insertQuery,
                                             dmInstance)
@@ -889,7 +883,8 @@ def process_SalmonidsContacts(inDF, etlInstance, dmInstance):
 
         # Import the tluObservers tables
         inQuery = f"SELECT * FROM tluObservers"
-        outDFtluObservers = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+        outDFtluObservers = dm.generalDMClass.readLookup(inQuery, "tluObservers", etlInstance.inDBBE,
+                                                         session=etlInstance.backendSession)
 
         # Define OBSCODE via join with Contacts Looks - migrated from applyLookuToDFField function on 11/14/2025
         inDFObserversDefined = pd.merge(inDFObserversParsed3, outDFtluObservers[['OBSCODE']], how='left',
@@ -47,14 +47,17 @@ class etl_SalmonidsSmolts:
             ######
             # ETL Event
             ######
-            outMethod = etl_SalmonidsSmolts.process_Event_Smolts(outDFDic, etlInstance, dmInstance)
+            outMethod = etlInstance.backendSession.runStage('process_Event_Smolts',
+                                                            etl_SalmonidsSmolts.process_Event_Smolts, outDFDic,
+                                                            etlInstance, dmInstance)
             outDFEvent = outMethod[0]
 
             ######
             # ETL Measurements
             ######
-            outMethod = etl_SalmonidsSmolts.process_repeat_Smolts(outDFDic, outDFEvent, etlInstance,
-                                                                              dmInstance)
+            outMethod = etlInstance.backendSession.runStage('process_repeat_Smolts',
+                                                            etl_SalmonidsSmolts.process_repeat_Smolts, outDFDic,
+                                                            outDFEvent, etlInstance, dmInstance)
             if outMethod == "Success":
                 logMsg = f'Successfully finished processing - ETL_Salmonids_Smolts.py - process_ETLSmolts'
                 logging.info(logMsg, exc_info=True)
@@ -186,20 +189,15 @@ class etl_SalmonidsSmolts:
                            f'DataProcessingLevelDate, DataProcessingLevelUser, SurveyType, Verified) '
                            f'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)')
 
-            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
-            dm.generalDMClass.appendDataSet(cnxn, outDFEventsOnly, "tblEvents", insertQuery, dmInstance)
+            # Append returning the GlobalID to EventID keys of the inserted events
+            cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
+            outDFwEVentID = dm.generalDMClass.appendDataSet(cnxn, outDFEventsOnly, "tblEvents", insertQuery, dmInstance,
+                                                            returnKeys=('GlobalID', 'EventID'))
 
             ##################
-            # Add the EventID via lookup field to the outDFSubset2
+            # Add the EventID via the inserted event keys to the outDFSubset2
             ################
 
-            # Read in the tluDevices lookup table
-            # Import Event Table to define the EventID via the GlobalID
-            inQuery = f"SELECT tblEvents.* FROM tblEvents;"
-
-            # Import Event Table with defined EventID
-            outDFwEVentID = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
-
             # Merge on the Event Data Frame to get the EventID via the ParentGlobalID - GlobalID fields
             outDFSubSet2wEventID = pd.merge(outDFSubset2, outDFwEVentID[['GlobalID', 'EventID']], how='left',
                                              left_on="GlobalID", right_on="GlobalID", suffixes=("_src", "_lk"))
@@ -418,7 +416,8 @@ def process_SalmonidsContacts(inDF, etlInstance, dmInstance):
 
         # Import the tluObservers tables
         inQuery = f"SELECT * FROM tluObservers"
-        outDFtluObservers = dm.generalDMClass.connect_to_AcessDB_DF(inQuery, etlInstance.inDBBE)
+        outDFtluObservers = dm.generalDMClass.readLookup(inQuery, "tluObservers", etlInstance.inDBBE,
+                                                         session=etlInstance.backendSession)
 
         # Define OBSCODE via join with Contacts Looks - migrated from applyLookuToDFField function on 11/14/2025
         inDFObserversDefined = pd.merge(inDFObserversParsed3, outDFtluObservers[['OBSCODE']], how='left',
@@ -543,7 +542,7 @@ def process_SalmonidsContacts(inDF, etlInstance, dmInstance):
 
         insertQuery = f'INSERT INTO tblEventObservers (EventID, OBSCODE, CreatedDate) VALUES (?, ?, ?)'
 
-        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
         # Append the Contacts to the xref_EventContacts table
         dm.generalDMClass.appendDataSet(cnxn, inDFObserverDefinedAll, "tblEventObservers", insertQuery,
                                         dmInstance)
@@ -630,25 +629,19 @@ def process_SalmonidsSurvey(inDF, etlInstance, dmInstance):
         inDFAppend = inDF[['EventID', 'LocationID', 'Weather', 'StageHeight', 'WaterTemp', 'Comments', 'MarkType1',
                            'TrapStatus', 'CreatedDate']]
 
-        # Update any 'nan' string or np.nan values to None to consistently handle null values. Having to do a second
-        # time, not sure why the initial time didn't accomplish this conversion to None.  Might not stick post defining
-        # of field types in the dm.generalDMClass.defineFieldTypesDF upstream workflow routine.
-
-        inDFAppend2 = inDFAppend.replace([np.nan, 'nan'], None)
-
         insertQuery = (f'INSERT INTO tblSmoltSurveys (EventID, LocationID, Weather, StageHeight, WaterTemp, Comments,'
                        f' MarkType1, TrapStatus, CreatedDate) VALUES'
                        f' (?, ?, ?, ?, ?, ?, ?, ?, ?)')
 
-        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
         # Append the Contacts to the xref_EventContacts table
-        dm.generalDMClass.appendDataSet(cnxn, inDFAppend2, "tblSmoltSurveys", insertQuery,
+        dm.generalDMClass.appendDataSet(cnxn, inDFAppend, "tblSmoltSurveys", insertQuery,
                                         dmInstance)
 
         logMsg = f"Success ETL_Salmonids_Smolts.py - process_SalmonidsSurvey."
         logging.info(logMsg)
 
-        return inDFAppend2
+        return inDFAppend
 
     except Exception as e:
 
@@ -677,10 +670,7 @@ def process_Measurements(inDF, etlInstance, dmInstance):
                            'PriorSeason', 'Injured', 'Dead', 'Scales', 'Tissue', 'EnvelopeID', 'Comments', 'QCFlag',
                            'QCNotes', 'CreatedDate']]
 
-        # Update any 'nan' string or np.nan values to None to consistently handle null values. Having to do a second
-        # time, not sure why the initial time didn't accomplish this conversion to None.  Might not stick post defining
-        # of field types in the dm.generalDMClass.defineFieldTypesDF upstream workflow routine.
-
+        # 'nan' strings to None so the LifeStage and FishTally defaults below are applied to all null values
         inDFAppend2 = inDFAppend.replace([np.nan, 'nan'], None)
 
         # Set where record have a LifeStage value of None to "NA" - added 6/4/2025
@@ -731,24 +721,21 @@ def process_Measurements(inDF, etlInstance, dmInstance):
         for col in num_cols:
             inDFAppend_postQCVal[col] = pd.to_numeric(inDFAppend_postQCVal[col], errors='coerce')
 
-        # One final time clean up all null values to None
-        inDFAppend_postQCVal2 = inDFAppend_postQCVal.replace([np.nan, 'nan'], None)
-
-        # Build the SQL query dynamically
-        cols = inDFAppend_postQCVal2.columns.tolist()
+        # Build the SQL query dynamically - null values are converted to None in the 'appendDataSet' payload
+        cols = inDFAppend_postQCVal.columns.tolist()
 
         insertQuery = (f"INSERT INTO tblSmoltMeasurements ({', '.join(cols)}) "
                        f"VALUES ({', '.join(['?'] * len(cols))})")
 
-        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
         # Append the Contacts to the xref_EventContacts table
-        dm.generalDMClass.appendDataSet(cnxn, inDFAppend_postQCVal2, "tblSmoltMeasurements", insertQuery,
+        dm.generalDMClass.appendDataSet(cnxn, inDFAppend_postQCVal, "tblSmoltMeasurements", insertQuery,
                                         dmInstance)
 
         logMsg = f"Success ETL_Salmonids_Smolts.py - process_Measurements."
         logging.info(logMsg)
 
-        return inDFAppend_postQCVal2
+        return inDFAppend_postQCVal
 
     except Exception as e:
 
@@ -807,16 +794,13 @@ def process_Counts(inDF, etlInstance, dmInstance):
             .reset_index()
         )
 
-        # Clean up all null values to None
-        inDF_grouped = inDF_grouped.replace([np.nan, 'nan'], None)
-
-        # Build the SQL query dynamically
+        # Build the SQL query dynamically - null values are converted to None in the 'appendDataSet' payload
         cols = inDF_grouped.columns.tolist()
 
         insertQuery = (f"INSERT INTO tblSmoltUnmeasured ({', '.join(cols)}) "
                        f"VALUES ({', '.join(['?'] * len(cols))})")
 
-        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE)
+        cnxn = dm.generalDMClass.connect_DB_Access(etlInstance.inDBBE, session=etlInstance.backendSession)
         # Append the Contacts to the xref_EventContacts table
         dm.generalDMClass.appendDataSet(cnxn, inDF_grouped, "tblSmoltUnmeasured", insertQuery,
                                         dmInstance)
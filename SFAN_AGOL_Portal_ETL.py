@@ -90,6 +90,15 @@ outDir = r'C:\Users\KSherrill\OneDrive - DOI\SFAN\VitalSigns\SpottedOwl\SPOW_IM\
 # processFeatureLayer method when set to 'No'
 AGOLDownload = 'No'  # ('Yes'|'No')
 
+# Cache the extracted AGOL/Portal export in the workspace, runs against an unchanged service (same last edit date/item
+# modified time) reuse the cached export rather than exporting again. Applies when AGOLDownload is 'Yes'.
+exportCache = 'Yes'  # ('Yes'|'No')
+
+# Feature layer extraction - 'Export' exports the item to CSV, 'Query' queries the feature service layers directly in
+# concurrent ObjectID ranges (no export job on the portal), 'Incremental' queries only the features created/edited
+# since the last successful run (EditDate/ObjectID watermark) and merges them with the local copy in the workspace.
+extractMode = 'Export'  # ('Export'|'Query'|'Incremental')
+
 # Directory where exported photos (if applicable) from survey 123 will be exported (SFAN Azure, Local Directory, etc.)
 # Recommend downloading photos locally then posting to the server afterwards due to slow transfer during processing if
 # you push to the server.
@@ -99,6 +108,30 @@ photoDir = r'C:\Users\KSherrill\OneDrive - DOI\SFAN\VitalSigns\Pinnipeds\Data\ET
 # will process both Molt and all other not Breeding Season.
 elephantSeason = 'Breeding' # 'Breeding|Molt|All'
 
+# Backend transaction scope - 'No' each processing step commits on its own, 'Run' the full run is one transaction (all
+# or nothing), 'Stage' each protocol stage is one transaction and a failure only rolls back the failed stage.
+unitOfWork = 'No'  # ('No'|'Run'|'Stage')
+
+# Snapshot the lookup tables in the workspace, repeat runs reuse the snapshot for the lookup tables unchanged in the
+# backend rather than reading them again. Requires pyarrow.
+lookupSnapshot = 'Yes'  # ('Yes'|'No')
+
+# Copy the backend tables joined during the run to a local SQLite read mirror in the workspace and serve the read-only
+# queries on them locally rather than over ODBC (Pinnipeds Elephant Seal). Useful when the backend is on a file share.
+readMirror = 'No'  # ('Yes'|'No')
+
+# Index advisor - 'Report' logs the backend fields joined/filtered on during the run which have no index, 'Create' also
+# creates the missing indexes (maintenance mode - run when no one else has the backend open).
+indexAdvisor = 'Report'  # ('No'|'Report'|'Create')
+
+# Bulk load the table appends via the Access engine from CSV files written to the workspace (INSERT ... SELECT FROM
+# [Text;...]) rather than sending each value over ODBC. Appends not supported by the text driver use the ODBC append.
+bulkTextImport = 'No'  # ('Yes'|'No')
+
+# Start the AGOL/Portal export and read the lookup/reference tables used by the prior run concurrently on a thread pool
+# at startup, the protocol stages wait only on the data they need.
+prefetch = 'Yes'  # ('Yes'|'No')
+
 
 def main():
     logger = logging.getLogger(__name__)
@@ -124,7 +157,11 @@ def main():
         # Create the etlInstance instance
         etlInstance = etl.etlInstance(protocol=protocol, inDBBE=inDBBE, inDBFE=inDBFE, flID=layerID, yearLU=inYear,
                                       inUser=inUser, outDir=outDir, AGOLDownload=AGOLDownload, photoDir=photoDir,
-                                      elephantSeason = elephantSeason)
+                                      elephantSeason = elephantSeason, unitOfWork=unitOfWork,
+                                      lookupSnapshot=lookupSnapshot, readMirror=readMirror,
+                                      indexAdvisor=indexAdvisor, bulkTextImport=bulkTextImport,
+                                      prefetch=prefetch, exportCache=exportCache,
+                                      extractMode=extractMode)
         # Print the name space of the instance
         print(etlInstance.__dict__)
 
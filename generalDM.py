@@ -6,14 +6,43 @@ import os.path
 import sys
 from datetime import datetime
 import traceback
-import pyodbc
 import pandas as pd
-import win32com.client
 import logging
-import psutil
 from zipfile import ZipFile
 import glob
 import numpy as np
+import threading
+import re
+from contextlib import contextmanager
+from collections import OrderedDict, namedtuple
+import json
+import hashlib
+import time
+import decimal
+import sqlite3
+import csv
+import tempfile
+import shutil
+from concurrent.futures import Future
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # Optional - on disk lookup snapshots are disabled without pyarrow
+    feather = None
+
+# Access backend drivers - Windows only, the SQLite backend (see 'sqliteBackend') runs without them
+try:
+    import pyodbc
+except ImportError:
+    pyodbc = None
+try:
+    import win32com.client
+except ImportError:
+    win32com = None
+try:
+    import psutil
+except ImportError:
+    psutil = None
 
 class generalDMClass:
 
@@ -101,105 +130,507 @@ class generalDMClass:
 
         return messageTime
 
-    def connect_DB_Access(inDB):
+    def connect_DB_Access(inDB, session=None):
         """
-        Create connection to Access Database Via PYODBC connection.
+        Create connection to the backend database - Access via PYODBC, SQLite via the pyodbc compatible wrapper (see
+        'getBackend').  If a backend session is passed the connection is checked out of the session pool, closing the
+        returned connection returns it to the pool.
 
         :param inDB: Full path and name to access database
+        :param session: Optional backendSession instance with pooled connections for the run
 
         :return: cnxn: ODBC connection to access database
         """
 
-        connStr = (r"DRIVER={Microsoft Access Driver (*.mdb, *.accdb)};DBQ=" + inDB + ";")
-        cnxn = pyodbc.connect(connStr)
+        if session is not None:
+            return session.getConnection(inDB)
+
+        cnxn = generalDMClass.getBackend(inDB).connect(inDB)
         return cnxn
 
-    def getLookUpValueAccess(self, cnxn, lookupTable, lookupField, lookupValue, lookupFieldValueFrom):
+    def getBackend(inDB):
         """
-        Find value in a lookup table using the passed variables, using a distinct clause expecting this to be used for
-        a lookup table situation.
+        Backend implementation for the passed backend path, selected by the file extension (.accdb/.mdb Access,
+        .sqlite/.sqlite3/.db SQLite).  Defaults to Access.
 
-        :param instance: pass instance with relevant information
-        :param cnxn: ODBC connection to access database
-        :param lookupTable: lookup table in the cnxn database
-        :param lookupField: field in the lookupTable to lookup
-        :param lookupValueOut: values in the lookupField to be looked up
-        :param lookupFieldValueFrom: field in the lookupTable from which to pull the lookup value
+        :param inDB: Full path and name to the backend database
 
-        :return: lookupValueOut: String with the lookup value
+        :return: Backend class (accessBackend|sqliteBackend)
         """
-        query = f"Select Distinct {lookupFieldValueFrom} from {lookupTable} Where {lookupField} = '{lookupValue}';"
 
-        #Should be single value so will be series
-        lookupValueDF = pd.read_sql(query, cnxn)
+        for backend in backendTypes:
+            if str(inDB).lower().endswith(backend.extensions):
+                return backend
 
-        #No value returned in lookup table - exit script
-        if lookupValueDF.shape[0] == 0:
-            logMsg = f'WARNING - No value returned in lookup table for - {lookupValue} - EXITING script at - getLookUpValueAccess'
-            generalDMClass.messageLogFile(dmInstance, logMsg=logMsg)
-            sys.exit()
+        return accessBackend
+
+    def createBackendFromSchema(inDB, schemaScript):
+        """
+        Create a backend from a schema script (see 'exportSchemaScript'), used to build a local SQLite backend so the
+        protocol workflows can be run and timed without Access.
+
+        :param inDB: Full path and name to the backend being created (.sqlite)
+        :param schemaScript: Path to the schema script or the script text
+
+        :return: inDB
+        """
+
+        backend = generalDMClass.getBackend(inDB)
+        if not backend.schemaCreate:
+            supported = [extension for backendType in backendTypes if backendType.schemaCreate
+                         for extension in backendType.extensions]
+            raise ValueError(f"{backend.name} backends can't be created from a schema script - {inDB} - supported"
+                             f" backend extensions: {', '.join(supported)}")
+
+        return backend.createBackend(inDB, schemaScript)
+
+    def exportSchemaScript(inDB, outPath, session=None, dataTables=()):
+        """
+        Write the schema (tables, fields and indexes) of a backend to a schema script in Access DDL, optionally with
+        the records of the passed (lookup) tables as INSERT statements.  The script builds a SQLite backend via
+        'createBackendFromSchema'.  Staging tables and saved queries are not exported.
+
+        :param inDB: Full path and name to the backend database
+        :param outPath: Path to the schema script written
+        :param session: Optional backendSession instance with pooled connections for the run
+        :param dataTables: List of the tables exported with their records
+
+        :return: outPath
+        """
+
+        def sqlLiteral(value):
+            if value is None or (isinstance(value, float) and np.isnan(value)):
+                return 'NULL'
+            if isinstance(value, (bool, np.bool_)):
+                return str(int(value))
+            if isinstance(value, (int, np.integer)):
+                return str(int(value))
+            if isinstance(value, (float, decimal.Decimal, np.floating)):
+                return repr(float(value))
+            if isinstance(value, datetime):
+                return f"'{value.isoformat(' ')}'"
+            return "'" + str(value).replace("'", "''") + "'"
+
+        catalog = generalDMClass.getCatalog(inDB, session=session)
+        statements = []
+        for tableName, tableType in sorted(catalog.getTables().values()):
+            if tableType != 'TABLE' or tableName.startswith((backendSession.stagingPrefix, 'MSys', '~')):
+                continue
+
+            fields = []
+            for record in catalog.getColumns(tableName):
+                ddlType = 'COUNTER' if record['typeName'] == 'COUNTER' else \
+                    catalog.getDDLType(tableName, record['columnName'])
+                fields.append(f"[{record['columnName']}] {ddlType}")
+            statements.append(f"CREATE TABLE [{tableName}] (" + ", ".join(fields) + ");")
+
+            counters = [record['columnName'] for record in catalog.getColumns(tableName)
+                        if record['typeName'] == 'COUNTER']
+            for indexName, indexColumns in catalog.getIndexes(tableName).items():
+                if indexColumns == counters:
+                    continue  # Autonumber primary key
+                indexFields = ", ".join([f"[{column}]" for column in indexColumns])
+                statements.append(f"CREATE INDEX [{indexName}] ON [{tableName}] ({indexFields});")
+
+        for tableName in dataTables:
+            for chunk in generalDMClass.readQuery(f"SELECT * FROM [{tableName}];", inDB, session=session,
+                                                  chunksize=5000):
+                fields = ", ".join([f"[{column}]" for column in chunk.columns])
+                for record in chunk.to_numpy(dtype=object, na_value=None).tolist():
+                    values = ", ".join([sqlLiteral(value) for value in record])
+                    statements.append(f"INSERT INTO [{tableName}] ({fields}) VALUES ({values});")
+
+        with open(outPath, 'w', encoding='utf-8') as scriptFile:
+            scriptFile.write("\n".join(statements) + "\n")
+
+        logMsg = f'Exported schema script for {inDB} to {outPath} - {len(statements)} statement(s)'
+        logging.info(logMsg)
+
+        return outPath
+
+    def getCatalog(inDB, session=None):
+        """
+        Backend catalog snapshot (tables, saved queries, columns and indexes) for the passed backend.  With a backend
+        session the run level snapshot is returned, otherwise a new snapshot is created.
+
+        :param inDB: Full path and name to access database
+        :param session: Optional backendSession instance with pooled connections for the run
+
+        :return: backendCatalog instance
+        """
+
+        if session is not None:
+            return session.getCatalog(inDB)
+
+        return backendCatalog(inDB)
+
+    def invalidateCatalog(inDB, session=None, inQuery=None):
+        """
+        Invalidate the run level catalog snapshot after DDL. No action without a backend session.
+
+        :param inDB: Full path and name to access database
+        :param session: Optional backendSession instance with pooled connections for the run
+        :param inQuery: Optional SQL statement executed, snapshot only invalidated when the statement is DDL
+
+        :return:
+        """
+
+        if session is not None:
+            session.invalidateCatalog(inDB, inQuery=inQuery)
+
+    def readLookup(query, lookupTable, inDB, session=None):
+        """
+        Read a lookup table query via the process lookup cache (see 'lookupCache'), the backend is only hit on the
+        first read or after the table has been written/the backend file has changed.
+
+        :param query: Query reading the lookup table
+        :param lookupTable: Lookup table read by the query
+        :param inDB: Full path and name to access database
+        :param session: Optional backendSession instance with pooled connections for the run
+
+        :return: outDF: Lookup dataframe
+        """
+
+        return backendLookups.read(query, lookupTable, inDB, session=session)
+
+    def invalidateLookups(inDB=None, tableName=None, inQuery=None, session=None, insertOnly=False,
+                          insertedRecords=None):
+        """
+        Invalidate the cached lookups, the run key resolvers and the read mirror tables after a write to the backend.
+
+        :param inDB: Full path and name to access database, None all backends
+        :param tableName: Table written, None all tables
+        :param inQuery: Optional SQL statement executed, only the tables named in the statement are invalidated
+        :param session: Optional backendSession instance with the run key resolvers and read mirror
+        :param insertOnly: True if records were only appended, key resolvers pick up the new keys incrementally
+        :param insertedRecords: Optional (columns, records) appended, applied to the read mirror (see 'readMirror')
+
+        :return:
+        """
+
+        if inQuery is not None:
+            backendLookups.invalidateStatement(inDB, inQuery)
+        else:
+            backendLookups.invalidate(inDB, tableName)
+
+        if session is not None:
+            session.invalidateKeyResolvers(inDB, tableName=tableName, inQuery=inQuery, insertOnly=insertOnly)
+            session.invalidateMirror(inDB, tableName=tableName, inQuery=inQuery, insertOnly=insertOnly,
+                                     insertedRecords=insertedRecords)
+
+    def loadLookupSnapshot(inDB, snapshotDir, session=None):
+        """
+        Attach an on disk lookup snapshot (see 'lookupSnapshot') for the backend to the process lookup cache and load
+        the lookups which are unchanged since the prior run.  Lookups read during the run are saved to the snapshot.
+
+        :param inDB: Full path and name to access database
+        :param snapshotDir: Directory the snapshots are saved to (e.g. the run workspace)
+        :param session: Optional backendSession instance with pooled connections for the run
+
+        :return: Number of lookups loaded from the snapshot
+        """
+
+        if not lookupSnapshot.available():
+            logMsg = f'pyarrow not installed - lookup snapshot disabled for - {inDB}'
+            logging.info(logMsg)
+            return 0
+
+        try:
+            snapshot = lookupSnapshot(snapshotDir, inDB, session=session)
+            backendLookups.snapshots[inDB] = snapshot
+            return snapshot.load(backendLookups)
+
+        except Exception as e:
+            logMsg = f'WARNING - Unable to load the lookup snapshot for - {inDB} - lookups read from the backend: {e}'
+            logging.warning(logMsg)
+            backendLookups.snapshots.pop(inDB, None)
+            return 0
+
+    def submitDaemon(threadName, function, *args):
+        """
+        Run a function on a daemon thread (e.g. the AGOL/Portal export prefetch).  Unlike the prefetch pool threads, a
+        daemon thread isn't joined when the interpreter exits, so a failed run exits without waiting on the export.
+
+        :param threadName: Name of the thread
+        :param function: Function run on the thread
+        :param args: Positional arguments passed to the function
+
+        :return: future: Future with the function return value or exception
+        """
+
+        future = Future()
+
+        def runFunction():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(function(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=runFunction, name=threadName, daemon=True).start()
+
+        return future
+
+    def prefetchLookups(inDB, prefetchPath, executor):
+        """
+        Start reading the lookup/reference table queries read by the prior run (see 'saveLookupPrefetch') on the
+        passed thread pool, so the reads overlap the AGOL/Portal export.  Protocol reads of a prefetched lookup wait
+        on the prefetch (see 'lookupCache.read').
+
+        :param inDB: Full path and name to access database
+        :param prefetchPath: JSON file with the lookup queries read by the prior run
+        :param executor: concurrent.futures executor the reads are submitted to
+
+        :return: Number of lookups prefetched
+        """
+
+        if not os.path.exists(prefetchPath):
+            return 0
+
+        try:
+            with open(prefetchPath, 'r') as prefetchFile:
+                lookupQueries = json.load(prefetchFile)
+
+            futures = [backendLookups.prefetch(query, lookupTable, inDB, executor)
+                       for lookupTable, query in lookupQueries]
+            prefetchCount = len([future for future in futures if future is not None])
+
+            logMsg = f'Prefetching {prefetchCount} lookup(s) for - {inDB}'
+            logging.info(logMsg)
+            return prefetchCount
+
+        except Exception as e:
+            logging.warning(f'Unable to prefetch the lookups in - {prefetchPath} - {e}')
+            return 0
+
+    def saveLookupPrefetch(inDB, prefetchPath):
+        """
+        Save the lookup/reference table queries read by the run, prefetched by the next run (see 'prefetchLookups').
+
+        :param inDB: Full path and name to access database
+        :param prefetchPath: JSON file the lookup queries are saved to
+
+        :return: Number of lookup queries saved
+        """
+
+        lookupQueries = backendLookups.usedQueries(inDB)
+        try:
+            os.makedirs(os.path.dirname(prefetchPath), exist_ok=True)
+            with open(prefetchPath, 'w') as prefetchFile:
+                json.dump(lookupQueries, prefetchFile, indent=1)
+        except OSError as e:
+            logging.warning(f'Unable to save the lookup prefetch list - {prefetchPath} - {e}')
+            return 0
+
+        return len(lookupQueries)
 
-        #Convert lookup to series
-        lookupValueSeries = lookupValueDF.iloc[0]
+    def lookup_many(inDB, lookupTable, lookupField, values, lookupFieldValueFrom, session=None):
+        """
+        Resolve many values against a lookup table with a single (cached) read of the lookup table rather than a
+        query per value.
+
+        :param inDB: Full path and name to access database
+        :param lookupTable: Lookup table in the backend
+        :param lookupField: Field in the lookupTable being matched to the values
+        :param values: Values to be looked up
+        :param lookupFieldValueFrom: Field in the lookupTable from which to pull the lookup value
+        :param session: Optional backendSession instance with pooled connections for the run
+
+        :return: outDic: Dictionary value: lookup value, values not in the lookup table are not returned
+        """
 
-        #Convert the series values to a string
-        lookupValueSeriesStr = lookupValueSeries.astype(str)
+        query = f"SELECT DISTINCT [{lookupField}], [{lookupFieldValueFrom}] FROM [{lookupTable}];"
+        lookupDF = generalDMClass.readLookup(query, lookupTable, inDB, session=session)
 
-        lookupValueOut = lookupValueSeriesStr.str.cat(sep=', ')
+        lookupDF = lookupDF.drop_duplicates(subset=lookupField)
+        lookupDic = dict(zip(lookupDF[lookupField], lookupDF[lookupFieldValueFrom]))
 
-        return lookupValueOut
+        return {value: lookupDic[value] for value in values if value in lookupDic}
 
-    def connect_to_AcessDB_DF(query, inDB):
+    def connect_to_AcessDB_DF(query, inDB, session=None):
 
         """
-        Connect to Access DB via PYODBC and perform defined query via pyodbc - return query in a dataframe
+        Connect to Access DB via PYODBC and perform defined query via pyodbc - return query in a dataframe.  Query is
+        read via the streaming typed reader (see 'readQuery').
 
         :param query: query to be processed
         :param inDB: path to the access database being hit
+        :param session: Optional backendSession instance with pooled connections for the run
 
         :return: queryDf: query output dataframe
         """
-        connStr = (r"DRIVER={Microsoft Access Driver (*.mdb, *.accdb)};DBQ=" + inDB + ";")
-        cnxn = pyodbc.connect(connStr)
 
         try:
-            queryDf = pd.read_sql(query, cnxn)
+            queryDf = generalDMClass.readQuery(query, inDB, session=session)
 
         except Exception as e:
+            logMsg = f"WARNING Error in 'connect_to_AccessDB_DF' for - {query} - {e}"
+            logging.critical(logMsg, exc_info=True)
+            traceback.print_exc(file=sys.stdout)
+            sys.exit(1)
 
-            # Check if 'queryDf' imported try and import via ODBC cursor
-            if 'queryDf' in locals() or 'queryDf' in globals():
-                print("Variable 'queryDf' exists - imported via read_sql")
-            else:
-                print("Variable 'queryDf' does not exist - try and import query via pyodbc cursor")
-                cursor = cnxn.cursor()
+        return queryDf
 
-                # Execute the query
-                cursor.execute(query)
+    def readMirrored(query, tables, inDB, session=None, params=None):
+        """
+        Read-only query served from the session read mirror (see 'readMirror') when all the tables read are
+        mirrored, else read from the backend.  The query must be portable between Access and SQLite (no Access
+        functions or '&' concatenation) and dates/yes-no fields are returned as SQLite text/integers from the mirror.
 
-                # Fetch all rows from the query
-                rows = cursor.fetchall()
+        :param query: Query to be processed
+        :param tables: List of the tables read by the query
+        :param inDB: Full path and name to access database
+        :param session: Optional backendSession instance with pooled connections and the read mirror for the run
+        :param params: Optional query parameters
 
-                # Fetch the column names from the cursor description
-                columns = [column[0] for column in cursor.description]
+        :return: queryDf: Query dataframe
+        """
 
-                # Create a DataFrame from the fetched rows and column names
-                queryDf = pd.DataFrame.from_records(rows, columns=columns)
-                cursor.close()
-                logMsg = "Import query - {query} via PYODBC - Cursor rather then pd.read_sql"
-                logging.info(logMsg, exc_info=True)
+        mirror = session.getMirror(inDB, tables) if session is not None else None
+        if mirror is not None:
+            return mirror.read(query, tables, params=params)
 
+        return generalDMClass.readQuery(query, inDB, session=session, params=params)
 
-            print(f"WARNING Error in 'connect_to_AccessDB_DF' for - {query} - {e}")
-            logging.critical(logMsg, exc_info=True)
-            exit()
+    def readQuery(query, inDB, session=None, params=None, chunksize=None, fetchSize=5000):
+        """
+        Streaming typed query reader.  Records are fetched in 'fetchSize' blocks (cursor.fetchmany) into per column
+        arrays typed from the cursor description, rather than loading the full result as Python row objects.  The
+        rows, bytes and time of the query are logged and added to the backend session read counts.
+
+        :param query: Query to be processed
+        :param inDB: Full path and name to access database
+        :param session: Optional backendSession instance with pooled connections for the run
+        :param params: Optional query parameters
+        :param chunksize: If defined an iterator of dataframes with 'chunksize' records is returned
+        :param fetchSize: Number of records per fetchmany call
+
+        :return: queryDf: Query dataframe, or an iterator of dataframes if chunksize
+        """
+
+        frames = generalDMClass.iterQuery(query, inDB, session=session, params=params, chunksize=chunksize,
+                                          fetchSize=fetchSize)
+        if chunksize:
+            return frames
+
+        queryDf = next(frames)
+        frames.close()
+
+        return queryDf
+
+    def iterQuery(query, inDB, session=None, params=None, chunksize=None, fetchSize=5000):
+        """
+        Generator of typed dataframes for a query (see 'readQuery'), a single dataframe if no chunksize.
+        """
+
+        startTime = time.perf_counter()
+        rowCount = 0
+        byteCount = 0
+
+        if session is not None:
+            session.adviseStatement(inDB, query)
 
+        cnxn = generalDMClass.connect_DB_Access(inDB, session=session)
+        try:
+            cursor = cnxn.cursor()
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
 
+            for queryDf in generalDMClass.fetchTyped(cursor, chunksize=chunksize, fetchSize=fetchSize):
+                rowCount += len(queryDf)
+                byteCount += int(queryDf.memory_usage(index=False, deep=True).sum())
+                yield queryDf
+
+            cursor.close()
 
         finally:
             cnxn.close()
-            return queryDf
 
+            seconds = time.perf_counter() - startTime
+            if session is not None:
+                session.recordRead(rowCount, byteCount, seconds)
+
+            logMsg = (f'Read {rowCount} record(s) - {byteCount / 1048576:.2f} MB - {seconds:.2f} seconds -'
+                      f' {" ".join(query.split())[:100]}')
+            logging.info(logMsg)
+
+    def fetchTyped(cursor, chunksize=None, fetchSize=5000):
+        """
+        Generator of typed dataframes from an executed cursor.  Records are fetched via 'fetchmany' into per column
+        lists and converted to typed arrays (see 'typedArray') per dataframe.
+
+        :param cursor: Executed ODBC cursor
+        :param chunksize: Records per dataframe, if None a single dataframe is returned (empty if no records)
+        :param fetchSize: Number of records per fetchmany call
+
+        :return: Generator of dataframes
+        """
+
+        columns = [column[0] for column in cursor.description]
+        typeCodes = [column[1] for column in cursor.description]
+        values = [[] for _ in columns]
+
+        def buildFrame(rowCount):
+            frame = pd.DataFrame({index: generalDMClass.typedArray(columnValues[:rowCount], typeCode)
+                                  for index, (columnValues, typeCode) in enumerate(zip(values, typeCodes))})
+            frame.columns = columns
+            for columnValues in values:
+                del columnValues[:rowCount]
+            return frame
+
+        while True:
+            rows = list(cursor.fetchmany(fetchSize))
+            if not rows:
+                break
+
+            for columnValues, fetched in zip(values, zip(*rows)):
+                columnValues.extend(fetched)
+
+            # Drivers without column types in the description (SQLite) - type from the first non null value
+            for index, typeCode in enumerate(typeCodes):
+                if typeCode is None:
+                    typeCodes[index] = next((type(value) for value in values[index] if value is not None), None)
+
+            while chunksize and len(values[0]) >= chunksize:
+                yield buildFrame(chunksize)
+
+        if not chunksize or values[0]:
+            yield buildFrame(len(values[0]) if values else 0)
+
+    def typedArray(values, typeCode):
+        """
+        Typed array for a column of query values from the cursor description type.  Follows the pandas read_sql
+        types - integers with nulls as float64, booleans with nulls and unknown types as object.
+
+        :param values: List of column values
+        :param typeCode: Python type from the cursor description (int, float, bool, str, datetime, Decimal)
+
+        :return: Array of the values
+        """
+
+        hasNull = any(value is None for value in values)
+
+        if typeCode is int and not hasNull:
+            return np.array(values, dtype='int64')
+
+        if typeCode in (int, float, decimal.Decimal):
+            return np.array([np.nan if value is None else float(value) for value in values], dtype='float64')
+
+        if typeCode is bool and not hasNull:
+            return np.array(values, dtype=bool)
+
+        if typeCode is datetime:
+            try:
+                return pd.to_datetime(values).to_numpy()
+            except (ValueError, OverflowError, pd.errors.OutOfBoundsDatetime):
+                pass  # Dates out of the pandas range are returned as objects
+
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return array
 
     def closeAccessDB():
         """
@@ -208,6 +639,9 @@ class generalDMClass:
         :return: outClose - string denoting successfully closing of all access DBs.
         """
 
+        if psutil is None:
+            return "Access process check skipped - psutil not installed"
+
         try:
             # Find and close all Microsoft Access processes
             for proc in psutil.process_iter(['pid', 'name']):
@@ -238,116 +672,149 @@ class generalDMClass:
 
 
 
-    def queryExistsDeleteODBC(queryName, inDBPath):
+    def queryExistsDeleteODBC(queryName, inDBPath, session=None):
         """
-        Check if query exists in the database MSysObjects table.  Must have Admin permissions to read 'MSys tables
+        Check if query exists in the database via the backend catalog snapshot (ODBC catalog functions, no 'MSys'
+        table permissions required).
 
         :param queryName: Name of query being pushed, will deleted first if exists
         :param inDBPath: path to database
+        :param session: Optional backendSession instance with pooled connections for the run
 
         :return: query_exists: Variable defines if query exists on not (True|False)
         """
-        inQuery = f"Select * FROM MSysObjects WHERE [Name] = '{queryName}';"
 
-        outDFQueries = generalDMClass.connect_to_AcessDB_DF(inQuery, inDBPath)
-
-        if len(queryName) > 0:
-            query_exists = True
-        else:
-            query_exists = False
+        query_exists = generalDMClass.getCatalog(inDBPath, session=session).queryExists(queryName)
 
         return query_exists
 
 
-    def queryExistsDelete(queryName, inDBPath):
+    def queryExistsDelete(queryName, inDBPath, session=None):
         """
-        Check if query exists in the database if yes delete, using pywin32 to hit the Access COM interface, ODBC
-        doesn't have permissions to hit the 'MSYS' variables
+        Check if the saved query exists in the database and if yes delete it.  Existence is checked in the backend
+        catalog snapshot (select queries are views, action queries procedures) and the query is dropped via DROP
+        VIEW/DROP PROCEDURE on the session connection.  The Access COM interface is only started if the drop statement
+        fails.
 
         :param queryName: Name of query being pushed, will deleted first if exists
         :param inDBPath: path to database
+        :param session: Optional backendSession instance with pooled connections for the run
 
         :return:
         """
-        # Initialize the Access application
-        access_app = win32com.client.Dispatch('Access.Application')
 
-        # Open the Access database
-        access_app.OpenCurrentDatabase(inDBPath)
-
-        # Get the current database object
-        db = access_app.CurrentDb()
+        catalog = generalDMClass.getCatalog(inDBPath, session=session)
+        if catalog.queryExists(queryName):
+            dropQuery = f"DROP VIEW [{queryName}];"
+        elif catalog.procedureExists(queryName):
+            dropQuery = f"DROP PROCEDURE [{queryName}];"
+        else:
+            print(f"Query '{queryName}' does not exist in the database.")
+            return
 
-        try:
-            # Check if the query exists before attempting to delete it
-            query_exists = False
-            for query in db.QueryDefs:
-                if query.Name == queryName:
-                    query_exists = True
-                    break
-
-            if query_exists:
-                # Delete the query
-                db.QueryDefs.Delete(queryName)
-                print(f"Query '{queryName}' has been deleted from the database.")
-            else:
-                print(f"Query '{queryName}' does not exist in the database.")
-        except Exception as e:
-            print(f"An error occurred: {e}")
-        finally:
-            # Close the database and quit Access
-            access_app.CloseCurrentDatabase()
-            access_app.Quit()
+        if generalDMClass.executeDDL(dropQuery, inDBPath, session=session):
+            print(f"Query '{queryName}' has been deleted from the database.")
+            return
 
-        # Clean up COM objects
-        del access_app
+        if generalDMClass.getBackend(inDBPath).comDDL:
+            generalDMClass.runCOM(inDBPath, f"Delete query {queryName}", lambda db: db.QueryDefs.Delete(queryName),
+                                  session=session)
 
-    def pushQuery(inQuerySel, queryName, inDBPath):
+    def pushQuery(inQuerySel, queryName, inDBPath, session=None):
         """
-        Push SQL query defined in 'inQuerySel' to the output query 'queryName'. Uses PyWin32 library.
+        Push SQL query defined in 'inQuerySel' to the output query 'queryName' - select queries via CREATE VIEW, action
+        queries via CREATE PROCEDURE on the session connection.  The Access COM interface (PyWin32) is only started if
+        the create statement fails.
 
         :param inQuerySel: SQL Query defining the query to be pushed back to the backend instance
         :param queryName: Name of query being pushed, will deleted first if exists
         :param inDBPath: path to database
+        :param session: Optional backendSession instance with pooled connections for the run
 
         :return:
         """
-        # Initialize the Access application
-        access_app = win32com.client.Dispatch('Access.Application')
 
-        # Open the Access database
-        access_app.OpenCurrentDatabase(inDBPath)
+        if re.match(r'\s*(SELECT|TRANSFORM|\()', inQuerySel, re.IGNORECASE):
+            createQuery = f"CREATE VIEW [{queryName}] AS {inQuerySel}"
+        else:
+            createQuery = f"CREATE PROCEDURE [{queryName}] AS {inQuerySel}"
+
+        if generalDMClass.executeDDL(createQuery, inDBPath, session=session):
+            print(f"Query '{queryName}' has been created in the database.")
+            return
+
+        if generalDMClass.getBackend(inDBPath).comDDL:
+            generalDMClass.runCOM(inDBPath, f"Create query {queryName}",
+                                  lambda db: db.CreateQueryDef(queryName, inQuerySel), session=session)
+
+    def executeDDL(inQuery, inDBPath, session=None):
+        """
+        Execute a DDL statement (create/drop view, procedure or table) on the session connection.  Unlike 'excuteQuery'
+        a failure is returned rather than exiting, so the caller can fall back to the Access COM interface.
+
+        :param inQuery: DDL statement
+        :param inDBPath: path to database
+        :param session: Optional backendSession instance with pooled connections for the run
 
-        # Get the current database object
-        db = access_app.CurrentDb()
+        :return: True if the statement was executed
+        """
 
+        cnxn = generalDMClass.connect_DB_Access(inDBPath, session=session)
         try:
-            # Create the new query
-            new_query = db.CreateQueryDef(queryName, inQuerySel)
-            print(f"Query '{queryName}' has been created in the database.")
-        except Exception as e:
-            print(f"An error occurred: {e}")
+            cursor = cnxn.cursor()
+            cursor.execute(inQuery)
+            cnxn.commit()
+            cursor.close()
+        except backendErrors as e:
+            logMsg = f'DDL statement failed - {inQuery[:100]}: {e}'
+            logging.warning(logMsg)
+            return False
         finally:
-            # Close the database and quit Access
-            access_app.CloseCurrentDatabase()
-            access_app.Quit()
+            cnxn.close()
+
+        generalDMClass.invalidateCatalog(inDBPath, session=session, inQuery=inQuery)
+        generalDMClass.invalidateLookups(inDBPath, inQuery=inQuery, session=session)
+
+        return True
 
-        # Clean up COM objects
-        del access_app
+    def runCOM(inDBPath, operationName, operation, session=None):
+        """
+        Run an Access COM operation (see 'accessCOMBatch').  With a backend session the operation is queued and run
+        with the other COM operations of the run in one Access session when the backend session closes, in the order
+        queued (a queued delete runs before a later create of the same query), otherwise Access is started for the
+        operation.  The session catalog is invalidated once the queued operations have run, until then it reports the
+        backend as it is.
+
+        :param inDBPath: path to database
+        :param operationName: Operation description used in the log
+        :param operation: Function called with the Access CurrentDb object
+        :param session: Optional backendSession instance, COM operations are batched for the run
+
+        :return:
+        """
+
+        if session is not None:
+            session.comBatch.queue(inDBPath, operationName, operation)
+            return
+
+        comBatch = accessCOMBatch()
+        comBatch.queue(inDBPath, operationName, operation)
+        comBatch.run()
 
-    def pushQueryODBC (inQuerySel, queryName, inDBPath):
+    def pushQueryODBC (inQuerySel, queryName, inDBPath, session=None):
         """
         Push SQL query defined in 'inQuerySel' to the output query 'queryName'. Using an ODBC Connection
 
         :param inQuerySel: SQL Query defining the query to be pushed back to the backend instance
         :param queryName: Name of query being pushed, will deleted first if exists
         :param inDBPath: path to database
+        :param session: Optional backendSession instance with pooled connections for the run
 
         :return:
         """
 
         # Connect via ODBC to Access Database
-        cnxn = generalDMClass.connect_DB_Access(inDBPath)
+        cnxn = generalDMClass.connect_DB_Access(inDBPath, session=session)
 
         # Create a cursor object
         cursor = cnxn.cursor()
@@ -358,6 +825,7 @@ class generalDMClass:
         try:
             cursor.execute(fullQuery)
             cnxn.commit()
+            generalDMClass.invalidateCatalog(inDBPath, session=session)
             logMsg = f"Query '{queryName}' has been created in the database."
             print(logMsg)
             logging.info(logMsg, exc_info=True)
@@ -368,7 +836,7 @@ class generalDMClass:
         # Close the connection
         cnxn.close()
 
-    def excuteQuery(inQuery, inDBBE):
+    def excuteQuery(inQuery, inDBBE, session=None):
         """
         Routine runs a defined SQL Query in the passed database, Query will be performing an 'Update', 'Append'
         or 'Make Table'.  Query is not retained in the database only is executed.
@@ -376,11 +844,15 @@ class generalDMClass:
 
         :param inQuery: SQL Query defining the query to be pushed back to the backend instance
         :param inDBBE: Path to access backend database
+        :param session: Optional backendSession instance with pooled connections for the run
 
         :return:
         """
+        if session is not None:
+            session.adviseStatement(inDBBE, inQuery)
+
         # Connect via ODBC to Access Database
-        cnxn = generalDMClass.connect_DB_Access(inDBBE)
+        cnxn = generalDMClass.connect_DB_Access(inDBBE, session=session)
 
         try:
 
@@ -389,6 +861,11 @@ class generalDMClass:
             cursor.execute(inQuery)
             cnxn.commit()
 
+            # Make table/DDL queries change the backend schema
+            generalDMClass.invalidateCatalog(inDBBE, session=session, inQuery=inQuery)
+            # Cached lookups of the tables written by the query
+            generalDMClass.invalidateLookups(inDBBE, inQuery=inQuery, session=session)
+
             logMsg = f'Successfully Executed query - {inQuery}'
             print(logMsg)
 
@@ -401,30 +878,25 @@ class generalDMClass:
             # Close the database and quit Access
             cnxn.close()
 
-    def queryDesc(queryName_LU, queryDecrip_LU, qcCheckInstance):
+    def queryDesc(queryName_LU, queryDecrip_LU, qcCheckInstance, session=None):
         """
-        Add the query description to the passed query
+        Add the query description to the passed query.  Query descriptions are only settable via the Access COM
+        interface, with a backend session the description is queued and set with the other COM operations of the run
+        in one Access session (see 'runCOM').
 
         :param queryName_LU: Name of query being pushed, will deleted first if exists
         :param queryDesc: Query description to be added to the query
         :param qcCheckInstance: QC Check Instance (has Database paths, will used to define the front end query with
         the existing query.
+        :param session: Optional backendSession instance, COM operations are batched for the run
 
         :return
         """
 
-        # Initialize the Access application
-        access_app = win32com.client.Dispatch('Access.Application')
-
         inDBPath = qcCheckInstance.inDBFE
-        # Open the Access database
-        access_app.OpenCurrentDatabase(inDBPath)
-
-        # Get the current database object
-        db = access_app.CurrentDb()
-
-        # Get the query definition
-        query_def = db.QueryDefs(queryName_LU)
+        # Query descriptions are an Access property, not defined for the other backends
+        if not generalDMClass.getBackend(inDBPath).comDDL:
+            return
 
         #Check that queryDescript_LU is less then 255 characters
         lenQueryDescription = len(queryDecrip_LU)
@@ -435,123 +907,163 @@ class generalDMClass:
             logging.error(logMsg, exc_info=True)
             exit()
 
-        # Add the description property if it doesn't exist, or update it if it does
-        try:
-            query_def.Properties("Description").Value = queryDecrip_LU
-        except Exception as e:
-            # If the property does not exist, create it
-            new_prop = query_def.CreateProperty("Description", 10, queryDecrip_LU)  # 10 is the constant for dbText
-            query_def.Properties.Append(new_prop)
+        def setDescription(db):
+            # Get the query definition
+            query_def = db.QueryDefs(queryName_LU)
 
-        # Clean up and close the database
-        access_app.CloseCurrentDatabase()
-        access_app.Quit()
+            # Add the description property if it doesn't exist, or update it if it does
+            try:
+                query_def.Properties("Description").Value = queryDecrip_LU
+            except Exception:
+                # If the property does not exist, create it
+                new_prop = query_def.CreateProperty("Description", 10, queryDecrip_LU)  # 10 is the constant for dbText
+                query_def.Properties.Append(new_prop)
 
-        # Clean up COM objects
-        del access_app
+        generalDMClass.runCOM(inDBPath, f"Describe query {queryName_LU}", setDescription, session=session)
 
-    def tableExistsDelete(tableName, inDBPath):
+    def tableExistsDelete(tableName, inDBPath, session=None):
         """
-        Check if table exists in the database if yes delete, using pywin32 to hit the Access COM interface, ODBC
-        doesn't have permissions to hit the 'MSYS' variables
+        Check if table exists in the database if yes delete.  Existence is checked in the backend catalog snapshot
+        and the table is dropped via DROP TABLE on the session connection, the Access COM interface is only started if
+        the drop statement fails.
 
         :param tableName: Name of query being pushed, will deleted first if exists
         :param inDBPath: path to database
+        :param session: Optional backendSession instance with pooled connections for the run
 
         :return:
         """
 
-        # Initialize the Access application
-        access_app = win32com.client.Dispatch('Access.Application')
+        if not generalDMClass.getCatalog(inDBPath, session=session).tableExists(tableName):
+            print(f"Table '{tableName}' does not exist in the database.")
+            return
 
-        # Open the Access database
-        access_app.OpenCurrentDatabase(inDBPath)
+        if generalDMClass.executeDDL(f"DROP TABLE [{tableName}];", inDBPath, session=session):
+            print(f"Table '{tableName}' has been deleted from the database.")
+            return
 
-        # Get the current database object
-        db = access_app.CurrentDb()
-
-        try:
-            # Check if the query exists before attempting to delete it
-            tableExists = False
-            for table in db.TableDefs:
-                if table.Name == tableName:
-                    tableExists = True
-                    break
-
-            if tableExists:
-                # Delete the query
+        if generalDMClass.getBackend(inDBPath).comDDL:
+            def deleteTable(db):
                 db.TableDefs.Delete(tableName)
-                print(f"Table '{tableName}' has been deleted from the database.")
-            else:
-                print(f"Table '{tableName}' does not exist in the database.")
-        except Exception as e:
-            print(f"An error occurred: {e}")
-        finally:
-            # Close the database and quit Access
-            access_app.CloseCurrentDatabase()
-            access_app.Quit()
+                generalDMClass.invalidateLookups(inDBPath, tableName, session=session)
 
-        # Clean up COM objects
-        del access_app
+            generalDMClass.runCOM(inDBPath, f"Delete table {tableName}", deleteTable, session=session)
 
-    def createTableFromDF(df, tableName, inDBPath):
+    def createTableFromDF(df, tableName, inDBPath, session=None, typeSource=None, indexFields=None, reuse=True,
+                          batchSize=1000):
         """
-        From Passed Dataframe create new table in Access DB
+        From Passed Dataframe create new (staging) table in Access DB.  Records are loaded in 'executemany' batches and
+        an index is built on the passed join field(s) after the load.  If the table already exists with the same
+        fields and field types the table is cleared and reused rather than dropped and recreated.
 
         :param df: Data Frame to be created
         :param tableName: Name of table to be created
         :param inDBPath: Full path to backend database
+        :param session: Optional backendSession instance with pooled connections for the run
+        :param typeSource: Optional backend table, fields existing in this table are created with the backend field
+        type from the catalog snapshot rather than the type inferred from the dataframe dtype.
+        :param indexFields: Optional field or list of fields (e.g. the join key) to be indexed
+        :param reuse: If True an existing table with matching field definitions is cleared and reused
+        :param batchSize: Number of records per 'executemany' batch
 
         :return:
         """
 
-        cnxn = generalDMClass.connect_DB_Access(inDBPath)
-
-        # Check if table exist if it does drop it
-        generalDMClass.dropTableFromDB(cnxn, tableName)
+        catalog = generalDMClass.getCatalog(inDBPath, session=session)
 
-        # Get column names and types
-        columns = df.columns
-        dtypes = df.dtypes
-        col_defs = []
+        if isinstance(indexFields, str):
+            indexFields = [indexFields]
 
-        for column, dtype in zip(columns, dtypes):
-            if dtype == 'int64':
-                col_defs.append(f"[{column}] INTEGER")
-            elif dtype == 'float64':
-                col_defs.append(f"[{column}] DOUBLE")
-            elif dtype == 'object':
-                col_defs.append(f"[{column}] TEXT")
-            elif dtype == 'datetime64[ns]':
-                col_defs.append(f"[{column}] DATETIME")
-            elif dtype == 'bool':
-                col_defs.append(f"[{column}] YESNO")
-            else:
-                raise Exception(f"Unrecognized dtype: {dtype}")
+        # Field definitions from the catalog (typeSource) or the dataframe dtype
+        colDefs = {}
+        for column in df.columns:
+            ddlType = catalog.getDDLType(typeSource, column) if typeSource else None
+            colDefs[column] = ddlType or generalDMClass.defineDDLType(df[column])
 
-        col_defs_str = ", ".join(col_defs)
+        # Staging values - time zones removed (Access DATETIME is time zone naive), categories to their values
+        dfStage = df.copy()
+        for column in dfStage.columns:
+            if isinstance(dfStage[column].dtype, pd.DatetimeTZDtype):
+                dfStage[column] = dfStage[column].dt.tz_localize(None)
+            elif isinstance(dfStage[column].dtype, pd.CategoricalDtype):
+                dfStage[column] = dfStage[column].astype(object)
 
-        create_table_query = f"CREATE TABLE {tableName} ({col_defs_str})"
-        # Create a cursor object
+        cnxn = generalDMClass.connect_DB_Access(inDBPath, session=session)
         cursor = cnxn.cursor()
-        cursor.execute(create_table_query)
 
-        # Insert data in the dataframe (i.e. df) into the created table
-        for index, row in df.iterrows():
-            insert_query = f"INSERT INTO {tableName} VALUES ({', '.join(['?' for _ in row])})"
-            cursor.execute(insert_query, tuple(row))
+        existingDefs = None
+        if catalog.tableExists(tableName):
+            existingDefs = {record['columnName'].lower(): catalog.getDDLType(tableName, record['columnName'])
+                            for record in catalog.getColumns(tableName)}
 
-        # Commit the transaction
-        cnxn.commit()
+        if reuse and existingDefs == {column.lower(): ddlType for column, ddlType in colDefs.items()}:
+            # Same field definitions, clear and reuse the existing table
+            cursor.execute(f"DELETE FROM [{tableName}]")
+            logMsg = f'Cleared and reused existing table - {tableName}'
+        else:
+            # Check if table exist if it does drop it
+            if existingDefs is not None:
+                generalDMClass.dropTableFromDB(cnxn, tableName)
 
-        # Close the connection
+            colDefsStr = ", ".join(f"[{column}] {ddlType}" for column, ddlType in colDefs.items())
+            cursor.execute(f"CREATE TABLE [{tableName}] ({colDefsStr})")
+            logMsg = f'Created Temp Table - {tableName}'
+
+        cnxn.commit()
         cursor.close()
-        cnxn.close()
 
-        logMsg = f'Created Temp Table - {tableName}'
+        # Batched load of the records, 'appendDataSet' closes the connection
+        insertQuery = (f"INSERT INTO [{tableName}] ({', '.join(f'[{col}]' for col in dfStage.columns)}) "
+                       f"VALUES ({', '.join(['?'] * len(dfStage.columns))})")
+        generalDMClass.appendDataSet(cnxn, dfStage, tableName, insertQuery, None, batchSize=batchSize,
+                                     commitPer='call')
+
+        # Index the join field(s) post load (single index build rather than maintaining the index per insert)
+        if indexFields:
+            existingIndexes = catalog.getIndexes(tableName) if existingDefs is not None else {}
+            indexedFields = [[field.lower() for field in fields] for fields in existingIndexes.values()]
+            if [field.lower() for field in indexFields] not in indexedFields:
+                indexName = f"idx_{'_'.join(indexFields)}"[:64]  # Index names are unique per table
+                generalDMClass.excuteQuery(f"CREATE INDEX [{indexName}] ON [{tableName}] "
+                                           f"({', '.join(f'[{field}]' for field in indexFields)})",
+                                           inDBPath, session=session)
+
+        generalDMClass.invalidateCatalog(inDBPath, session=session)
+
         logging.info(logMsg)
         print(logMsg)
 
+    def defineDDLType(inSeries):
+        """
+        Define the Access DDL field type for the passed dataframe field, includes the pandas extension types (Int64,
+        boolean, string, category and time zone aware datetimes).
+
+        :param inSeries: Dataframe field (series)
+
+        :return: Access DDL field type
+        """
+
+        dtype = inSeries.dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            dtype = dtype.categories.dtype
+
+        if pd.api.types.is_bool_dtype(dtype):
+            return 'YESNO'
+        elif pd.api.types.is_integer_dtype(dtype):
+            return 'LONG'
+        elif pd.api.types.is_float_dtype(dtype):
+            return 'DOUBLE'
+        elif pd.api.types.is_datetime64_any_dtype(dtype):
+            return 'DATETIME'
+        elif pd.api.types.is_string_dtype(dtype) or dtype == object:
+            # Text fields are limited to 255 characters, longer values need a memo field
+            values = inSeries.dropna()
+            if not values.empty and values.astype(str).str.len().max() > 255:
+                return 'MEMO'
+            return 'TEXT(255)'
+        else:
+            raise Exception(f"Unrecognized dtype: {dtype}")
+
     def dropTableFromDB(conn, tableName):
         """
         Drop table from the database if it already exists
@@ -565,6 +1077,10 @@ class generalDMClass:
             cur = conn.cursor()
             try:
                 cur.execute(f"DROP TABLE [{tableName}]")
+                if isinstance(conn, pooledConnection):
+                    conn.session.invalidateCatalog(conn.inDB)
+                generalDMClass.invalidateLookups(getattr(conn, 'inDB', None), tableName,
+                                                  session=getattr(conn, 'session', None))
                 try:
                     conn.commit()
                     logMsg = f'Successfully Deleted Existing table - {tableName}'
@@ -574,7 +1090,7 @@ class generalDMClass:
                 except Exception:
                     pass
                 return True
-            except pyodbc.Error as e:
+            except backendErrors as e:
                 # Access typically raises: "Cannot find the input table or query"
                 # when table doesn't exist; you can check message text if needed.
                 return False
@@ -643,51 +1159,103 @@ class generalDMClass:
 
         return outDFDic
 
-    def appendDataSet(cnxn, dfToAppend, appendToTable, insertQuery, dmInstance):
+    def appendDataSet(cnxn, dfToAppend, appendToTable, insertQuery, dmInstance, batchSize=1000, commitPer='batch',
+                      fastExecuteMany=None, nullStrings=('nan',), returnKeys=None):
 
         """
         Appends the pass insert query using the input data frame to append to the defined table. ODBC Connection
-        is made to the defined table
+        is made to the defined table.  Records are pushed in batches via 'cursor.executemany' with a single commit per
+        batch (commitPer='batch') or a single commit for the full call (commitPer='call').  If a batch fails the batch
+        is rolled back and bisected to isolate the failing record.
 
         :param cnxn: ODBC database connection
         :param dfToAppend:  dataframe being appended
         :param appendToTable - table being appended to in the passed database
         :param insertQuery - query defining the append query
         :param dmInstance - data management instance
-
-        :return:
+        :param batchSize - number of records pushed per 'executemany' batch
+        :param commitPer - 'batch' commits after each batch, 'call' commits once after all batches
+        :param fastExecuteMany - Enable pyodbc 'fast_executemany' (True|False), if None will be enabled only for
+        drivers known to support it (not the Microsoft Access driver).
+        :param nullStrings - String values appended as Null (see 'buildInsertPayload')
+        :param returnKeys - Optional (source key field, autonumber key field[, additional fields...]) e.g.
+        ('GlobalID', 'EventID'), the autonumber keys of the inserted records are read back per batch within the insert
+        transaction via the source key (see 'readInsertedKeys').
+
+        :return: keysDF: If returnKeys, dataframe with the returnKeys fields for the inserted records
         """
 
         try:
 
             # Create a cursor to execute SQL commands for Append
             cursor = cnxn.cursor()
+            generalDMClass.setFastExecuteMany(cnxn, cursor, fastExecuteMany)
+
+            # Autonumber keys of the inserted records are greater than the current maximum key
+            if returnKeys is not None:
+                cursor.execute(f"SELECT MAX([{returnKeys[1]}]) FROM [{appendToTable}];")
+                minKey = cursor.fetchone()[0]
+                keyRecords = []
+
+            # Records as parameter tuples in the dataframe field order with all null values as None
+            records = generalDMClass.buildInsertPayload(dfToAppend, nullStrings=nullStrings)
 
             rows_inserted = 0  # Track how many rows we successfully insert
 
-            # Iterate over each row in the DataFrame and insert it into the table
-            for index, row in dfToAppend.iterrows():
-                values = tuple(row)
+            # Append the records in batches
+            for batchStart in range(0, len(records), batchSize):
+                batch = records[batchStart:batchStart + batchSize]
 
                 try:
-                    cursor.execute(insertQuery, values)
-                    rows_inserted += 1
-                    logMsg = f'Appended Records: {values}'
-                    logging.info(logMsg)
-                    # Commit the changes to the database
-                    cnxn.commit()
+                    cursor.executemany(insertQuery, batch)
 
                 except Exception as e:
-                    print("FAILED ROW:", row)
-                    print(dfToAppend.iloc[index])
-                    bad_row = dfToAppend.iloc[index]
+                    # Isolate the failing record in the batch.  A pinned unit of work connection is never rolled back
+                    # here (that would discard the prior work of the unit of work), the batch is probed on a separate
+                    # connection and the failing stage/run rolls back the unit of work.
+                    if isinstance(cnxn, pooledConnection) and cnxn.pinned:
+                        probeCnxn = cnxn.session.getIsolatedConnection(cnxn.inDB)
+                        try:
+                            badIndex, badError = generalDMClass.bisectFailedBatch(probeCnxn, probeCnxn.cursor(),
+                                                                                  insertQuery, batch)
+                        finally:
+                            probeCnxn.close()
+                    else:
+                        cnxn.rollback()
+                        badIndex, badError = generalDMClass.bisectFailedBatch(cnxn, cursor, insertQuery, batch)
+                    bad_row = dfToAppend.iloc[batchStart + badIndex]
 
+                    print("FAILED ROW:", bad_row)
                     for col, val in bad_row.items():
                         print(col, val, type(val))
 
+                    logMsg = (f'Failed append to {appendToTable} - batch starting at record {batchStart} - failing'
+                              f' record {batchStart + badIndex}: {batch[badIndex]} - {badError or e}')
+                    logging.error(logMsg)
 
                     raise e
 
+                rows_inserted += len(batch)
+                logging.debug(f'Appended batch of {len(batch)} records to {appendToTable}')
+
+                if returnKeys is not None:
+                    sourceKeys = dfToAppend[returnKeys[0]].iloc[batchStart:batchStart + batchSize].tolist()
+                    keyRecords.extend(generalDMClass.readInsertedKeys(cursor, appendToTable, returnKeys, sourceKeys,
+                                                                      minKey=minKey))
+
+                # Commit the changes to the database
+                if commitPer == 'batch':
+                    cnxn.commit()
+
+            if commitPer == 'call':
+                cnxn.commit()
+
+            # Cached lookups of the appended table
+            insertColumns = generalDMClass.parseInsertColumns(insertQuery)
+            generalDMClass.invalidateLookups(getattr(cnxn, 'inDB', None), appendToTable,
+                                             session=getattr(cnxn, 'session', None), insertOnly=True,
+                                             insertedRecords=(insertColumns, records) if insertColumns else None)
+
             # Close the cursor and database connection
             cursor.close()
             cnxn.close()
@@ -716,6 +1284,16 @@ class generalDMClass:
             logMsg = f'Records Successfully import to {appendToTable}'
             logging.info(logMsg)
 
+            if returnKeys is not None:
+                keysDF = pd.DataFrame.from_records(keyRecords, columns=list(returnKeys))
+                keysDF = keysDF.drop_duplicates(subset=returnKeys[1]).reset_index(drop=True)
+                if len(keysDF) != rows_inserted:
+                    logMsg = (f'WARNING - {len(keysDF)} autonumber key(s) read back for {rows_inserted} record(s)'
+                              f' appended to {appendToTable} - records without a {returnKeys[0]} have no key returned')
+                    logging.warning(logMsg)
+
+                return keysDF
+
         except Exception as e:
 
             logMsg = f'WARNING ERROR - "Exiting Error appendDataSet: {e}'
@@ -723,11 +1301,133 @@ class generalDMClass:
             traceback.print_exc(file=sys.__stdout__ )
             sys.exit(1)
 
-    def appendDataSetwDic(cnxn, dfToAppend, appendToTable, fieldTypeDic, insertQuery, dmInstance):
+    def parseInsertColumns(insertQuery):
+        """
+        Column list of an 'INSERT INTO table (columns) VALUES' statement.
+
+        :param insertQuery: Insert statement
 
+        :return: List of the column names, None if the statement doesn't list the columns
         """
-        Appends the pass insert query using the input data frame to append to the defined table. ODBC Connection
-        is made to the defined table
+
+        match = re.match(r'\s*INSERT\s+INTO\s+\[?[\w ]+\]?\s*\(([^)]*)\)\s*VALUES', insertQuery, re.IGNORECASE)
+        if match is None:
+            return None
+
+        return [column.strip().strip('[]') for column in match.group(1).split(',')]
+
+    def readInsertedKeys(cursor, tableName, returnKeys, sourceKeys, minKey=None, chunkSize=100):
+        """
+        Read back the autonumber keys of records just inserted on the cursor, within the insert transaction, via the
+        source key (e.g. GlobalID) in chunked parameterized IN lists.
+
+        :param cursor: ODBC cursor the records were inserted on
+        :param tableName: Table the records were inserted to
+        :param returnKeys: (source key field, autonumber key field[, additional fields...])
+        :param sourceKeys: Source key values of the inserted records
+        :param minKey: Maximum autonumber key prior to the insert, only keys greater than 'minKey' are returned
+        :param chunkSize: Number of source keys per IN list statement
+
+        :return: List of record tuples with the returnKeys field values
+        """
+
+        fields = ", ".join([f"[{field}]" for field in returnKeys])
+        sourceKeys = [key for key in dict.fromkeys(sourceKeys) if key is not None and not pd.isna(key)]
+
+        keyWhere = f" AND [{returnKeys[1]}] > {int(minKey)}" if minKey is not None else ""
+        records = []
+        for chunkStart in range(0, len(sourceKeys), chunkSize):
+            chunk = sourceKeys[chunkStart:chunkStart + chunkSize]
+            cursor.execute(f"SELECT {fields} FROM [{tableName}] WHERE [{returnKeys[0]}] IN"
+                           f" ({', '.join(['?'] * len(chunk))}){keyWhere};", chunk)
+            records.extend([tuple(row) for row in cursor.fetchall()])
+
+        return records
+
+    def buildInsertPayload(dfToAppend, nullStrings=('nan',)):
+        """
+        Build the insert parameter tuples for the passed dataframe in a single vectorized pass.  All null values
+        (np.nan, NaT, pd.NA, None) and the passed null strings (e.g. 'nan' strings from an astype(str)) are returned
+        as None, which is the only null value the Access ODBC driver imports correctly (NaN is imported as 1.#QNAN).
+        This is the single null normalization at the write boundary, upstream routines don't need to convert nulls
+        prior to an append.
+
+        :param dfToAppend: Dataframe being appended
+        :param nullStrings: String values to be appended as Null, pass an empty tuple to retain all strings
+
+        :return: records: List of parameter tuples in the dataframe field order
+        """
+
+        # One object array for the full frame, pandas null values to None
+        values = dfToAppend.to_numpy(dtype=object, na_value=None)
+
+        for nullString in nullStrings:
+            values[values == nullString] = None
+
+        return list(map(tuple, values.tolist()))
+
+    def bisectFailedBatch(cnxn, cursor, insertQuery, batch):
+        """
+        Isolate the first failing record in a failed 'executemany' batch.  Prefixes of the batch are probed (and
+        always rolled back) halving the search range each probe, so failures depending on earlier records in the batch
+        (e.g. duplicate keys) are also isolated.
+
+        :param cnxn: ODBC database connection, batch must already have been rolled back
+        :param cursor: Cursor on the connection
+        :param insertQuery: Parameterized insert query
+        :param batch: List of parameter tuples in the failed batch
+
+        :return: badIndex: index in the batch of the first failing record, badError: exception for the failing probe
+        """
+
+        lo, hi = 0, len(batch) - 1
+        badError = None
+
+        # Invariant: batch[:lo] succeeds, batch[:hi + 1] fails
+        while lo < hi:
+            mid = (lo + hi) // 2
+            try:
+                cursor.executemany(insertQuery, batch[:mid + 1])
+                lo = mid + 1
+            except Exception as e:
+                hi = mid
+                badError = e
+            finally:
+                cnxn.rollback()
+
+        return lo, badError
+
+    def setFastExecuteMany(cnxn, cursor, fastExecuteMany=None):
+        """
+        Set pyodbc 'fast_executemany' on the cursor.  When not defined enables only for the SQL Server drivers, the
+        Microsoft Access driver does not support parameter arrays.
+
+        :param cnxn: ODBC database connection
+        :param cursor: Cursor being used for the 'executemany' calls
+        :param fastExecuteMany: True|False|None - None defines via the connection driver name
+
+        :return: fastExecuteMany: Value applied to the cursor
+        """
+
+        if fastExecuteMany is None:
+            try:
+                driverName = str(cnxn.getinfo(pyodbc.SQL_DRIVER_NAME)).upper()
+            except Exception:
+                driverName = ''
+            fastExecuteMany = driverName.startswith(('MSODBCSQL', 'SQLNCLI', 'SQLSRV'))
+
+        try:
+            cursor.fast_executemany = fastExecuteMany
+        except AttributeError:
+            fastExecuteMany = False
+
+        return fastExecuteMany
+
+    def appendDataSetwDic(cnxn, dfToAppend, appendToTable, fieldTypeDic, insertQuery, dmInstance):
+
+        """
+        Appends the pass insert query using the input data frame to append to the defined table. ODBC Connection
+        is made to the defined table
 
         :param cnxn: ODBC database connection
         :param dfToAppend:  dataframe being appended
@@ -765,6 +1465,8 @@ class generalDMClass:
                 cursor.execute(insertQuery, values_to_insert)
             # Commit the transaction
             cnxn.commit()
+            generalDMClass.invalidateLookups(getattr(cnxn, 'inDB', None), appendToTable,
+                                             session=getattr(cnxn, 'session', None), insertOnly=True)
 
             # Close the connection
             cursor.close()
@@ -782,6 +1484,50 @@ class generalDMClass:
             traceback.print_exc(file=sys.stdout)
             sys.exit(1)
 
+    def benchmarkBulkLoad(inDF, tableName, inDB, dmInstance, textImportDir, session=None):
+        """
+        Time the text bulk load (see 'tableWriter.appendText') against the batched ODBC append for the passed records.
+        Both loads go to empty staging copies of the destination table (backend field types) which are dropped after,
+        the destination table is not written.
+
+        :param inDF: Dataframe with fields named as the destination table fields
+        :param tableName: Destination table the staging copies are defined from
+        :param inDB: Full path and name to the backend database
+        :param dmInstance: Data management instance
+        :param textImportDir: Parent directory for the text bulk load files
+        :param session: Optional backendSession instance with pooled connections for the run
+
+        :return: Dictionary 'records', 'textSeconds' (None if the text bulk load is not possible) and 'odbcSeconds'
+        """
+
+        prepared = tableWriter(tableName, inDB, session=session).prepare(inDF)
+        timings = {'records': len(prepared)}
+
+        for loadPath in ('text', 'odbc'):
+            if session is not None:
+                stagingTable = session.stagingTable(f'benchmark_{loadPath}_{tableName}', inDB)
+            else:
+                stagingTable = f'{backendSession.stagingPrefix}benchmark_{loadPath}_{tableName}'
+            generalDMClass.createTableFromDF(prepared.head(0), stagingTable, inDB, session=session,
+                                             typeSource=tableName, reuse=False)
+            writer = tableWriter(stagingTable, inDB, session=session)
+
+            startTime = time.perf_counter()
+            if loadPath == 'text':
+                loaded = writer.appendText(prepared, textImportDir)
+            else:
+                loaded = writer.appendODBC(prepared, dmInstance)
+            timings[f'{loadPath}Seconds'] = time.perf_counter() - startTime if loaded is not None else None
+
+            generalDMClass.tableExistsDelete(stagingTable, inDB, session=session)
+
+        textTime = 'n/a' if timings['textSeconds'] is None else f"{timings['textSeconds']:.2f} seconds"
+        logMsg = (f"Bulk load benchmark {tableName} - {timings['records']} record(s) - text bulk load {textTime} -"
+                  f" ODBC append {timings['odbcSeconds']:.2f} seconds")
+        logging.info(logMsg)
+
+        return timings
+
     def applyLookupToDFField(dmInstance, dfLookupTable, lookupField, lookupValue, dfIn, dflookupField, dfDefineField):
         """
         Define a field (i.e. dfDefineField) via a lookup table (i.e. dfLookupTable) and a join on two data frames.
@@ -937,8 +1683,8 @@ class generalDMClass:
             Name of table being updated.
         source_table : str
             Name of temp/staging table containing update values.
-        join_field : str
-            Field used to join tables (must exist in both).
+        join_field : str or list
+            Field(s) used to join tables (must exist in both), a list for composite keys.
         include_fields : list, optional
             Specific fields to update. If None, all df columns except join_field are used.
         where_clause : str, optional
@@ -950,14 +1696,17 @@ class generalDMClass:
             Complete Access SQL UPDATE statement.
         """
 
-        if join_field not in df.columns:
-            raise ValueError(f"Join field '{join_field}' not found in dataframe.")
+        join_fields = [join_field] if isinstance(join_field, str) else list(join_field)
+
+        for field in join_fields:
+            if field not in df.columns:
+                raise ValueError(f"Join field '{field}' not found in dataframe.")
 
         # Determine fields to update
         if include_fields:
-            update_fields = [f for f in include_fields if f != join_field]
+            update_fields = [f for f in include_fields if f not in join_fields]
         else:
-            update_fields = [col for col in df.columns if col != join_field]
+            update_fields = [col for col in df.columns if col not in join_fields]
 
         if not update_fields:
             raise ValueError("No fields available to update.")
@@ -968,11 +1717,17 @@ class generalDMClass:
              for col in update_fields]
         )
 
+        # Build the join (composite keys joined with AND)
+        on_clause = " AND ".join(
+            [f"{target_table}.[{field}] = {source_table}.[{field}]"
+             for field in join_fields]
+        )
+
         # Construct SQL
         sql = f"""
         UPDATE {target_table}
         INNER JOIN {source_table}
-            ON {target_table}.[{join_field}] = {source_table}.[{join_field}]
+            ON ({on_clause})
         SET
             {set_clause}
         """
@@ -984,6 +1739,314 @@ class generalDMClass:
 
         return sql.strip()
 
+    def build_access_insert_missing_sql(
+            df,
+            target_table,
+            source_table,
+            join_field,
+            include_fields=None):
+        """
+        Build an MS Access INSERT ... SELECT ... WHERE NOT EXISTS SQL statement appending the staged records whose
+        key is not yet in the target table.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            DataFrame whose columns match fields in target_table.
+        target_table : str
+            Name of table being appended to.
+        source_table : str
+            Name of temp/staging table containing the records.
+        join_field : str or list
+            Key field(s) defining if a record already exists in the target table.
+        include_fields : list, optional
+            Specific fields to insert. If None, all df columns are used.
+
+        Returns
+        -------
+        str
+            Complete Access SQL INSERT statement.
+        """
+
+        join_fields = [join_field] if isinstance(join_field, str) else list(join_field)
+
+        insert_fields = list(include_fields) if include_fields else list(df.columns)
+        for field in join_fields + insert_fields:
+            if field not in df.columns:
+                raise ValueError(f"Field '{field}' not found in dataframe.")
+
+        field_clause = ", ".join([f"[{col}]" for col in insert_fields])
+        select_clause = ", ".join([f"{source_table}.[{col}]" for col in insert_fields])
+        exists_clause = " AND ".join(
+            [f"tgt.[{field}] = {source_table}.[{field}]" for field in join_fields]
+        )
+
+        sql = f"""
+        INSERT INTO {target_table} ({field_clause})
+        SELECT {select_clause}
+        FROM {source_table}
+        WHERE NOT EXISTS (
+            SELECT * FROM {target_table} AS tgt WHERE {exists_clause})
+        """
+
+        sql += ";"
+
+        return sql.strip()
+
+    def upsertDataSet(inDF, targetTable, keyFields, inDBPath, session=None, updateFields=None):
+        """
+        Set based upsert of the passed dataframe to the target table.  Records are staged once (indexed on the key
+        fields), records with a matching key are updated via an UPDATE INNER JOIN and records with a new key are
+        appended via an INSERT ... SELECT ... WHERE NOT EXISTS, both within the database engine so the cost follows
+        the size of the passed records not the size of the target table.
+
+        :param inDF: Dataframe with fields named as the target table fields
+        :param targetTable: Table being upserted
+        :param keyFields: Key field or list of key fields
+        :param inDBPath: Full path to backend database
+        :param session: Optional backendSession instance with pooled connections for the run
+        :param updateFields: Fields updated on existing records, None all non key fields, [] insert only (new keys)
+
+        :return: updatedCount, insertedCount: Number of records updated and appended
+        """
+
+        keyFields = [keyFields] if isinstance(keyFields, str) else list(keyFields)
+
+        if inDF.empty:
+            return 0, 0
+
+        # Stage the records once
+        if session is not None:
+            stagingTable = session.stagingTable(f'upsert_{targetTable}', inDBPath)
+        else:
+            stagingTable = f'{backendSession.stagingPrefix}upsert_{targetTable}'
+        generalDMClass.createTableFromDF(inDF, stagingTable, inDBPath, session=session, typeSource=targetTable,
+                                         indexFields=keyFields)
+
+        if updateFields is None:
+            updateFields = [col for col in inDF.columns if col not in keyFields]
+
+        updatedCount = 0
+        cnxn = generalDMClass.connect_DB_Access(inDBPath, session=session)
+        try:
+            cursor = cnxn.cursor()
+
+            if updateFields:
+                updateQuery = generalDMClass.build_access_update_sql(inDF, targetTable, stagingTable, keyFields,
+                                                                     include_fields=updateFields)
+                if session is not None:
+                    session.adviseStatement(inDBPath, updateQuery)
+                cursor.execute(updateQuery)
+                updatedCount = cursor.rowcount
+
+            insertQuery = generalDMClass.build_access_insert_missing_sql(inDF, targetTable, stagingTable, keyFields)
+            if session is not None:
+                session.adviseStatement(inDBPath, insertQuery)
+            cursor.execute(insertQuery)
+            insertedCount = cursor.rowcount
+
+            cnxn.commit()
+            generalDMClass.invalidateLookups(inDBPath, targetTable, session=session)
+            cursor.close()
+        finally:
+            cnxn.close()
+
+        logMsg = (f'Upsert to {targetTable} on {keyFields} - {len(inDF)} staged record(s) - {updatedCount} updated -'
+                  f' {insertedCount} appended')
+        logging.info(logMsg)
+
+        return updatedCount, insertedCount
+
+    def delete_by_keys(tables, key_cols, keys_df, inDBPath, session=None, inListThreshold=500, chunkSize=100):
+        """
+        Delete the records matching the passed key set from one or more tables.  Small key sets are deleted with
+        chunked parameterized IN (...) lists (OR'd key groups for composite keys), large key sets are staged once in an
+        indexed staging table and deleted via DELETE ... INNER JOIN.  All tables are processed on one connection with
+        one commit.
+
+        :param tables: Table name or list of table names the key set is deleted from
+        :param key_cols: Key field or list of key fields (must be in keys_df and each table)
+        :param keys_df: Dataframe with the keys being deleted
+        :param inDBPath: Full path to backend database
+        :param session: Optional backendSession instance with pooled connections for the run
+        :param inListThreshold: Maximum number of keys deleted via IN lists, larger key sets use a staging table
+        :param chunkSize: Number of keys per IN list statement
+
+        :return: deletedCounts: Dictionary table name: number of records deleted
+        """
+
+        tables = [tables] if isinstance(tables, str) else list(tables)
+        key_cols = [key_cols] if isinstance(key_cols, str) else list(key_cols)
+
+        keys = keys_df[key_cols].dropna().drop_duplicates()
+        deletedCounts = {table: 0 for table in tables}
+        if keys.empty:
+            return deletedCounts
+
+        useStaging = len(keys) > inListThreshold
+        if useStaging:
+            if session is not None:
+                stagingTable = session.stagingTable(f'deleteKeys_{tables[0]}', inDBPath)
+            else:
+                stagingTable = f'{backendSession.stagingPrefix}deleteKeys_{tables[0]}'
+            generalDMClass.createTableFromDF(keys, stagingTable, inDBPath, session=session, typeSource=tables[0],
+                                             indexFields=key_cols)
+        else:
+            keyValues = generalDMClass.buildInsertPayload(keys)
+
+        cnxn = generalDMClass.connect_DB_Access(inDBPath, session=session)
+        try:
+            cursor = cnxn.cursor()
+
+            for table in tables:
+                if session is not None:
+                    session.adviseStatement(inDBPath, f"DELETE FROM [{table}] WHERE "
+                                                      f"{generalDMClass.buildKeyWhereClause(key_cols, 1)};")
+                if useStaging:
+                    on_clause = " AND ".join([f"{table}.[{col}] = {stagingTable}.[{col}]" for col in key_cols])
+                    cursor.execute(f"DELETE {table}.* FROM {table} INNER JOIN {stagingTable} ON ({on_clause});")
+                    deletedCounts[table] += cursor.rowcount
+                    continue
+
+                # Composite keys use fewer keys per statement to keep the same number of parameters
+                keysPerChunk = max(1, chunkSize // len(key_cols))
+                for chunkStart in range(0, len(keyValues), keysPerChunk):
+                    chunk = keyValues[chunkStart:chunkStart + keysPerChunk]
+                    where_clause = generalDMClass.buildKeyWhereClause(key_cols, len(chunk))
+                    cursor.execute(f"DELETE FROM [{table}] WHERE {where_clause};",
+                                   [value for key in chunk for value in key])
+                    deletedCounts[table] += cursor.rowcount
+
+            cnxn.commit()
+            for table in tables:
+                generalDMClass.invalidateLookups(inDBPath, table, session=session)
+            cursor.close()
+        finally:
+            cnxn.close()
+
+        logMsg = (f"Deleted by keys {key_cols} - {len(keys)} key(s) via {'staging table' if useStaging else 'IN lists'}"
+                  f" - {deletedCounts}")
+        logging.info(logMsg)
+
+        return deletedCounts
+
+    def buildKeyWhereClause(keyFields, keyCount):
+        """
+        Parameterized where clause matching a chunk of keys - IN (?, ...) for a single key field, OR'd key groups
+        ([k1] = ? AND [k2] = ?) for composite keys.
+
+        :param keyFields: List of key fields
+        :param keyCount: Number of keys in the chunk
+
+        :return: where_clause: SQL where clause (without 'WHERE')
+        """
+
+        if len(keyFields) == 1:
+            return f"[{keyFields[0]}] IN ({', '.join(['?'] * keyCount)})"
+
+        keyGroup = "(" + " AND ".join([f"[{col}] = ?" for col in keyFields]) + ")"
+        return " OR ".join([keyGroup] * keyCount)
+
+    def buildFilteredQueries(tableName, columns, keyFields, keysDF, chunkSize=100):
+        """
+        Projected, key filtered queries for a table - only the passed columns of the records matching the passed keys
+        are selected.  Keys are split in chunks of parameterized IN lists (OR'd key groups for composite keys) with
+        at most 'chunkSize' parameters per statement to stay within the Access query complexity limits.
+
+        :param tableName: Table being read
+        :param columns: List of the columns to select
+        :param keyFields: Key field or list of key fields
+        :param keysDF: Dataframe (or series/list for a single key field) with the keys being read
+        :param chunkSize: Maximum number of parameters per statement
+
+        :return: List of (query, parameters) tuples
+        """
+
+        keyFields = [keyFields] if isinstance(keyFields, str) else list(keyFields)
+        if not isinstance(keysDF, pd.DataFrame):
+            keysDF = pd.DataFrame({keyFields[0]: list(keysDF)})
+
+        keyValues = generalDMClass.buildInsertPayload(keysDF[keyFields].dropna().drop_duplicates())
+        fields = ", ".join([f"[{column}]" for column in columns])
+
+        keysPerChunk = max(1, chunkSize // len(keyFields))
+        queries = []
+        for chunkStart in range(0, len(keyValues), keysPerChunk):
+            chunk = keyValues[chunkStart:chunkStart + keysPerChunk]
+            where_clause = generalDMClass.buildKeyWhereClause(keyFields, len(chunk))
+            queries.append((f"SELECT {fields} FROM [{tableName}] WHERE {where_clause};",
+                            [value for key in chunk for value in key]))
+
+        return queries
+
+    def iterFiltered(tableName, columns, keyFields, keysDF, inDB, session=None, chunkSize=100):
+        """
+        Stream the projected, key filtered records of a table (see 'buildFilteredQueries') one chunk at a time on a
+        single connection.
+
+        :param tableName: Table being read
+        :param columns: List of the columns to select
+        :param keyFields: Key field or list of key fields
+        :param keysDF: Dataframe (or series/list for a single key field) with the keys being read
+        :param inDB: Full path and name to access database
+        :param session: Optional backendSession instance with pooled connections for the run
+        :param chunkSize: Maximum number of parameters per statement
+
+        :return: Generator of dataframes, one per key chunk
+        """
+
+        queries = generalDMClass.buildFilteredQueries(tableName, columns, keyFields, keysDF, chunkSize=chunkSize)
+        if not queries:
+            return
+
+        if session is not None:
+            session.adviseStatement(inDB, queries[0][0])
+
+        # Served from the session read mirror if the table is mirrored
+        mirror = session.getMirror(inDB, [tableName]) if session is not None else None
+        if mirror is not None:
+            for query, params in queries:
+                yield mirror.read(query, [tableName], params=params)
+            return
+
+        cnxn = generalDMClass.connect_DB_Access(inDB, session=session)
+        try:
+            cursor = cnxn.cursor()
+            for query, params in queries:
+                cursor.execute(query, params)
+                yield next(generalDMClass.fetchTyped(cursor))
+            cursor.close()
+        finally:
+            cnxn.close()
+
+    def readFiltered(tableName, columns, keyFields, keysDF, inDB, session=None, chunkSize=100):
+        """
+        Read the projected, key filtered records of a table so the read scales with the keys of the run rather than
+        the full table (see 'iterFiltered').
+
+        :param tableName: Table being read
+        :param columns: List of the columns to select
+        :param keyFields: Key field or list of key fields
+        :param keysDF: Dataframe (or series/list for a single key field) with the keys being read
+        :param inDB: Full path and name to access database
+        :param session: Optional backendSession instance with pooled connections for the run
+        :param chunkSize: Maximum number of parameters per statement
+
+        :return: outDF: Dataframe with the passed columns for the matching records
+        """
+
+        chunks = list(generalDMClass.iterFiltered(tableName, columns, keyFields, keysDF, inDB, session=session,
+                                                  chunkSize=chunkSize))
+        if not chunks:
+            return pd.DataFrame(columns=columns)
+
+        outDF = pd.concat(chunks, ignore_index=True)
+
+        logMsg = f'Read {len(outDF)} record(s) from {tableName} in {len(chunks)} key filtered chunk(s)'
+        logging.debug(logMsg)
+
+        return outDF
+
     def build_access_update_sqlEventID(
             df,
             target_table,
@@ -1045,4 +2108,2920 @@ class generalDMClass:
         return s_clean.iloc[0] if not s_clean.empty else np.nan
 
     if __name__ == "__name__":
-        logger.info("generalDM.py")
\ No newline at end of file
+        logger.info("generalDM.py")
+
+
+class backendSession:
+    """
+    Backend database session shared across a protocol run.  Holds a small pool of ODBC connections per backend path
+    so the generalDM helpers reuse connections rather than opening a new connection per call.
+    """
+
+    numBackendSessions = 0
+
+    # Staging table naming - per stage tables are '<stagingPrefix><stageName>', legacy shared staging table is swept
+    stagingPrefix = 'tmpETL_'
+    legacyStagingTables = ('tmpTable_ETL',)
+
+    def __init__(self, maxConnections=2):
+        """
+        Define the instantiated backendSession attributes
+
+        :param maxConnections: Maximum number of idle connections retained per backend path
+
+        :return: Instantiated backendSession
+        """
+
+        self.maxConnections = maxConnections
+        self.idleConnections = {}  # Backend path: list of idle connections
+        self.openCount = 0  # Number of connections opened to the backend(s)
+        self.checkoutCount = 0  # Number of connection requests served
+        self.lock = threading.Lock()
+
+        # Unit of work - 'No' (helpers commit on their own), 'Run' (single transaction for the run) or 'Stage'
+        # (single transaction per named stage)
+        self.unitOfWork = 'No'
+        self.pinnedConnections = {}  # Backend path: connection holding the unit of work transaction
+        self.currentStage = None
+        self.completedStages = []
+        self.commitCount = 0
+
+        # Per stage staging tables created during the run - backend path: set of staging table names
+        self.stagingTables = {}
+
+        # Backend catalog snapshots and schema driven table writers built once per backend/table for the run
+        self.catalogs = {}  # Backend path: backendCatalog
+        self.tableWriters = {}
+
+        # GlobalID to surrogate key resolvers shared by the child processors - (backend path, table, ...): keyResolver
+        self.keyResolvers = {}
+
+        # Optional local SQLite read mirrors - backend path: readMirror
+        self.readMirrors = {}
+
+        # Join/filter columns of the statements run, compared with the backend indexes (see 'adviseIndexes')
+        self.indexAdvisor = indexAdvisor()
+
+        # Access COM only operations (e.g. query descriptions) run in one Access session at the end of the run
+        self.comBatch = accessCOMBatch()
+
+        # Directory for the text bulk loads of the table writers (see 'tableWriter.appendText'), None disabled
+        self.textImportDir = None
+
+        # Backend read counts - number of queries, records, bytes and seconds
+        self.readCount = 0
+        self.readRows = 0
+        self.readBytes = 0
+        self.readSeconds = 0.0
+
+        backendSession.numBackendSessions += 1
+
+    def getConnection(self, inDB):
+        """
+        Check out a connection for the passed backend path, an idle pooled connection is reused when available.
+
+        :param inDB: Full path and name to the backend database
+
+        :return: pooledConnection: Connection wrapper, calling close() returns the connection to the pool
+        """
+
+        # Unit of work - all helpers share the pinned connection so reads see the uncommitted writes
+        if self.unitOfWork != 'No':
+            with self.lock:
+                self.checkoutCount += 1
+                rawConnection = self.pinnedConnections.get(inDB)
+
+            if rawConnection is None:
+                rawConnection = generalDMClass.connect_DB_Access(inDB)
+                with self.lock:
+                    self.openCount += 1
+                    self.pinnedConnections[inDB] = rawConnection
+
+            return pooledConnection(self, inDB, rawConnection, pinned=True)
+
+        with self.lock:
+            self.checkoutCount += 1
+            idle = self.idleConnections.setdefault(inDB, [])
+            rawConnection = idle.pop() if idle else None
+
+        if rawConnection is None:
+            rawConnection = generalDMClass.connect_DB_Access(inDB)
+            with self.lock:
+                self.openCount += 1
+
+            logMsg = f'Backend session opened connection {self.openCount} - {inDB}'
+            logging.debug(logMsg)
+
+        return pooledConnection(self, inDB, rawConnection)
+
+    def getIsolatedConnection(self, inDB):
+        """
+        Check out a pooled connection outside of the unit of work (never the pinned connection), used for work which
+        must be rolled back without rolling back the unit of work transaction (e.g. probing a failed append batch).
+
+        :param inDB: Full path and name to the backend database
+
+        :return: pooledConnection: Unpinned connection wrapper, calling close() rolls back and returns it to the pool
+        """
+
+        with self.lock:
+            self.checkoutCount += 1
+            idle = self.idleConnections.setdefault(inDB, [])
+            rawConnection = idle.pop() if idle else None
+
+        if rawConnection is None:
+            rawConnection = generalDMClass.connect_DB_Access(inDB)
+            with self.lock:
+                self.openCount += 1
+
+        return pooledConnection(self, inDB, rawConnection)
+
+    def releaseConnection(self, inDB, rawConnection):
+        """
+        Return a connection to the pool, uncommitted work is rolled back.  Connections beyond 'maxConnections' are
+        closed.
+
+        :param inDB: Full path and name to the backend database
+        :param rawConnection: ODBC connection being returned
+
+        :return:
+        """
+
+        try:
+            rawConnection.rollback()
+        except Exception:
+            rawConnection.close()
+            return
+
+        with self.lock:
+            idle = self.idleConnections.setdefault(inDB, [])
+            if len(idle) < self.maxConnections:
+                idle.append(rawConnection)
+                return
+
+        rawConnection.close()
+
+    def getCatalog(self, inDB):
+        """
+        Catalog snapshot for the passed backend path, built on first use and retained for the run.
+
+        :param inDB: Full path and name to the backend database
+
+        :return: backendCatalog instance
+        """
+
+        with self.lock:
+            catalog = self.catalogs.get(inDB)
+            if catalog is None:
+                catalog = backendCatalog(inDB, session=self)
+                self.catalogs[inDB] = catalog
+
+        return catalog
+
+    def invalidateCatalog(self, inDB, inQuery=None):
+        """
+        Invalidate the catalog snapshot and table writers for the passed backend after DDL (create/drop/alter, make
+        table).  If a query is passed the snapshot is only invalidated when the query is DDL.
+
+        :param inDB: Full path and name to the backend database
+        :param inQuery: Optional SQL statement that was executed
+
+        :return: True if the snapshot was invalidated
+        """
+
+        if inQuery is not None and not backendCatalog.isDDL(inQuery):
+            return False
+
+        with self.lock:
+            catalog = self.catalogs.get(inDB)
+            for key in [key for key in self.tableWriters if key[0] == inDB]:
+                del self.tableWriters[key]
+
+        if catalog is not None:
+            catalog.invalidate()
+
+        return True
+
+    def stagingTable(self, stageName, inDB):
+        """
+        Staging table name for the passed stage.  Each stage has its own staging table so stages don't share (and
+        serially drop/recreate) one table, the table is reused on repeat calls of the stage within the run and swept
+        at the end of the run (see 'sweepStagingTables').
+
+        :param stageName: Name of the stage (e.g. the processing function name)
+        :param inDB: Full path and name to the backend database
+
+        :return: tableName: Staging table name
+        """
+
+        tableName = backendSession.stagingPrefix + re.sub(r'\W', '_', stageName)
+        if len(tableName) > 64:  # Access object name limit
+            raise ValueError(f'Staging table name - {tableName} - exceeds 64 characters')
+
+        with self.lock:
+            self.stagingTables.setdefault(inDB, set()).add(tableName)
+
+        return tableName
+
+    def sweepStagingTables(self, inDB):
+        """
+        Drop all staging tables ('tmpETL_' prefix and the legacy 'tmpTable_ETL') in the passed backend.  Called at the
+        start of a run to remove tables left by a crashed run and at the end of the run.
+
+        :param inDB: Full path and name to the backend database
+
+        :return: List of the staging tables dropped
+        """
+
+        catalog = self.getCatalog(inDB)
+        legacyTables = [table.lower() for table in backendSession.legacyStagingTables]
+        staleTables = [name for key, (name, tableType) in catalog.getTables().items()
+                       if tableType == 'TABLE' and (key.startswith(backendSession.stagingPrefix.lower())
+                                                    or key in legacyTables)]
+
+        if staleTables:
+            cnxn = self.getConnection(inDB)
+            try:
+                for tableName in staleTables:
+                    generalDMClass.dropTableFromDB(cnxn, tableName)
+                cnxn.commit()
+            finally:
+                cnxn.close()
+
+            self.invalidateCatalog(inDB)
+
+            logMsg = f'Swept - {len(staleTables)} - staging table(s) from - {inDB}: {staleTables}'
+            logging.info(logMsg)
+
+        with self.lock:
+            self.stagingTables.pop(inDB, None)
+
+        return staleTables
+
+    def getTableWriter(self, tableName, inDB):
+        """
+        Table writer for the passed destination table, built from the backend column metadata on first use and
+        reused for the rest of the run.
+
+        :param tableName: Destination table name
+        :param inDB: Full path and name to the backend database
+
+        :return: tableWriter instance
+        """
+
+        key = (inDB, tableName.lower())
+        writer = self.tableWriters.get(key)
+        if writer is None:
+            writer = tableWriter(tableName, inDB, session=self)
+            self.tableWriters[key] = writer
+
+        return writer
+
+    def recordRead(self, rowCount, byteCount, seconds):
+        """
+        Add a query read to the session read counts.
+
+        :param rowCount: Number of records read
+        :param byteCount: Bytes of the dataframe(s) read
+        :param seconds: Query time in seconds
+
+        :return:
+        """
+
+        with self.lock:
+            self.readCount += 1
+            self.readRows += rowCount
+            self.readBytes += byteCount
+            self.readSeconds += seconds
+
+    def adviseStatement(self, inDB, statement):
+        """
+        Record the join and filter columns of a statement run against the backend (see 'indexAdvisor').
+        """
+
+        try:
+            self.indexAdvisor.record(inDB, statement)
+        except Exception as e:  # Advisory only, never fails the statement
+            logging.debug(f'Index advisor unable to parse statement: {e}')
+
+    def adviseIndexes(self, inDB, createIndexes=False, minRows=1000):
+        """
+        Report the join/filter columns of the run without a backend index, optionally creating the missing indexes
+        (opt-in maintenance mode - run when no one else has the backend open, Access locks the table to index it).
+
+        :param inDB: Full path and name to the backend database
+        :param createIndexes: True creates an index on each reported column of a table with 'minRows' or more records
+        :param minRows: Minimum table record count for an index to be created
+
+        :return: List of log messages, one per missing index
+        """
+
+        logMsgs = []
+        for record in self.indexAdvisor.missingIndexes(inDB, session=self):
+            logMsg = (f"Index advisor - no index on {record['table']}.[{record['column']}] - used by"
+                      f" {record['statements']} statement(s) - {record['rows']} record(s)")
+
+            if createIndexes and record['rows'] >= minRows:
+                generalDMClass.excuteQuery(f"CREATE INDEX [idx_{record['column']}] ON [{record['table']}] "
+                                           f"([{record['column']}]);", inDB, session=self)
+                logMsg += " - index created"
+
+            logging.warning(logMsg)
+            logMsgs.append(logMsg)
+
+        return logMsgs
+
+    def openReadMirror(self, inDB, mirrorPath, tables):
+        """
+        Open a local SQLite read mirror of the passed backend tables for the run (see 'readMirror').
+
+        :param inDB: Full path and name to the backend database
+        :param mirrorPath: Path of the SQLite mirror file, recreated for the run
+        :param tables: List of the backend tables to mirror
+
+        :return: readMirror instance
+        """
+
+        mirror = readMirror(inDB, mirrorPath, session=self)
+        for tableName in tables:
+            mirror.addTable(tableName)
+
+        self.readMirrors[inDB] = mirror
+
+        return mirror
+
+    def getMirror(self, inDB, tables):
+        """
+        Read mirror for the backend if all the passed tables are mirrored, else None.
+        """
+
+        mirror = self.readMirrors.get(inDB)
+        if mirror is None or not all(tableName.lower() in mirror.tables for tableName in tables):
+            return None
+
+        return mirror
+
+    def invalidateMirror(self, inDB, tableName=None, inQuery=None, insertOnly=False, insertedRecords=None):
+        """
+        Keep the read mirror tables consistent after a write to the backend (see 'readMirror.noteWrite').
+
+        :param inDB: Full path and name to the backend database, None all backends
+        :param tableName: Table written, None all tables
+        :param inQuery: Optional SQL statement executed, only the tables named in the statement are flagged
+        :param insertOnly: True if records were only appended
+        :param insertedRecords: Optional (columns, records) appended
+
+        :return:
+        """
+
+        if inQuery is not None and lookupCache.readPattern.match(inQuery):
+            return
+
+        for mirrorDB, mirror in list(self.readMirrors.items()):
+            if inDB is None or mirrorDB == inDB:
+                mirror.noteWrite(tableName=tableName, inQuery=inQuery, insertOnly=insertOnly,
+                                 insertedRecords=insertedRecords)
+
+    def getKeyResolver(self, tableName, inDB, keyField='ID', globalIDField='GlobalID', fields=()):
+        """
+        GlobalID to surrogate key resolver for the passed parent table, loaded on first use and shared by all the
+        child processors of the run (see 'keyResolver').
+
+        :param tableName: Parent table name
+        :param inDB: Full path and name to the backend database
+        :param keyField: Surrogate (autonumber) key field
+        :param globalIDField: GlobalID field
+        :param fields: Additional parent fields retained with the key
+
+        :return: keyResolver instance
+        """
+
+        key = (inDB, tableName.lower(), keyField, globalIDField, tuple(fields))
+        with self.lock:
+            resolver = self.keyResolvers.get(key)
+            if resolver is None:
+                resolver = keyResolver(tableName, inDB, session=self, keyField=keyField, globalIDField=globalIDField,
+                                       fields=fields)
+                self.keyResolvers[key] = resolver
+
+        return resolver
+
+    def invalidateKeyResolvers(self, inDB, tableName=None, inQuery=None, insertOnly=False):
+        """
+        Flag the key resolvers of a table written to.  Appended records are picked up incrementally on the next
+        resolve, other writes (update, delete, statements, rollback) reload the resolver.
+
+        :param inDB: Full path and name to the backend database, None all backends
+        :param tableName: Table written, None all tables
+        :param inQuery: Optional SQL statement executed, only the tables named in the statement are flagged
+        :param insertOnly: True if records were only appended
+
+        :return:
+        """
+
+        if inQuery is not None and lookupCache.readPattern.match(inQuery):
+            return
+
+        with self.lock:
+            resolvers = [resolver for key, resolver in self.keyResolvers.items()
+                         if (inDB is None or key[0] == inDB) and (tableName is None or key[1] == tableName.lower())]
+
+        for resolver in resolvers:
+            if inQuery is not None and not re.search(r'(?<![\w])' + re.escape(resolver.tableName) + r'(?![\w])',
+                                                     inQuery, re.IGNORECASE):
+                continue
+            resolver.markStale(insertOnly=insertOnly)
+
+    def beginUnitOfWork(self, unitOfWork):
+        """
+        Start an opt-in unit of work.  While active the generalDM helpers share one pinned connection per backend and
+        their commits are deferred.  Work is committed at stage checkpoints ('Stage') or once at the end of the run
+        ('Run'), a failure rolls back the current stage ('Stage') or the full run ('Run').
+
+        :param unitOfWork: 'No'|'Run'|'Stage'
+
+        :return:
+        """
+
+        if unitOfWork not in ('No', 'Run', 'Stage'):
+            raise ValueError(f"Unit of work '{unitOfWork}' not defined - must be 'No', 'Run' or 'Stage'.")
+
+        self.unitOfWork = unitOfWork
+        self.completedStages = []
+
+        if unitOfWork != 'No':
+            logMsg = f'Backend session unit of work started - {unitOfWork}'
+            logging.info(logMsg)
+
+    def endUnitOfWork(self, commit=True):
+        """
+        End the unit of work, committing (or rolling back) the pinned connections and returning them to the pool.
+
+        :param commit: True commits the outstanding work, False rolls back
+
+        :return:
+        """
+
+        if self.unitOfWork == 'No':
+            return
+
+        if commit:
+            self.commitPinned()
+        else:
+            self.rollbackPinned()
+
+        with self.lock:
+            pinnedConnections = self.pinnedConnections
+            self.pinnedConnections = {}
+            self.unitOfWork = 'No'
+
+        for inDB, rawConnection in pinnedConnections.items():
+            self.releaseConnection(inDB, rawConnection)
+
+        logMsg = (f"Backend session unit of work {'committed' if commit else 'rolled back'} - completed stages:"
+                  f" {', '.join(self.completedStages) if self.completedStages else 'None'}")
+        logging.info(logMsg)
+
+    def commitPinned(self):
+        """
+        Commit the outstanding work on the pinned unit of work connections
+        """
+
+        for rawConnection in list(self.pinnedConnections.values()):
+            rawConnection.commit()
+            self.commitCount += 1
+
+    def rollbackPinned(self):
+        """
+        Roll back the outstanding work on the pinned unit of work connections
+        """
+
+        for inDB, rawConnection in list(self.pinnedConnections.items()):
+            try:
+                rawConnection.rollback()
+            except Exception as e:
+                logging.error(f'Backend session rollback failed: {e}')
+
+            # Cached lookups may hold rolled back writes
+            generalDMClass.invalidateLookups(inDB, session=self)
+
+    @contextmanager
+    def stage(self, stageName):
+        """
+        Named stage of a protocol run.  In 'Stage' unit of work the stage is committed as a checkpoint on success and
+        rolled back on failure (including sys.exit), leaving the prior checkpointed stages in place.  In 'Run' unit of
+        work a stage failure rolls back the full run.  With no unit of work the stage is a pass through.
+
+        :param stageName: Name of the stage being processed (e.g. 'process_Survey')
+
+        :return:
+        """
+
+        self.currentStage = stageName
+        try:
+            yield self
+
+        except BaseException:
+            if self.unitOfWork != 'No':
+                self.rollbackPinned()
+                scope = 'stage' if self.unitOfWork == 'Stage' else 'run at stage'
+                logMsg = f"WARNING - Backend session rolled back {scope} - {stageName}"
+                logging.critical(logMsg)
+            raise
+
+        else:
+            if self.unitOfWork == 'Stage':
+                self.commitPinned()
+                logMsg = f'Backend session checkpoint committed - {stageName}'
+                logging.info(logMsg)
+
+            # Lookup snapshot manifest written once per stage, in 'Run' unit of work at close once committed
+            if self.unitOfWork != 'Run':
+                backendLookups.flushSnapshots()
+
+            self.completedStages.append(stageName)
+
+        finally:
+            self.currentStage = None
+
+    def runStage(self, stageName, stageFunction, *args, allowNone=False, **kwargs):
+        """
+        Run a protocol processing function as a named stage (see 'stage').  The protocol routines log and return None
+        on most failures rather than raising, so while a unit of work is active a None return is treated as a stage
+        failure (rolling back the stage/run) unless 'allowNone'.  With no unit of work the return value is passed
+        through unchanged.
+
+        :param stageName: Name of the stage being processed
+        :param stageFunction: Protocol processing function
+        :param args: Positional arguments passed to the stageFunction
+        :param allowNone: True if the stageFunction returns None on success
+        :param kwargs: Keyword arguments passed to the stageFunction
+
+        :return: outStage: Value returned by the stageFunction
+        """
+
+        with self.stage(stageName):
+            outStage = stageFunction(*args, **kwargs)
+
+            if outStage is None and not allowNone and self.unitOfWork != 'No':
+                raise RuntimeError(f'Stage - {stageName} - failed, no value returned.')
+
+        return outStage
+
+    def close(self):
+        """
+        Close all pooled connections and log the session connection counts
+
+        :return: logMsg: String with the session connection counts
+        """
+
+        # Outstanding unit of work which was not ended is rolled back
+        self.endUnitOfWork(commit=False)
+
+        backendLookups.flushSnapshots()
+
+        # Close the read mirrors
+        for mirror in list(self.readMirrors.values()):
+            mirror.close()
+        self.readMirrors = {}
+
+        # Drop the staging tables created during the run
+        for inDB in list(self.stagingTables):
+            try:
+                self.sweepStagingTables(inDB)
+            except Exception as e:
+                logging.warning(f'Unable to sweep staging tables in - {inDB}: {e}')
+
+        with self.lock:
+            idleConnections = self.idleConnections
+            self.idleConnections = {}
+
+        for connections in idleConnections.values():
+            for rawConnection in connections:
+                try:
+                    rawConnection.close()
+                except Exception:
+                    pass
+
+        # Queued Access COM operations - one Access session per database, the catalogs reflect the COM DDL once run
+        comDBs = list(self.comBatch.operations)
+        self.comBatch.run()
+        for inDB in comDBs:
+            self.invalidateCatalog(inDB)
+
+        logMsg = (f'Backend session opened {self.openCount} connection(s) for {self.checkoutCount} connection'
+                  f' requests - {self.commitCount} unit of work commit(s) - {self.readCount} queries read'
+                  f' {self.readRows} record(s), {self.readBytes / 1048576:.2f} MB in {self.readSeconds:.2f} seconds')
+        logging.info(logMsg)
+
+        return logMsg
+
+
+class accessCOMBatch:
+    """
+    Access COM (pywin32) operations with no SQL equivalent, queued per database and run in a single Access session per
+    database - Access is started, the database opened and Access quit once rather than per operation.
+    """
+
+    def __init__(self):
+        """
+        Define the instantiated accessCOMBatch attributes
+
+        :return: Instantiated accessCOMBatch
+        """
+
+        self.operations = OrderedDict()  # Database path: list of (operation name, function called with CurrentDb)
+        self.sessionCount = 0
+        self.lock = threading.Lock()
+
+    def queue(self, inDBPath, operationName, operation):
+        """
+        Queue an operation for the passed database.
+
+        :param inDBPath: path to database
+        :param operationName: Operation description used in the log
+        :param operation: Function called with the Access CurrentDb object
+
+        :return:
+        """
+
+        with self.lock:
+            self.operations.setdefault(inDBPath, []).append((operationName, operation))
+
+    def run(self):
+        """
+        Run the queued operations, failed operations are logged and the remaining operations run.
+
+        :return: Number of operations run
+        """
+
+        with self.lock:
+            operations = self.operations
+            self.operations = OrderedDict()
+
+        if operations and win32com is None:
+            logging.warning(f'Access COM operations skipped, pywin32 not installed - {list(operations)}')
+            return 0
+
+        operationCount = 0
+        for inDBPath, dbOperations in operations.items():
+            # Initialize the Access application and open the database once for all the operations
+            access_app = win32com.client.Dispatch('Access.Application')
+            self.sessionCount += 1
+            try:
+                access_app.OpenCurrentDatabase(inDBPath)
+                db = access_app.CurrentDb()
+
+                for operationName, operation in dbOperations:
+                    try:
+                        operation(db)
+                        operationCount += 1
+                        logging.info(f'Access COM - {operationName}')
+                    except Exception as e:
+                        logging.warning(f'Access COM operation failed - {operationName}: {e}')
+            finally:
+                # Close the database and quit Access
+                access_app.CloseCurrentDatabase()
+                access_app.Quit()
+                del access_app
+
+        return operationCount
+
+
+class pooledConnection:
+    """
+    Wrapper on a pooled ODBC connection.  All attributes are passed through to the ODBC connection except close()
+    which returns the connection to the backendSession pool.  Pinned unit of work connections defer commit() to the
+    session stage checkpoints and are not released on close().
+    """
+
+    def __init__(self, session, inDB, rawConnection, pinned=False):
+        """
+        Define the instantiated pooledConnection attributes
+
+        :param session: Owning backendSession
+        :param inDB: Full path and name to the backend database
+        :param rawConnection: ODBC connection being wrapped
+        :param pinned: True if the connection holds the session unit of work transaction
+
+        :return: Instantiated pooledConnection
+        """
+
+        self.session = session
+        self.inDB = inDB
+        self.rawConnection = rawConnection
+        self.pinned = pinned
+
+    def __getattr__(self, name):
+        return getattr(self.rawConnection, name)
+
+    def commit(self):
+        """
+        Commit the connection, deferred to the session checkpoints when pinned to a unit of work.
+        """
+
+        if not self.pinned:
+            self.rawConnection.commit()
+
+    def close(self):
+        """
+        Return the connection to the session pool, subsequent close calls are ignored.
+        """
+
+        if self.rawConnection is not None and not self.pinned:
+            self.session.releaseConnection(self.inDB, self.rawConnection)
+        self.rawConnection = None
+
+
+class tableWriter:
+    """
+    Schema driven writer for a backend destination table.  Built once per table from the backend column metadata,
+    holds the table column order, the per column type converters and the compiled parameterized insert statement(s)
+    reused for every append.  Dataframe fields are matched to the table fields by name (case insensitive).
+    """
+
+    # Access ODBC type names to the converter applied to the dataframe field before the append
+    integerTypes = ('COUNTER', 'INTEGER', 'SMALLINT', 'BYTE', 'BIGINT', 'TINYINT')
+    floatTypes = ('DOUBLE', 'REAL', 'FLOAT', 'CURRENCY', 'DECIMAL', 'NUMERIC')
+    textTypes = ('VARCHAR', 'LONGCHAR', 'CHAR', 'WCHAR', 'WVARCHAR', 'WLONGVARCHAR', 'TEXT')
+    # Access ODBC type names to the Access text driver (schema.ini) types used by the text bulk load
+    textImportTypes = {'COUNTER': 'Long', 'INTEGER': 'Long', 'SMALLINT': 'Short', 'BYTE': 'Byte', 'DOUBLE': 'Double',
+                       'FLOAT': 'Double', 'DECIMAL': 'Double', 'NUMERIC': 'Double', 'REAL': 'Single',
+                       'CURRENCY': 'Currency', 'BIT': 'Bit', 'DATETIME': 'DateTime', 'LONGCHAR': 'Memo'}
+    yesNoMap = {'yes': True, 'y': True, 'true': True, '1': True, 'no': False, 'n': False, 'false': False, '0': False}
+    # Text representations of a null source value, not reported as failed conversions
+    nullValues = ('', 'nan', 'none', 'nat', '<na>')
+
+    def __init__(self, tableName, inDB, session=None):
+        """
+        Define the instantiated tableWriter attributes via the backend column metadata
+
+        :param tableName: Destination table name
+        :param inDB: Full path and name to the backend database
+        :param session: Optional backendSession instance with pooled connections for the run
+
+        :return: Instantiated tableWriter
+        """
+
+        self.tableName = tableName
+        self.inDB = inDB
+        self.session = session
+        self.catalog = generalDMClass.getCatalog(inDB, session=session)
+
+        columnRecords = self.catalog.getColumns(tableName)
+        if not columnRecords:
+            raise ValueError(f"Table '{tableName}' not found or has no fields in - {inDB}")
+
+        self.columns = [record['columnName'] for record in columnRecords]
+        self.columnTypes = {record['columnName']: record['typeName'] for record in columnRecords}
+        self.columnLookup = {column.lower(): column for column in self.columns}
+        self.converters = {column: tableWriter.defineConverter(typeName)
+                           for column, typeName in self.columnTypes.items()}
+        self.insertQueries = {}  # Tuple of table fields: compiled insert statement
+
+    def defineConverter(typeName):
+        """
+        Define the dataframe field converter for the passed backend type name
+
+        :param typeName: Backend ODBC type name (e.g. 'INTEGER', 'VARCHAR')
+
+        :return: Converter function taking and returning a pandas series
+        """
+
+        if typeName in tableWriter.integerTypes:
+            return tableWriter.convertInteger
+        elif typeName in tableWriter.floatTypes:
+            return tableWriter.convertFloat
+        elif typeName == 'BIT':
+            return tableWriter.convertYesNo
+        elif typeName == 'DATETIME':
+            return tableWriter.convertDateTime
+        elif typeName in tableWriter.textTypes:
+            return tableWriter.convertText
+        else:
+            return lambda inSeries: inSeries
+
+    def convertInteger(inSeries):
+        outSeries = pd.to_numeric(inSeries, errors='coerce')
+        # Only cast to the nullable integer type when all values are whole numbers
+        if (outSeries.dropna() % 1 == 0).all():
+            outSeries = outSeries.astype('Int64')
+        return outSeries
+
+    def convertFloat(inSeries):
+        return pd.to_numeric(inSeries, errors='coerce')
+
+    def convertYesNo(inSeries):
+        if inSeries.dtype == bool:
+            return inSeries
+        textSeries = inSeries.astype(str).str.strip().str.lower()
+        outSeries = textSeries.map(tableWriter.yesNoMap)
+        # Numeric values (e.g. 1.0/0.0 from a float field with NaN, Access -1) - nonzero is Yes, NaN is Null
+        numericSeries = pd.to_numeric(textSeries, errors='coerce')
+        return outSeries.where(outSeries.notna() | numericSeries.isna(), numericSeries != 0)
+
+    def convertDateTime(inSeries):
+        # Access DATETIME is time zone naive
+        if isinstance(inSeries.dtype, pd.DatetimeTZDtype):
+            return inSeries.dt.tz_localize(None)
+        return inSeries
+
+    def convertText(inSeries):
+        if inSeries.dtype == object:
+            return inSeries.where(inSeries.isna() | inSeries.map(lambda x: isinstance(x, str)), inSeries.astype(str))
+        return inSeries.astype(object).where(inSeries.isna(), inSeries.astype(str))
+
+    def failedConversions(self, inDF, outDF, dfFields, maxValues=5):
+        """
+        Source values which the type converters turned into Null (or integer fields left with fractional values).
+
+        :param inDF: Source dataframe
+        :param outDF: Converted dataframe (see 'prepare')
+        :param dfFields: Dictionary table field: source dataframe field
+        :param maxValues: Maximum number of distinct failing values reported per field
+
+        :return: List of (field, failing values) tuples, empty if all values converted
+        """
+
+        failedValues = []
+        for col in outDF.columns:
+            sourceSeries = inDF[dfFields[col]]
+            failed = (sourceSeries.notna() & outDF[col].isna()
+                      & ~sourceSeries.astype(str).str.strip().str.lower().isin(tableWriter.nullValues))
+
+            if self.columnTypes[col] in tableWriter.integerTypes and outDF[col].dtype.kind == 'f':
+                failed |= outDF[col].notna() & (outDF[col] % 1 != 0)
+
+            if failed.any():
+                failedValues.append((col, sourceSeries[failed].drop_duplicates().tolist()[:maxValues]))
+
+        return failedValues
+
+    def getInsertQuery(self, columns):
+        """
+        Compiled parameterized insert statement for the passed table fields, compiled once per field set.
+
+        :param columns: List of table fields being appended (table order)
+
+        :return: insertQuery: Parameterized insert statement
+        """
+
+        key = tuple(columns)
+        insertQuery = self.insertQueries.get(key)
+        if insertQuery is None:
+            insertQuery = (f"INSERT INTO [{self.tableName}] ({', '.join(f'[{col}]' for col in columns)}) "
+                           f"VALUES ({', '.join(['?'] * len(columns))})")
+            self.insertQueries[key] = insertQuery
+
+        return insertQuery
+
+    def prepare(self, inDF):
+        """
+        Subset and convert the passed dataframe to the destination table fields in table order.
+
+        :param inDF: Dataframe with fields named as the destination table fields
+
+        :return: outDF: Dataframe with the table fields in table order with the type converters applied
+        """
+
+        unknownFields = [col for col in inDF.columns if col.lower() not in self.columnLookup]
+        if unknownFields:
+            raise ValueError(f"Fields {unknownFields} are not in the destination table - {self.tableName}")
+
+        dfFields = {self.columnLookup[col.lower()]: col for col in inDF.columns}
+        columns = [col for col in self.columns if col in dfFields]
+
+        outDF = pd.DataFrame({col: self.converters[col](inDF[dfFields[col]]) for col in columns},
+                             index=inDF.index)
+
+        # Values the converters can't convert (e.g. text in a numeric field) fail the append rather than loading Null
+        failedValues = self.failedConversions(inDF, outDF, dfFields)
+        if failedValues:
+            raise ValueError(f"Values can't be converted to the field type in - {self.tableName} - (field, values):"
+                             f" {failedValues}")
+
+        # Text values longer than the backend field size fail the insert, report all offending fields up front
+        overLength = self.catalog.validateTextLengths(self.tableName, outDF)
+        if overLength:
+            raise ValueError(f"Values exceed the field size in - {self.tableName} - (field, max length, field size):"
+                             f" {overLength}")
+
+        return outDF
+
+    def append(self, inDF, dmInstance, batchSize=1000, nullStrings=('nan',), returnKeys=None):
+        """
+        Append the passed dataframe to the destination table.  When the session has a text import directory (see
+        'backendSession.textImportDir') records are bulk loaded by the Access engine from a CSV file (see
+        'appendText'), otherwise (or if the bulk load is not possible) via the batched 'appendDataSet' engine.
+
+        :param inDF: Dataframe with fields named as the destination table fields
+        :param dmInstance: Data management instance
+        :param batchSize: Number of records per 'executemany' batch
+        :param nullStrings: String values appended as Null (see 'buildInsertPayload')
+        :param returnKeys: Optional (source key field, autonumber key field[, additional fields...]) read back for
+        the inserted records (see 'appendDataSet')
+
+        :return: outDF: Dataframe as appended, or if returnKeys the dataframe with the inserted record keys
+        """
+
+        outDF = self.prepare(inDF)
+
+        textImportDir = getattr(self.session, 'textImportDir', None)
+        if returnKeys is None and textImportDir and self.appendText(outDF, textImportDir,
+                                                                    nullStrings=nullStrings) is not None:
+            return outDF
+
+        return self.appendODBC(outDF, dmInstance, batchSize=batchSize, nullStrings=nullStrings, returnKeys=returnKeys)
+
+    def appendODBC(self, outDF, dmInstance, batchSize=1000, nullStrings=('nan',), returnKeys=None):
+        """
+        Append the prepared dataframe (see 'prepare') via the batched 'appendDataSet' engine.
+
+        :return: outDF: Dataframe as appended, or if returnKeys the dataframe with the inserted record keys
+        """
+
+        insertQuery = self.getInsertQuery(outDF.columns.tolist())
+
+        cnxn = generalDMClass.connect_DB_Access(self.inDB, session=self.session)
+        keysDF = generalDMClass.appendDataSet(cnxn, outDF, self.tableName, insertQuery, dmInstance,
+                                              batchSize=batchSize, nullStrings=nullStrings, returnKeys=returnKeys)
+
+        return keysDF if returnKeys is not None else outDF
+
+    def writeTextImport(self, outDF, importDir, nullStrings=('nan',)):
+        """
+        Write the prepared dataframe to a normalized CSV file with the schema.ini defining the backend field types, so
+        the Access text driver reads the values with the destination types.
+
+        :param outDF: Prepared dataframe (see 'prepare')
+        :param importDir: Directory the CSV file and schema.ini are written to (one file per directory)
+        :param nullStrings: String values written as Null
+
+        :return: fileName: CSV file name
+        """
+
+        fileName = f"{re.sub(r'[^A-Za-z0-9_]', '_', self.tableName)}.csv"
+        textDF = pd.DataFrame(index=outDF.index)
+        schemaLines = [f"[{fileName}]", "ColNameHeader=True", "Format=CSVDelimited", "CharacterSet=65001",
+                       "MaxScanRows=0", "DateTimeFormat=yyyy-mm-dd hh:nn:ss", "DecimalSymbol=."]
+
+        for columnNumber, column in enumerate(outDF.columns, start=1):
+            typeName = self.columnTypes[column]
+            textType = tableWriter.textImportTypes.get(typeName, 'Text')
+            values = outDF[column]
+
+            if textType == 'DateTime':
+                values = pd.to_datetime(values).dt.strftime('%Y-%m-%d %H:%M:%S')
+            elif textType == 'Bit':
+                values = values.map({True: 'True', False: 'False'})
+            elif textType in ('Text', 'Memo'):
+                values = values.where(~values.isin(nullStrings))
+                if textType == 'Text':
+                    size = next((record['columnSize'] for record in self.catalog.getColumns(self.tableName)
+                                 if record['columnName'] == column), None) or 255
+                    textType = f'Text Width {size}'
+
+            textDF[column] = values
+            schemaLines.append(f'Col{columnNumber}="{column}" {textType}')
+
+        textDF.to_csv(os.path.join(importDir, fileName), index=False, encoding='utf-8', quoting=csv.QUOTE_MINIMAL,
+                      lineterminator='\r\n')
+        with open(os.path.join(importDir, 'schema.ini'), 'w', encoding='utf-8') as schemaFile:
+            schemaFile.write("\n".join(schemaLines) + "\n")
+
+        return fileName
+
+    def appendText(self, outDF, textImportDir, nullStrings=('nan',)):
+        """
+        Bulk load the prepared dataframe in one 'INSERT INTO ... SELECT ... FROM [Text;...].[file#csv]' statement, the
+        Access engine reads the CSV file (see 'writeTextImport') rather than each value being sent over ODBC.  Only
+        Access backends and values without line breaks (not supported by the text driver) are bulk loaded.  Not used
+        while a unit of work is active - a failed load would have to roll back the pinned connection (losing the prior
+        work of the unit of work) and a load on a separate connection would be committed outside the unit of work.
+
+        :param outDF: Prepared dataframe (see 'prepare')
+        :param textImportDir: Parent directory for the CSV file and schema.ini
+        :param nullStrings: String values appended as Null
+
+        :return: Number of records loaded, None if not bulk loaded (caller falls back to 'appendODBC')
+        """
+
+        if outDF.empty or generalDMClass.getBackend(self.inDB) is not accessBackend:
+            return None
+
+        if self.session is not None and self.session.unitOfWork != 'No':
+            return None
+
+        textColumns = [column for column in outDF.columns if self.columnTypes[column] in tableWriter.textTypes]
+        for column in textColumns:
+            if outDF[column].dropna().astype(str).str.contains(r'[\r\n]').any():
+                return None
+
+        startTime = time.perf_counter()
+        os.makedirs(textImportDir, exist_ok=True)
+        importDir = tempfile.mkdtemp(prefix='textImport_', dir=textImportDir)
+        try:
+            fileName = self.writeTextImport(outDF, importDir, nullStrings=nullStrings)
+            fields = ", ".join([f"[{column}]" for column in outDF.columns])
+            insertQuery = (f"INSERT INTO [{self.tableName}] ({fields}) SELECT {fields} FROM "
+                           f"[Text;HDR=YES;FMT=Delimited;CharacterSet=65001;Database={importDir}]."
+                           f"[{fileName.replace('.', '#')}];")
+
+            cnxn = generalDMClass.connect_DB_Access(self.inDB, session=self.session)
+            try:
+                cursor = cnxn.cursor()
+                cursor.execute(insertQuery)
+                recCount = cursor.rowcount
+                cnxn.commit()
+                cursor.close()
+            except backendErrors as e:
+                cnxn.rollback()
+                logMsg = f'Text bulk load to {self.tableName} failed, appending via ODBC: {e}'
+                logging.warning(logMsg)
+                return None
+            finally:
+                cnxn.close()
+        finally:
+            shutil.rmtree(importDir, ignore_errors=True)
+
+        generalDMClass.invalidateLookups(self.inDB, self.tableName, session=self.session, insertOnly=True)
+
+        logMsg = (f'Text bulk loaded {recCount} record(s) to {self.tableName} in'
+                  f' {time.perf_counter() - startTime:.2f} seconds')
+        logging.info(logMsg)
+
+        return recCount
+
+
+class keyResolver:
+    """
+    GlobalID to surrogate (autonumber) key index for a parent table, shared by the child processors of a run so each
+    child doesn't re-read the full parent table to define its parent key.  Only the (GlobalID, key) pairs (plus any
+    requested fields) are read.  A GlobalID may have more than one parent record (e.g. Elephant Seal E_Seal and
+    Seal_Resight events), 'frame' returns all the records and 'resolve' uses a hash index on the GlobalID with the
+    latest key.  Records appended to the parent table during the run are added incrementally (key greater than the
+    maximum key loaded).
+    """
+
+    def __init__(self, tableName, inDB, session=None, keyField='ID', globalIDField='GlobalID', fields=()):
+        """
+        Define the instantiated keyResolver attributes
+
+        :param tableName: Parent table name
+        :param inDB: Full path and name to the backend database
+        :param session: Optional backendSession instance with pooled connections for the run
+        :param keyField: Surrogate (autonumber) key field
+        :param globalIDField: GlobalID field
+        :param fields: Additional parent fields retained with the key
+
+        :return: Instantiated keyResolver
+        """
+
+        self.tableName = tableName
+        self.inDB = inDB
+        self.session = session
+        self.keyField = keyField
+        self.globalIDField = globalIDField
+        self.fields = list(fields)
+        self.keys = None  # Dataframe with the GlobalID, key field and additional fields
+        self.index = None  # Series GlobalID: latest key, built on first resolve
+        self.stale = False
+        self.loadCount = 0
+        self.refreshCount = 0
+
+    def selectQuery(self, minKey=None):
+        """
+        Query reading the (GlobalID, key) pairs, only the keys greater than 'minKey' if passed.
+        """
+
+        fields = ", ".join([f"[{field}]" for field in [self.globalIDField, self.keyField] + self.fields])
+        whereClause = f"[{self.globalIDField}] Is Not Null"
+        if minKey is not None:
+            whereClause += f" AND [{self.keyField}] > {int(minKey)}"
+
+        return f"SELECT {fields} FROM [{self.tableName}] WHERE {whereClause};"
+
+    def load(self):
+        """
+        Read all the (GlobalID, key) pairs of the parent table.
+        """
+
+        self.keys = None
+        self.addRecords(generalDMClass.connect_to_AcessDB_DF(self.selectQuery(), self.inDB, session=self.session))
+        self.stale = False
+        self.loadCount += 1
+
+    def refresh(self):
+        """
+        Add the (GlobalID, key) pairs appended to the parent table since the last read.
+        """
+
+        maxKey = self.keys[self.keyField].max() if not self.keys.empty else None
+        if pd.isna(maxKey):
+            maxKey = None
+        self.addRecords(generalDMClass.connect_to_AcessDB_DF(self.selectQuery(maxKey), self.inDB,
+                                                             session=self.session))
+        self.stale = False
+        self.refreshCount += 1
+
+    def addRecords(self, inDF):
+        """
+        Add (GlobalID, key) records to the resolver, later records replace an existing key.
+
+        :param inDF: Dataframe with the GlobalID, key and additional fields
+
+        :return:
+        """
+
+        records = inDF[[self.globalIDField, self.keyField] + self.fields]
+        if self.keys is not None:
+            records = pd.concat([self.keys, records], ignore_index=True)
+        self.keys = records.drop_duplicates(subset=self.keyField, keep='last').reset_index(drop=True)
+        self.index = None
+
+    def markStale(self, insertOnly=True):
+        """
+        Flag the resolver after a write to the parent table.
+
+        :param insertOnly: True appended records are added incrementally, False the resolver is reloaded
+
+        :return:
+        """
+
+        if insertOnly and self.keys is not None:
+            self.stale = True
+        else:
+            self.keys = None
+            self.index = None
+
+    def ensureCurrent(self):
+        """
+        Load or incrementally refresh the resolver as needed.
+        """
+
+        if self.keys is None:
+            self.load()
+        elif self.stale:
+            self.refresh()
+
+    def resolve(self, globalIDs):
+        """
+        Surrogate keys for the passed GlobalIDs.
+
+        :param globalIDs: Series (or list) of GlobalIDs
+
+        :return: Series of keys aligned to the passed GlobalIDs, null where the GlobalID is not in the parent table
+        """
+
+        self.ensureCurrent()
+        if self.index is None:
+            latest = self.keys.sort_values(self.keyField).drop_duplicates(subset=self.globalIDField, keep='last')
+            self.index = latest.set_index(self.globalIDField)[self.keyField]
+
+        return pd.Series(globalIDs).map(self.index).rename(self.keyField)
+
+    def frame(self):
+        """
+        Resolver records as a dataframe with the GlobalID, key and additional fields, used to join child records to
+        their parent key.
+        """
+
+        self.ensureCurrent()
+
+        return self.keys.copy()
+
+
+class indexAdvisor:
+    """
+    Records the columns the ETL statements join and filter on per backend table, and compares them with the backend
+    catalog indexes.  Columns with no index led by the column are reported with the table record count, and can be
+    indexed in the opt-in maintenance mode (see 'backendSession.adviseIndexes').
+    """
+
+    # table.[field] = table.[field] join/correlation conditions, table aliases and single table filters
+    joinPattern = re.compile(r'(\[?\w+\]?)\.\[?(\w+)\]?\s*=\s*(\[?\w+\]?)\.\[?(\w+)\]?')
+    aliasPattern = re.compile(r'\[?(\w+)\]?\s+AS\s+(\w+)', re.IGNORECASE)
+    singleTablePattern = re.compile(r'\b(?:FROM|UPDATE)\s+\[?(\w+)\]?\s+(?:SET\s+.*?\s+)?WHERE\s+(.*)',
+                                    re.IGNORECASE | re.DOTALL)
+    filterPattern = re.compile(r'(?<![.\w\]])\[?(\w+)\]?\s*(?:=|IN\s*\()', re.IGNORECASE)
+
+    def __init__(self):
+        """
+        Define the instantiated indexAdvisor attributes
+
+        :return: Instantiated indexAdvisor
+        """
+
+        self.usage = {}  # Backend path: {(lower case table, lower case column): [table, column, statement count]}
+        self.lock = threading.Lock()
+
+    def record(self, inDB, statement):
+        """
+        Record the join and filter columns of an executed statement.
+
+        :param inDB: Full path and name to the backend database
+        :param statement: SQL statement
+
+        :return: List of the (table, column) recorded
+        """
+
+        aliases = {alias.lower(): table for table, alias in indexAdvisor.aliasPattern.findall(statement)}
+        columns = []
+        # Assignments of an UPDATE are not join conditions
+        conditions = re.sub(r'\bSET\b.*?(?=\bWHERE\b|$)', ' ', statement, flags=re.IGNORECASE | re.DOTALL)
+        for table1, column1, table2, column2 in indexAdvisor.joinPattern.findall(conditions):
+            for table, column in ((table1, column1), (table2, column2)):
+                table = table.strip('[]')
+                columns.append((aliases.get(table.lower(), table), column))
+
+        match = indexAdvisor.singleTablePattern.search(statement)
+        if match and not re.search(r'\bJOIN\b', statement, re.IGNORECASE):
+            columns.extend([(match.group(1), column) for column in
+                            indexAdvisor.filterPattern.findall(match.group(2))
+                            if column.upper() not in ('AND', 'OR', 'NOT', 'WHERE')])
+
+        # Staging tables are indexed when created
+        columns = [(table, column) for table, column in dict.fromkeys(columns)
+                   if not table.lower().startswith((backendSession.stagingPrefix.lower(), 'tmptable_'))]
+
+        with self.lock:
+            usage = self.usage.setdefault(inDB, {})
+            for table, column in columns:
+                usage.setdefault((table.lower(), column.lower()), [table, column, 0])[2] += 1
+
+        return columns
+
+    def missingIndexes(self, inDB, session=None):
+        """
+        Recorded join/filter columns without an index led by the column.
+
+        :param inDB: Full path and name to the backend database
+        :param session: Optional backendSession instance with pooled connections for the run
+
+        :return: List of dictionaries 'table', 'column', 'statements' and 'rows' (table record count), largest tables
+        first
+        """
+
+        catalog = generalDMClass.getCatalog(inDB, session=session)
+        with self.lock:
+            usage = list(self.usage.get(inDB, {}).values())
+
+        missing = []
+        rowCounts = {}
+        for table, column, statements in usage:
+            if not catalog.tableExists(table):
+                continue
+            if column.lower() not in [record['columnName'].lower() for record in catalog.getColumns(table)]:
+                continue
+            leadingColumns = [columns[0].lower() for columns in catalog.getIndexes(table).values() if columns]
+            if column.lower() in leadingColumns:
+                continue
+
+            if table.lower() not in rowCounts:
+                countDF = generalDMClass.readQuery(f"SELECT COUNT(*) AS RecordCount FROM [{table}];", inDB,
+                                                   session=session)
+                rowCounts[table.lower()] = int(countDF.iloc[0, 0])
+            missing.append({'table': table, 'column': column, 'statements': statements,
+                            'rows': rowCounts[table.lower()]})
+
+        return sorted(missing, key=lambda record: (-record['rows'], record['table'], record['column']))
+
+
+class readMirror:
+    """
+    Optional local SQLite read mirror of backend tables for a run.  The tables are copied once at the start of the run
+    and read-only queries on them are served from the local file rather than over ODBC.  Writes made by the ETL keep
+    the mirror consistent - records appended to tables without an autonumber are applied to the mirror directly,
+    tables with an autonumber pull only the records with a key greater than the mirrored maximum on the next read
+    (Access autonumbers can't be reproduced locally), other writes recopy the table on the next read.  Mirror tables
+    are created with the column types of the backend catalog (see 'mirrorTypes') so an empty or all Null column keeps
+    its type.
+    """
+
+    # Backend catalog type name to the SQLite mirror column type, other types (text, memo, GUID) are TEXT
+    mirrorTypes = {'COUNTER': 'INTEGER', 'INTEGER': 'INTEGER', 'SMALLINT': 'INTEGER', 'BYTE': 'INTEGER',
+                   'TINYINT': 'INTEGER', 'BIT': 'INTEGER', 'DOUBLE': 'REAL', 'REAL': 'REAL', 'FLOAT': 'REAL',
+                   'CURRENCY': 'REAL', 'DECIMAL': 'REAL', 'NUMERIC': 'REAL', 'DATETIME': 'TIMESTAMP'}
+
+    def __init__(self, inDB, mirrorPath, session=None):
+        """
+        Define the instantiated readMirror attributes
+
+        :param inDB: Full path and name to the backend database
+        :param mirrorPath: Path of the SQLite mirror file, an existing file is replaced
+        :param session: Optional backendSession instance with pooled connections for the run
+
+        :return: Instantiated readMirror
+        """
+
+        self.inDB = inDB
+        self.mirrorPath = mirrorPath
+        self.session = session
+        self.tables = {}  # Lower case table name: {'name', 'counter', 'state', 'dates', 'bits'}
+        self.copyCount = 0
+        self.queryCount = 0
+        self.lock = threading.Lock()
+
+        if os.path.exists(mirrorPath):
+            os.remove(mirrorPath)
+        self.connection = sqlite3.connect(mirrorPath, check_same_thread=False)
+
+    def addTable(self, tableName):
+        """
+        Copy a backend table (records and indexes) to the mirror.
+
+        :param tableName: Backend table name
+
+        :return: Number of records copied
+        """
+
+        catalog = generalDMClass.getCatalog(self.inDB, session=self.session)
+        columns = catalog.getColumns(tableName)
+        counters = [record['columnName'] for record in columns if record['typeName'] == 'COUNTER']
+
+        self.connection.execute(f'DROP TABLE IF EXISTS "{tableName}"')
+        fields = ", ".join([f'"{record["columnName"]}" {readMirror.mirrorTypes.get(record["typeName"], "TEXT")}'
+                            for record in columns])
+        self.connection.execute(f'CREATE TABLE "{tableName}" ({fields})')
+        recordCount = self.copyRecords(tableName, f"SELECT * FROM [{tableName}];")
+
+        for indexNumber, indexColumns in enumerate(catalog.getIndexes(tableName).values()):
+            fields = ", ".join([f'"{column}"' for column in indexColumns])
+            self.connection.execute(f'CREATE INDEX "mirror_{tableName}_{indexNumber}" ON "{tableName}" ({fields})')
+        self.connection.commit()
+
+        self.tables[tableName.lower()] = {'name': tableName, 'counter': counters[0] if counters else None,
+                                          'state': 'current',
+                                          'dates': [record['columnName'] for record in columns
+                                                    if record['typeName'] == 'DATETIME'],
+                                          'bits': [record['columnName'] for record in columns
+                                                   if record['typeName'] == 'BIT']}
+        self.copyCount += 1
+
+        logMsg = f'Read mirror copied {recordCount} record(s) from {tableName} to {self.mirrorPath}'
+        logging.info(logMsg)
+
+        return recordCount
+
+    def copyRecords(self, tableName, query):
+        """
+        Append the records of a backend query to the mirror table in chunks.
+
+        :param tableName: Mirror table name (created by 'addTable')
+        :param query: Backend query reading the records
+
+        :return: Number of records copied
+        """
+
+        recordCount = 0
+        for chunk in generalDMClass.readQuery(query, self.inDB, session=self.session, chunksize=50000):
+            chunk.to_sql(tableName, self.connection, if_exists='append', index=False)
+            recordCount += len(chunk)
+
+        return recordCount
+
+    def refreshTable(self, key):
+        """
+        Bring a mirror table current - pull the appended records ('append') or recopy the table ('stale').
+        """
+
+        entry = self.tables[key]
+        if entry['state'] == 'stale':
+            self.addTable(entry['name'])
+
+        elif entry['state'] == 'append':
+            maxKey = self.connection.execute(f'SELECT MAX("{entry["counter"]}") FROM "{entry["name"]}"').fetchone()[0]
+            keyWhere = f" WHERE [{entry['counter']}] > {int(maxKey)}" if maxKey is not None else ""
+            self.copyRecords(entry['name'], f"SELECT * FROM [{entry['name']}]{keyWhere};")
+            self.connection.commit()
+            entry['state'] = 'current'
+
+    def noteWrite(self, tableName=None, inQuery=None, insertOnly=False, insertedRecords=None):
+        """
+        Flag (or apply) a write made by the ETL to mirrored tables.
+
+        :param tableName: Table written, None all tables
+        :param inQuery: Optional SQL statement executed, only the tables named in the statement are flagged
+        :param insertOnly: True if records were only appended
+        :param insertedRecords: Optional (columns, records) appended
+
+        :return:
+        """
+
+        with self.lock:
+            for key, entry in self.tables.items():
+                if tableName is not None and key != tableName.lower():
+                    continue
+                if inQuery is not None and not re.search(r'(?<![\w])' + re.escape(entry['name']) + r'(?![\w])',
+                                                         inQuery, re.IGNORECASE):
+                    continue
+
+                if not insertOnly or entry['state'] == 'stale':
+                    entry['state'] = 'stale'
+                elif entry['counter'] is not None:
+                    entry['state'] = 'append'
+                elif insertedRecords is not None and entry['state'] == 'current':
+                    insertColumns, records = insertedRecords
+                    pd.DataFrame.from_records(records, columns=insertColumns).to_sql(
+                        entry['name'], self.connection, if_exists='append', index=False)
+                    self.connection.commit()
+                else:
+                    entry['state'] = 'stale'
+
+    def read(self, query, tables, params=None):
+        """
+        Read-only query on the mirror, mirror tables are brought current first.  Date/Time and Yes/No fields of the
+        mirrored tables are returned as datetime and boolean as when read from the backend.
+
+        :param query: Query portable between Access and SQLite
+        :param tables: List of the mirrored tables read by the query
+        :param params: Optional query parameters
+
+        :return: queryDf: Query dataframe
+        """
+
+        with self.lock:
+            for tableName in tables:
+                self.refreshTable(tableName.lower())
+
+            self.queryCount += 1
+            queryDf = pd.read_sql_query(query, self.connection, params=params)
+
+            for tableName in tables:
+                entry = self.tables[tableName.lower()]
+                for column in set(entry['dates']).intersection(queryDf.columns):
+                    queryDf[column] = pd.to_datetime(queryDf[column])
+                for column in set(entry['bits']).intersection(queryDf.columns):
+                    if queryDf[column].notna().all():
+                        queryDf[column] = queryDf[column].astype(bool)
+
+            return queryDf
+
+    def close(self):
+        """
+        Close and remove the mirror file.
+        """
+
+        self.connection.close()
+        try:
+            os.remove(self.mirrorPath)
+        except OSError:
+            pass
+
+
+class accessBackend:
+    """
+    Microsoft Access backend (.accdb/.mdb) - data via the Access ODBC driver (pyodbc), saved query and table
+    management via the Access COM interface (pywin32).  Windows only.
+    """
+
+    name = 'Access'
+    extensions = ('.accdb', '.mdb')
+    comDDL = True  # Access COM interface for the operations without a SQL equivalent (query descriptions)
+    schemaCreate = False  # Backends are created in Access, not from a schema script
+
+    def connect(inDB):
+        """
+        Open an ODBC connection to the Access backend.
+
+        :param inDB: Full path and name to access database
+
+        :return: cnxn: pyodbc connection
+        """
+
+        if pyodbc is None:
+            raise ImportError(f'pyodbc is required for the Access backend - {inDB}')
+
+        connStr = (r"DRIVER={Microsoft Access Driver (*.mdb, *.accdb)};DBQ=" + inDB + ";")
+        return pyodbc.connect(connStr)
+
+
+class sqliteBackend:
+    """
+    SQLite backend (.sqlite/.sqlite3/.db) - complete reference implementation of the backend used to run, profile and
+    benchmark the protocol workflows without Access (e.g. Linux build agents).  Connections are wrapped to expose the
+    pyodbc surface the generalDM helpers use (see 'sqliteConnection'), the Access SQL generated by the helpers is
+    translated to SQLite (see 'translate') and the backend is built from a schema script (see 'createBackend',
+    'generalDMClass.exportSchemaScript').
+    """
+
+    name = 'SQLite'
+    extensions = ('.sqlite', '.sqlite3', '.db')
+    comDDL = False  # No COM interface, saved queries are views
+    schemaCreate = True  # Backend built from a schema script (see 'createBackend')
+
+    # Declared column type (first word) to the ODBC type name reported by the Access driver catalog
+    typeNames = {'COUNTER': 'COUNTER', 'AUTOINCREMENT': 'COUNTER', 'LONG': 'INTEGER', 'INTEGER': 'INTEGER',
+                 'INT': 'INTEGER', 'SHORT': 'SMALLINT', 'SMALLINT': 'SMALLINT', 'BYTE': 'BYTE', 'TEXT': 'VARCHAR',
+                 'VARCHAR': 'VARCHAR', 'CHAR': 'VARCHAR', 'MEMO': 'LONGCHAR', 'LONGTEXT': 'LONGCHAR', 'YESNO': 'BIT',
+                 'BIT': 'BIT', 'DATETIME': 'DATETIME', 'DATE': 'DATETIME', 'DOUBLE': 'DOUBLE', 'FLOAT': 'DOUBLE',
+                 'SINGLE': 'REAL', 'REAL': 'REAL', 'CURRENCY': 'CURRENCY', 'DECIMAL': 'DECIMAL', 'NUMERIC': 'DECIMAL',
+                 'GUID': 'GUID'}
+
+    # Access SQL generated by the generalDM helpers and the SQLite equivalent
+    updateJoinPattern = re.compile(r'^\s*UPDATE\s+(\[?\w+\]?)\s+INNER\s+JOIN\s+(\[?\w+\]?)\s+ON\s+(.*?)\s+SET\s+(.*?)'
+                                   r'(?:\s+WHERE\s+(.*?))?\s*;?\s*$', re.IGNORECASE | re.DOTALL)
+    deleteJoinPattern = re.compile(r'^\s*DELETE\s+(\[?\w+\]?)\.\*\s+FROM\s+\[?\w+\]?\s+INNER\s+JOIN\s+(\[?\w+\]?)\s+'
+                                   r'ON\s+(.*?)\s*;?\s*$', re.IGNORECASE | re.DOTALL)
+    createIndexPattern = re.compile(r'^\s*CREATE\s+(UNIQUE\s+)?INDEX\s+\[?(\w+)\]?\s+ON\s+\[?(\w+)\]?', re.IGNORECASE)
+    selectIntoPattern = re.compile(r'^\s*SELECT\s+(.*?)\s+INTO\s+(\[?\w+\]?)\s+FROM\s+', re.IGNORECASE | re.DOTALL)
+    counterPattern = re.compile(r'(?<![\w\]])(?!KEY\b)(\[?\w+\]?)\s+(?:COUNTER|AUTOINCREMENT)(?:\s*\(\s*\d+\s*,\s*\d+\s*\))?'
+                                r'(?:\s+PRIMARY\s+KEY)?', re.IGNORECASE)
+    # String concatenation - chains of '&' on fields/literals (e.g. [FirstName] & '_' & [LastName]), string literals
+    # and bracketed names are matched so an '&' inside them isn't translated
+    literalPattern = r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\""
+    operandPattern = rf"(?:{literalPattern}|(?:\[[^\]]+\]|\w+)(?:\.(?:\[[^\]]+\]|\w+))*)"
+    concatPattern = re.compile(rf"(?P<chain>{operandPattern}(?:\s*&\s*{operandPattern})+)|{literalPattern}|\[[^\]]*\]"
+                               r"|(?P<operator>&)")
+
+    typesRegistered = False
+
+    def registerTypes():
+        """
+        Register the SQLite adapters for the parameter types passed by the generalDM helpers (pandas/numpy scalars,
+        datetimes, decimals) and the converters returning Date/Time and Yes/No fields as datetime and bool.
+        """
+
+        if sqliteBackend.typesRegistered:
+            return
+
+        for dateType in (datetime, pd.Timestamp):
+            sqlite3.register_adapter(dateType, lambda value: value.isoformat(' '))
+        for intType in (np.int64, np.int32, np.int16, np.int8):
+            sqlite3.register_adapter(intType, int)
+        for floatType in (np.float64, np.float32):
+            sqlite3.register_adapter(floatType, float)
+        sqlite3.register_adapter(np.bool_, int)
+        sqlite3.register_adapter(decimal.Decimal, float)
+
+        def convertDateTime(value):
+            try:
+                return datetime.fromisoformat(value.decode())
+            except ValueError:
+                return value.decode()
+
+        for typeName in ('DATETIME', 'DATE'):
+            sqlite3.register_converter(typeName, convertDateTime)
+        for typeName in ('YESNO', 'BIT'):
+            sqlite3.register_converter(typeName, lambda value: bool(int(value)))
+
+        sqliteBackend.typesRegistered = True
+
+    def connect(inDB):
+        """
+        Open a connection to the SQLite backend.
+
+        :param inDB: Full path and name to the SQLite database
+
+        :return: cnxn: sqliteConnection
+        """
+
+        sqliteBackend.registerTypes()
+        if not os.path.exists(inDB):
+            raise FileNotFoundError(f'SQLite backend does not exist - {inDB}')
+
+        return sqliteConnection(sqlite3.connect(inDB, detect_types=sqlite3.PARSE_DECLTYPES, check_same_thread=False))
+
+    def createBackend(inDB, schemaScript):
+        """
+        Create (replace) a SQLite backend from a schema script - Access DDL (COUNTER, LONG, TEXT(n), YESNO, MEMO, ...)
+        is accepted, optional INSERT statements load lookup records.
+
+        :param inDB: Full path and name to the SQLite database being created
+        :param schemaScript: Path to the schema script or the script text
+
+        :return: inDB
+        """
+
+        if os.path.exists(schemaScript):
+            with open(schemaScript, 'r', encoding='utf-8') as scriptFile:
+                schemaScript = scriptFile.read()
+
+        if os.path.exists(inDB):
+            os.remove(inDB)
+
+        sqliteBackend.registerTypes()
+        connection = sqlite3.connect(inDB)
+        try:
+            connection.executescript(sqliteBackend.translate(schemaScript))
+            connection.commit()
+        finally:
+            connection.close()
+
+        logMsg = f'Created SQLite backend - {inDB}'
+        logging.info(logMsg)
+
+        return inDB
+
+    def translate(statement):
+        """
+        Translate the Access SQL generated by the generalDM helpers to SQLite - UPDATE ... INNER JOIN ... SET to
+        UPDATE ... SET ... FROM, DELETE table.* ... INNER JOIN to DELETE ... WHERE EXISTS, make table queries to
+        CREATE TABLE ... AS, COUNTER/AUTOINCREMENT fields to autoincrement primary keys, index names prefixed with
+        the table name (Access index names are per table, SQLite index names per database) and '&' string
+        concatenation to '||' (see 'translateConcatenation').
+
+        :param statement: SQL statement (or script)
+
+        :return: SQLite statement
+        """
+
+        if '&' in statement:
+            statement = sqliteBackend.translateConcatenation(statement)
+
+        match = sqliteBackend.updateJoinPattern.match(statement)
+        if match:
+            target, source, onClause, setClause, whereClause = match.groups()
+            # SQLite doesn't allow the target table qualifier on the assigned fields
+            setClause = re.sub(r'(^|,)\s*' + re.escape(target) + r'\.(\[[^\]]+\]|\w+)\s*=', r'\1 \2 =', setClause)
+            where = f"({onClause})" + (f" AND ({whereClause})" if whereClause else "")
+            return f"UPDATE {target} SET {setClause} FROM {source} WHERE {where};"
+
+        match = sqliteBackend.deleteJoinPattern.match(statement)
+        if match:
+            target, source, onClause = match.groups()
+            return f"DELETE FROM {target} WHERE EXISTS (SELECT 1 FROM {source} WHERE {onClause});"
+
+        match = sqliteBackend.createIndexPattern.match(statement)
+        if match:
+            unique, indexName, tableName = match.groups()
+            if not indexName.lower().startswith(f'{tableName}_'.lower()):
+                indexName = f'{tableName}_{indexName}'
+            return f"CREATE {unique or ''}INDEX [{indexName}] ON [{tableName}]" + statement[match.end():]
+
+        match = sqliteBackend.selectIntoPattern.match(statement)
+        if match:
+            return f"CREATE TABLE {match.group(2)} AS SELECT {match.group(1)} FROM " + statement[match.end():]
+
+        if re.search(r'\bCREATE\s+TABLE\b', statement, re.IGNORECASE):
+            return sqliteBackend.counterPattern.sub(r'\1 INTEGER PRIMARY KEY AUTOINCREMENT', statement)
+
+        return statement
+
+    def translateConcatenation(statement):
+        """
+        Translate Access '&' string concatenation to SQLite '||' ('&' is a bitwise AND in SQLite).  Access treats a
+        Null operand as an empty string, so the field operands of a concatenation chain are wrapped in IFNULL (a chain
+        of Null fields returns '' rather than Null).  An '&' with a complex operand (e.g. a function call) is
+        translated to '||' as is.
+
+        :param statement: Access SQL statement
+
+        :return: Statement with SQLite string concatenation
+        """
+
+        def translateMatch(match):
+            if match.group('operator'):
+                return '||'
+            if not match.group('chain'):
+                return match.group(0)  # String literal or bracketed name
+
+            operands = [operand if operand[0] in '\'"' else f"IFNULL({operand}, '')"
+                        for operand in re.findall(sqliteBackend.operandPattern, match.group('chain'))]
+            return '(' + ' || '.join(operands) + ')'
+
+        return sqliteBackend.concatPattern.sub(translateMatch, statement)
+
+
+class sqliteConnection:
+    """
+    SQLite connection exposing the pyodbc connection surface used by the generalDM helpers.
+    """
+
+    def __init__(self, rawConnection):
+        self.rawConnection = rawConnection
+
+    def cursor(self):
+        return sqliteCursor(self.rawConnection.cursor())
+
+    def execute(self, statement, *params):
+        return self.cursor().execute(statement, *params)
+
+    def commit(self):
+        self.rawConnection.commit()
+
+    def rollback(self):
+        self.rawConnection.rollback()
+
+    def close(self):
+        self.rawConnection.close()
+
+
+class sqliteCursor:
+    """
+    SQLite cursor exposing the pyodbc cursor surface used by the generalDM helpers - pyodbc style parameters
+    (sequence or positional values), Access SQL translation (see 'sqliteBackend.translate') and the ODBC catalog
+    functions ('tables', 'columns', 'statistics') with rows named as the pyodbc catalog rows.
+    """
+
+    tableRow = namedtuple('tableRow', ['table_name', 'table_type'])
+    columnRow = namedtuple('columnRow', ['column_name', 'type_name', 'column_size', 'nullable', 'ordinal_position'])
+    statisticsRow = namedtuple('statisticsRow', ['index_name', 'column_name', 'ordinal_position'])
+
+    def __init__(self, rawCursor):
+        self.rawCursor = rawCursor
+        self.fast_executemany = False
+
+    @staticmethod
+    def parameters(params):
+        # pyodbc accepts a single parameter sequence or the parameters as positional arguments
+        if len(params) == 1 and isinstance(params[0], (list, tuple)):
+            return tuple(params[0])
+        return tuple(params)
+
+    @property
+    def description(self):
+        return self.rawCursor.description
+
+    @property
+    def rowcount(self):
+        return self.rawCursor.rowcount
+
+    def execute(self, statement, *params):
+        self.rawCursor.execute(sqliteBackend.translate(statement), sqliteCursor.parameters(params))
+        return self
+
+    def executemany(self, statement, seqOfParams):
+        self.rawCursor.executemany(sqliteBackend.translate(statement), [tuple(params) for params in seqOfParams])
+
+    def fetchone(self):
+        return self.rawCursor.fetchone()
+
+    def fetchmany(self, size=1):
+        return self.rawCursor.fetchmany(size)
+
+    def fetchall(self):
+        return self.rawCursor.fetchall()
+
+    def fetchval(self):
+        row = self.rawCursor.fetchone()
+        return row[0] if row else None
+
+    def procedures(self, procedure=None):
+        return []  # SQLite has no stored procedures (Access action queries)
+
+    def close(self):
+        self.rawCursor.close()
+
+    def __iter__(self):
+        return iter(self.rawCursor)
+
+    def tables(self, table=None, tableType=None):
+        rows = self.rawCursor.execute("SELECT name, type FROM sqlite_master WHERE type IN ('table', 'view') "
+                                      "AND name NOT LIKE 'sqlite_%';").fetchall()
+        return [sqliteCursor.tableRow(name, 'VIEW' if objectType == 'view' else 'TABLE') for name, objectType in rows
+                if table is None or name.lower() == table.lower()]
+
+    def columns(self, table=None):
+        autoincrement = self.rawCursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ? "
+                                               "COLLATE NOCASE;", (table,)).fetchone()
+        autoincrement = autoincrement is not None and 'AUTOINCREMENT' in str(autoincrement[0]).upper()
+
+        rows = []
+        for cid, name, declType, notNull, _, pk in self.rawCursor.execute(f'PRAGMA table_info("{table}");').fetchall():
+            match = re.match(r'\s*(\w+)\s*(?:\(\s*(\d+))?', declType or '')
+            typeName = sqliteBackend.typeNames.get(match.group(1).upper(), match.group(1).upper()) if match else ''
+            columnSize = int(match.group(2)) if match and match.group(2) else None
+            if typeName == 'INTEGER' and pk and autoincrement:
+                typeName = 'COUNTER'
+            if typeName == 'VARCHAR' and columnSize is None:
+                columnSize = 255  # Access TEXT default size
+            rows.append(sqliteCursor.columnRow(name, typeName, columnSize, 0 if notNull else 1, cid + 1))
+
+        return rows
+
+    def statistics(self, table=None):
+        rows = []
+        indexOrigins = []
+        for _, indexName, _, origin, _ in self.rawCursor.execute(f'PRAGMA index_list("{table}");').fetchall():
+            indexOrigins.append(origin)
+            for seqNo, _, columnName in self.rawCursor.execute(f'PRAGMA index_info("{indexName}");').fetchall():
+                rows.append(sqliteCursor.statisticsRow(indexName, columnName, seqNo + 1))
+
+        # Rowid (INTEGER PRIMARY KEY) keys have no index entry, reported as the Access 'PrimaryKey' index
+        if 'pk' not in indexOrigins:
+            for _, name, _, _, _, pk in self.rawCursor.execute(f'PRAGMA table_info("{table}");').fetchall():
+                if pk:
+                    rows.append(sqliteCursor.statisticsRow('PrimaryKey', name, pk))
+
+        return rows
+
+
+# Backend implementations selected by the backend file extension (see 'generalDMClass.getBackend')
+backendTypes = (accessBackend, sqliteBackend)
+
+# Database errors raised by the backend drivers
+backendErrors = (sqlite3.Error,) if pyodbc is None else (pyodbc.Error, sqlite3.Error)
+
+
+class backendCatalog:
+    """
+    In memory snapshot of the backend catalog (tables, saved queries, columns and indexes) read via the ODBC catalog
+    functions.  Table list is read once, column and index metadata is read per table on first use.  The snapshot is
+    invalidated when the ETL runs DDL against the backend.
+    """
+
+    # Statements changing the backend schema
+    ddlPattern = re.compile(r'^\s*(CREATE|DROP|ALTER)\b|\bSELECT\b[^;]*\bINTO\s+\[?\w+\]?\s+FROM\b',
+                            re.IGNORECASE)
+
+    # Backend column type name to the Access DDL type used when creating tables
+    ddlTypes = {'COUNTER': 'LONG', 'INTEGER': 'LONG', 'SMALLINT': 'SHORT', 'BYTE': 'BYTE', 'LONGCHAR': 'MEMO',
+                'BIT': 'YESNO', 'DATETIME': 'DATETIME', 'DOUBLE': 'DOUBLE', 'REAL': 'SINGLE', 'CURRENCY': 'CURRENCY',
+                'DECIMAL': 'DECIMAL', 'GUID': 'GUID'}
+
+    def __init__(self, inDB, session=None):
+        """
+        Define the instantiated backendCatalog attributes
+
+        :param inDB: Full path and name to the backend database
+        :param session: Optional backendSession instance with pooled connections for the run
+
+        :return: Instantiated backendCatalog
+        """
+
+        self.inDB = inDB
+        self.session = session
+        self.tables = None  # Lower case name: (name, type) - 'TABLE', 'VIEW', 'SYSTEM TABLE', etc.
+        self.procedures = None  # Lower case saved action query names
+        self.columns = {}  # Lower case table name: list of column records
+        self.indexes = {}  # Lower case table name: {index name: [columns]}
+        self.loadCount = 0
+
+    def isDDL(inQuery):
+        """
+        Define if the passed SQL statement changes the backend schema
+
+        :param inQuery: SQL statement
+
+        :return: True if the statement is DDL (create/drop/alter or a make table query)
+        """
+
+        return backendCatalog.ddlPattern.search(inQuery) is not None
+
+    def invalidate(self):
+        """
+        Clear the snapshot, subsequent requests re-read the backend catalog.
+        """
+
+        self.tables = None
+        self.procedures = None
+        self.columns = {}
+        self.indexes = {}
+
+        logMsg = f'Backend catalog invalidated - {self.inDB}'
+        logging.debug(logMsg)
+
+    def readCatalog(self, catalogFunction, **kwargs):
+        """
+        Read rows from the passed ODBC cursor catalog function ('tables', 'columns', 'statistics')
+
+        :param catalogFunction: Name of the cursor catalog function
+        :param kwargs: Arguments to the catalog function
+
+        :return: List of catalog rows
+        """
+
+        cnxn = generalDMClass.connect_DB_Access(self.inDB, session=self.session)
+        try:
+            cursor = cnxn.cursor()
+            rows = list(getattr(cursor, catalogFunction)(**kwargs))
+            cursor.close()
+        finally:
+            cnxn.close()
+
+        self.loadCount += 1
+        return rows
+
+    def getTables(self):
+        """
+        Tables and saved queries in the backend
+
+        :return: Dictionary lower case name: (name, type)
+        """
+
+        if self.tables is None:
+            self.tables = {str(row.table_name).lower(): (row.table_name, row.table_type)
+                           for row in self.readCatalog('tables')}
+
+        return self.tables
+
+    def getProcedures(self):
+        """
+        Saved action queries (procedures) in the backend
+
+        :return: Set of lower case procedure names
+        """
+
+        if self.procedures is None:
+            # Access reports procedure names with a ';<number>' version suffix
+            self.procedures = {re.sub(r';\d+$', '', str(row.procedure_name)).lower()
+                               for row in self.readCatalog('procedures')}
+
+        return self.procedures
+
+    def procedureExists(self, queryName):
+        """
+        :param queryName: Saved action query name
+
+        :return: True if the saved action query (procedure) exists in the backend
+        """
+
+        return queryName.lower() in self.getProcedures()
+
+    def tableExists(self, tableName):
+        """
+        :param tableName: Table name
+
+        :return: True if the table exists in the backend
+        """
+
+        table = self.getTables().get(tableName.lower())
+        return table is not None and table[1] != 'VIEW'
+
+    def queryExists(self, queryName):
+        """
+        :param queryName: Saved query name
+
+        :return: True if the saved query (view) exists in the backend
+        """
+
+        table = self.getTables().get(queryName.lower())
+        return table is not None and table[1] == 'VIEW'
+
+    def getColumns(self, tableName):
+        """
+        Column records for the passed table in ordinal order.  Records are dictionaries with keys 'columnName',
+        'typeName', 'columnSize', 'nullable' and 'ordinal'.
+
+        :param tableName: Table name
+
+        :return: List of column records, empty if the table does not exist
+        """
+
+        key = tableName.lower()
+        if key not in self.columns:
+            rows = self.readCatalog('columns', table=tableName)
+            self.columns[key] = [{'columnName': row.column_name,
+                                  'typeName': str(row.type_name).upper(),
+                                  'columnSize': getattr(row, 'column_size', None),
+                                  'nullable': getattr(row, 'nullable', None),
+                                  'ordinal': row.ordinal_position}
+                                 for row in sorted(rows, key=lambda row: row.ordinal_position)]
+
+        return self.columns[key]
+
+    def getIndexes(self, tableName):
+        """
+        Indexes on the passed table
+
+        :param tableName: Table name
+
+        :return: Dictionary index name: list of indexed columns (in index order)
+        """
+
+        key = tableName.lower()
+        if key not in self.indexes:
+            indexes = {}
+            for row in self.readCatalog('statistics', table=tableName):
+                if row.index_name is None:  # Table statistics row
+                    continue
+                indexes.setdefault(row.index_name, []).append((row.ordinal_position, row.column_name))
+            self.indexes[key] = {name: [column for _, column in sorted(columns)] for name, columns in indexes.items()}
+
+        return self.indexes[key]
+
+    def getDDLType(self, tableName, columnName):
+        """
+        Access DDL type for an existing backend column, used to define staging tables with the backend field types.
+
+        :param tableName: Table name
+        :param columnName: Column name
+
+        :return: DDL type string (e.g. 'TEXT(50)', 'LONG') or None if the column is not in the table
+        """
+
+        for record in self.getColumns(tableName):
+            if record['columnName'].lower() == columnName.lower():
+                if record['typeName'] in ('VARCHAR', 'CHAR', 'WVARCHAR', 'WCHAR'):
+                    return f"TEXT({record['columnSize'] or 255})"
+                return backendCatalog.ddlTypes.get(record['typeName'], record['typeName'])
+
+        return None
+
+    def validateTextLengths(self, tableName, inDF):
+        """
+        Check the text values in the passed dataframe against the backend text field sizes.
+
+        :param tableName: Table name
+        :param inDF: Dataframe with fields named as the table fields
+
+        :return: List of (field, max value length, field size) for the fields exceeding the field size
+        """
+
+        overLength = []
+        for record in self.getColumns(tableName):
+            column = record['columnName']
+            if (record['typeName'] not in ('VARCHAR', 'CHAR', 'WVARCHAR', 'WCHAR') or column not in inDF.columns
+                    or not record['columnSize']):
+                continue
+
+            values = inDF[column].dropna()
+            if values.empty:
+                continue
+            maxLength = int(values.astype(str).str.len().max())
+            if maxLength > record['columnSize']:
+                overLength.append((column, maxLength, record['columnSize']))
+
+        return overLength
+
+
+class lookupCache:
+    """
+    In process LRU cache of backend lookup tables (e.g. tlu_Contacts, tluObservers, refSite) keyed on the backend path,
+    lookup table and query.  Entries are invalidated when the ETL writes to the table and are re-read when the backend
+    file modified time changes (i.e. edits made outside the ETL).  Least recently used entries are evicted beyond
+    'maxEntries'.
+    """
+
+    # Statements that only read data and don't invalidate the cached lookups
+    readPattern = re.compile(r'^\s*SELECT\b(?![^;]*\bINTO\b)', re.IGNORECASE)
+
+    def __init__(self, maxEntries=32):
+        """
+        Define the instantiated lookupCache attributes
+
+        :param maxEntries: Maximum number of cached lookup queries retained
+
+        :return: Instantiated lookupCache
+        """
+
+        self.maxEntries = maxEntries
+        self.entries = OrderedDict()  # (backend path, lower case table name, query): (modified time, dataframe)
+        self.lock = threading.Lock()
+        self.hitCount = 0
+        self.missCount = 0
+        self.evictCount = 0
+        self.snapshots = {}  # Backend path: lookupSnapshot persisting the lookups across runs
+        self.pending = {}  # (backend path, lower case table name, query): future of a lookup being prefetched
+        self.readLog = OrderedDict()  # (backend path, lookup table, query): None - lookups read by the run
+        self.generation = 0  # Incremented on invalidation, a read spanning an invalidation isn't cached
+
+    @staticmethod
+    def backendModified(inDB):
+        """
+        Modified time of the backend file, None if the file can't be read.
+
+        :param inDB: Full path and name to the backend database
+
+        :return: Modified time
+        """
+
+        try:
+            return os.path.getmtime(inDB)
+        except OSError:
+            return None
+
+    def read(self, query, lookupTable, inDB, session=None, prefetch=False):
+        """
+        Lookup table query as a dataframe, read from the backend on the first request and from the cache after.  A
+        copy is returned so callers can modify the dataframe without changing the cached entry.  When the lookup is
+        being prefetched on another thread the read waits for the prefetch rather than reading the table again.
+
+        :param query: Query reading the lookup table
+        :param lookupTable: Lookup table read by the query, used to invalidate the entry on writes to the table
+        :param inDB: Full path and name to the backend database
+        :param session: Optional backendSession instance with pooled connections for the run
+        :param prefetch: True when called by a prefetch thread (see 'prefetch'), not logged as read by the run
+
+        :return: outDF: Lookup dataframe
+        """
+
+        key = (inDB, lookupTable.lower(), query)
+
+        with self.lock:
+            pending = None if prefetch else self.pending.get(key)
+            if not prefetch:
+                self.readLog[(inDB, lookupTable, query)] = None
+
+        if pending is not None:
+            try:
+                pending.result()
+            except Exception:
+                pass  # Prefetch failed - read below, the error (if any) is raised to the caller
+
+        modified = lookupCache.backendModified(inDB)
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] == modified:
+                self.entries.move_to_end(key)
+                self.hitCount += 1
+                return entry[1].copy()
+            generation = self.generation
+
+        outDF = generalDMClass.connect_to_AcessDB_DF(query, inDB, session=session)
+        with self.lock:
+            self.missCount += 1
+        stored = self.store(query, lookupTable, inDB, modified, outDF, generation=generation)
+
+        snapshot = self.snapshots.get(inDB)
+        if snapshot is not None and stored:
+            snapshot.save(query, lookupTable, outDF)
+
+        return outDF.copy()
+
+    def prefetch(self, query, lookupTable, inDB, executor):
+        """
+        Start reading a lookup on the passed thread pool, later reads of the lookup wait on the prefetch.  The
+        prefetch reads on its own backend connection (no session) so it doesn't share the unit of work connection
+        being used by the main thread.
+
+        :param query: Query reading the lookup table
+        :param lookupTable: Lookup table read by the query
+        :param inDB: Full path and name to the backend database
+        :param executor: concurrent.futures executor the read is submitted to
+
+        :return: Future of the read, None if the lookup is already cached or being prefetched
+        """
+
+        key = (inDB, lookupTable.lower(), query)
+        with self.lock:
+            if key in self.pending or key in self.entries:
+                return None
+            future = executor.submit(self.read, query, lookupTable, inDB, None, True)
+            self.pending[key] = future
+
+        future.add_done_callback(lambda done: self.clearPending(key, done))
+        return future
+
+    def clearPending(self, key, future):
+        """
+        Remove a finished prefetch from the pending prefetches.
+
+        :param key: Cache key of the prefetched lookup
+        :param future: Finished prefetch future
+
+        :return:
+        """
+
+        with self.lock:
+            if self.pending.get(key) is future:
+                del self.pending[key]
+
+    def usedQueries(self, inDB):
+        """
+        Lookup queries read by the run for the backend, in the order first read.
+
+        :param inDB: Full path and name to the backend database
+
+        :return: List of [lookup table, query]
+        """
+
+        with self.lock:
+            return [[key[1], key[2]] for key in self.readLog if key[0] == inDB]
+
+    def store(self, query, lookupTable, inDB, modified, inDF, generation=None):
+        """
+        Add a lookup dataframe to the cache, evicting the least recently used entries beyond 'maxEntries'.
+
+        :param query: Query reading the lookup table
+        :param lookupTable: Lookup table read by the query
+        :param inDB: Full path and name to the backend database
+        :param modified: Backend file modified time the dataframe was read at
+        :param inDF: Lookup dataframe
+        :param generation: Cache generation the dataframe was read at, not stored if the cache has since been
+        invalidated (i.e. the read may predate a write)
+
+        :return: True if stored
+        """
+
+        key = (inDB, lookupTable.lower(), query)
+        with self.lock:
+            if generation is not None and generation != self.generation:
+                return False
+            self.entries[key] = (modified, inDF)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxEntries:
+                self.entries.popitem(last=False)
+                self.evictCount += 1
+
+        return True
+
+    def invalidate(self, inDB=None, tableName=None):
+        """
+        Invalidate the cached lookups after the ETL writes to the backend.  Entries for the written table are dropped,
+        the remaining entries for the backend are stamped with the current modified time so the ETL's own write
+        doesn't force a re-read of every lookup table.
+
+        :param inDB: Full path and name to the backend database, None all backends
+        :param tableName: Table written, None all tables in the backend
+
+        :return: Number of entries dropped
+        """
+
+        modified = lookupCache.backendModified(inDB) if inDB is not None else None
+        with self.lock:
+            self.generation += 1
+            dropKeys = [key for key in self.entries if (inDB is None or key[0] == inDB)
+                        and (tableName is None or key[1] == tableName.lower())]
+            for key in dropKeys:
+                del self.entries[key]
+
+            if inDB is not None and tableName is not None:
+                for key in [key for key in self.entries if key[0] == inDB]:
+                    self.entries[key] = (modified, self.entries[key][1])
+
+        for snapshotDB, snapshot in list(self.snapshots.items()):
+            if inDB is None or snapshotDB == inDB:
+                snapshot.invalidate(tableName)
+
+        return len(dropKeys)
+
+    def flushSnapshots(self, inDB=None):
+        """
+        Write the saved/invalidated lookup snapshot entries to the snapshot manifests (see 'lookupSnapshot.flush').
+        Failures are logged, the unflushed entries are re-read from the backend on the next run.
+
+        :param inDB: Full path and name to the backend database, None all backends
+
+        :return: Number of entries added to the manifests
+        """
+
+        addCount = 0
+        for snapshotDB, snapshot in list(self.snapshots.items()):
+            if inDB is None or snapshotDB == inDB:
+                try:
+                    addCount += snapshot.flush()
+                except Exception as e:
+                    logging.warning(f'Unable to write the lookup snapshot manifest for - {snapshotDB} - {e}')
+
+        return addCount
+
+    def invalidateStatement(self, inDB, inQuery):
+        """
+        Invalidate the cached lookups for the tables named in an executed statement (update, delete, insert, DDL).
+        Select statements don't invalidate.
+
+        :param inDB: Full path and name to the backend database
+        :param inQuery: SQL statement that was executed
+
+        :return: Number of entries dropped
+        """
+
+        if lookupCache.readPattern.match(inQuery):
+            return 0
+
+        with self.lock:
+            tables = {key[1] for key in self.entries if key[0] == inDB}
+
+        dropCount = 0
+        for tableName in tables:
+            if re.search(r'(?<![\w])' + re.escape(tableName) + r'(?![\w])', inQuery, re.IGNORECASE):
+                dropCount += self.invalidate(inDB, tableName)
+
+        return dropCount
+
+
+class lookupSnapshot:
+    """
+    On disk snapshot of the cached lookup tables for a backend, retained across runs in the run workspace so repeat
+    runs don't pull the lookup tables out of the backend again.  Each lookup query is saved as an uncompressed Feather
+    file (memory mapped on load) with a fingerprint of the lookup table - backend column definitions, record count,
+    maximum autonumber and maximum modified date (when the table has one, so in place edits are detected) read in one
+    aggregate query; tables with neither an autonumber nor a modified date are hashed in full.  At startup entries
+    whose fingerprint no longer matches the backend are dropped and re-read on first use.  Fingerprints are computed
+    once per run, tables written by the ETL are fingerprinted again.  Saved/invalidated entries are written to the
+    manifest by 'flush', once per stage checkpoint and at the end of the run.  Requires pyarrow, otherwise snapshots
+    are disabled.
+    """
+
+    manifestName = 'lookupSnapshot.json'
+
+    # Date/Time fields stamped when a lookup record is edited (lower case, underscores removed)
+    modifiedFields = ('datemodified', 'modifieddate', 'lastmodified', 'dateupdated', 'updateddate', 'editdate',
+                      'lasteditdate')
+
+    def __init__(self, snapshotDir, inDB, session=None):
+        """
+        Define the instantiated lookupSnapshot attributes
+
+        :param snapshotDir: Directory the snapshots are saved to (e.g. the run workspace)
+        :param inDB: Full path and name to the backend database
+        :param session: Optional backendSession instance with pooled connections for the run
+
+        :return: Instantiated lookupSnapshot
+        """
+
+        # Snapshot directory per backend path
+        self.snapshotDir = os.path.join(snapshotDir, hashlib.sha1(inDB.lower().encode()).hexdigest()[:12])
+        self.inDB = inDB
+        self.session = session
+        self.manifest = {}  # Entry name: {'table', 'query', 'fingerprint'}
+        self.pending = {}  # Entry name: {'table', 'query'} saved since the last flush, fingerprinted by 'flush'
+        self.dirty = False  # Manifest changed since the last flush
+        self.fingerprintCache = {}  # Lower case table name: fingerprint computed this run, dropped on ETL writes
+        self.lock = threading.RLock()  # Lookups are saved from the prefetch threads
+        self.loadCount = 0
+        self.saveCount = 0
+
+    @staticmethod
+    def available():
+        """
+        True if pyarrow is installed and snapshots can be written.
+        """
+
+        return feather is not None
+
+    @staticmethod
+    def entryName(query):
+        """
+        Snapshot entry (file) name for a lookup query.
+        """
+
+        return hashlib.sha1(query.encode()).hexdigest()[:16]
+
+    def readManifest(self):
+        """
+        Read the snapshot manifest, an empty manifest is returned if there is no prior snapshot.
+
+        :return: manifest: Dictionary entry name: entry definition
+        """
+
+        manifestPath = os.path.join(self.snapshotDir, lookupSnapshot.manifestName)
+        if not os.path.exists(manifestPath):
+            return {}
+
+        with open(manifestPath) as manifestFile:
+            manifest = json.load(manifestFile)
+
+        if manifest.get('inDB') != self.inDB:
+            return {}
+
+        return manifest.get('entries', {})
+
+    def writeManifest(self):
+        """
+        Write the snapshot manifest.
+        """
+
+        os.makedirs(self.snapshotDir, exist_ok=True)
+        with open(os.path.join(self.snapshotDir, lookupSnapshot.manifestName), 'w') as manifestFile:
+            json.dump({'inDB': self.inDB, 'entries': self.manifest}, manifestFile, indent=1)
+
+    def fingerprints(self, tables, session=None):
+        """
+        Fingerprint for each passed lookup table - backend column definitions, record count, maximum autonumber and
+        maximum modified date, read for all tables with a single UNION ALL aggregate query.  Only tables with neither
+        an autonumber nor a modified date field are read in full (see 'contentHash').  Fingerprints are retained for
+        the run (see 'fingerprintCache').
+
+        :param tables: List of lookup table names
+        :param session: Optional backendSession instance the backend is read with
+
+        :return: fingerprintDic: Dictionary lower case table name: fingerprint, tables not in the backend are omitted
+        """
+
+        catalog = generalDMClass.getCatalog(self.inDB, session=session)
+        tables = [table for table in dict.fromkeys(tables) if catalog.tableExists(table)]
+        if not tables:
+            return {}
+
+        selects = []
+        columnDefs = {}
+        unkeyedTables = {}
+        for table in tables:
+            columns = catalog.getColumns(table)
+            columnDefs[table.lower()] = [(record['columnName'], record['typeName'], record['columnSize'])
+                                         for record in columns]
+            counters = [record['columnName'] for record in columns if record['typeName'] == 'COUNTER']
+            modifiedColumns = [record['columnName'] for record in columns if record['typeName'] == 'DATETIME'
+                               and record['columnName'].lower().replace('_', '') in lookupSnapshot.modifiedFields]
+            if not counters and not modifiedColumns:
+                unkeyedTables[table.lower()] = table
+
+            maxCounter = f"MAX([{counters[0]}])" if counters else "0"
+            maxModified = f"MAX([{modifiedColumns[0]}])" if modifiedColumns else "NULL"
+            selects.append(f"SELECT '{table.lower()}' AS TableName, COUNT(*) AS RecordCount, {maxCounter} AS MaxID,"
+                           f" {maxModified} AS MaxModified FROM [{table}]")
+
+        countDF = generalDMClass.connect_to_AcessDB_DF(" UNION ALL ".join(selects) + ";", self.inDB,
+                                                      session=session)
+
+        fingerprintDic = {}
+        for row in countDF.itertuples(index=False):
+            stamp = str(row.MaxModified)
+            if row.TableName in unkeyedTables:
+                stamp = self.contentHash(unkeyedTables[row.TableName], session=session)
+            signature = json.dumps([columnDefs[row.TableName], int(row.RecordCount), str(row.MaxID), stamp])
+            fingerprintDic[row.TableName] = hashlib.sha1(signature.encode()).hexdigest()
+
+        with self.lock:
+            self.fingerprintCache.update(fingerprintDic)
+
+        return fingerprintDic
+
+    def contentHash(self, table, session=None):
+        """
+        Hash of all the rows of a lookup table (row order independent), used for the tables without an autonumber or
+        modified date field to fingerprint on.
+
+        :param table: Lookup table name
+        :param session: Optional backendSession instance the backend is read with
+
+        :return: String content hash
+        """
+
+        tableDF = generalDMClass.connect_to_AcessDB_DF(f"SELECT * FROM [{table}];", self.inDB, session=session)
+        rowHashes = np.sort(pd.util.hash_pandas_object(tableDF.astype(str), index=False).to_numpy())
+        return f'rows:{hashlib.sha1(rowHashes.tobytes()).hexdigest()}'
+
+    def load(self, cache):
+        """
+        Load the snapshot entries which still match the backend into the passed lookup cache (memory mapped), stale
+        entries are removed.
+
+        :param cache: lookupCache the entries are loaded to
+
+        :return: Number of entries loaded
+        """
+
+        self.manifest = self.readManifest()
+        if not self.manifest:
+            return 0
+
+        fingerprintDic = self.fingerprints([entry['table'] for entry in self.manifest.values()],
+                                           session=self.session)
+        modified = lookupCache.backendModified(self.inDB)
+
+        for name, entry in list(self.manifest.items()):
+            entryPath = os.path.join(self.snapshotDir, f'{name}.feather')
+            if fingerprintDic.get(entry['table'].lower()) != entry['fingerprint'] or not os.path.exists(entryPath):
+                self.removeEntry(name)
+                continue
+
+            lookupDF = feather.read_table(entryPath, memory_map=True).to_pandas()
+            cache.store(entry['query'], entry['table'], self.inDB, modified, lookupDF)
+            self.loadCount += 1
+
+        self.writeManifest()
+
+        logMsg = (f'Loaded {self.loadCount} lookup snapshot(s) for - {self.inDB} - {len(self.manifest)} current'
+                  f' snapshot(s) in {self.snapshotDir}')
+        logging.info(logMsg)
+
+        return self.loadCount
+
+    def save(self, query, lookupTable, inDF):
+        """
+        Save a lookup query dataframe to the snapshot.  The entry is fingerprinted and added to the manifest by the
+        next 'flush'.  Failures (e.g. values pyarrow can't serialize) are logged and the lookup is not snapshotted.
+
+        :param query: Query reading the lookup table
+        :param lookupTable: Lookup table read by the query
+        :param inDF: Lookup dataframe
+
+        :return: True if saved
+        """
+
+        try:
+            name = lookupSnapshot.entryName(query)
+            with self.lock:
+                os.makedirs(self.snapshotDir, exist_ok=True)
+                feather.write_feather(inDF.reset_index(drop=True), os.path.join(self.snapshotDir, f'{name}.feather'),
+                                      compression='uncompressed')
+
+                self.manifest.pop(name, None)
+                self.pending[name] = {'table': lookupTable, 'query': query}
+                self.dirty = True
+                self.saveCount += 1
+            return True
+
+        except Exception as e:
+            logging.warning(f'Unable to snapshot lookup - {lookupTable} - {e}')
+            return False
+
+    def flush(self):
+        """
+        Fingerprint the entries saved since the last flush and write the manifest if it changed.  Fingerprints
+        computed earlier in the run are reused, the remaining tables (not in the prior snapshot or written by the ETL)
+        are fingerprinted in one pass.  Called at the stage checkpoints and the end of the run.
+
+        :return: Number of entries added to the manifest
+        """
+
+        with self.lock:
+            if not self.dirty:
+                return 0
+
+            pending = self.pending
+            self.pending = {}
+            fingerprintDic = dict(self.fingerprintCache)
+            unknownTables = [entry['table'] for entry in pending.values()
+                             if entry['table'].lower() not in fingerprintDic]
+            if unknownTables:
+                fingerprintDic.update(self.fingerprints(unknownTables, session=self.session))
+
+            addCount = 0
+            for name, entry in pending.items():
+                fingerprint = fingerprintDic.get(entry['table'].lower())
+                if fingerprint is None:
+                    self.removeEntry(name)
+                    continue
+                self.manifest[name] = {**entry, 'fingerprint': fingerprint}
+                addCount += 1
+
+            self.writeManifest()
+            self.dirty = False
+
+        return addCount
+
+    def removeEntry(self, name):
+        """
+        Remove a snapshot entry and its file.
+        """
+
+        self.manifest.pop(name, None)
+        self.pending.pop(name, None)
+        try:
+            os.remove(os.path.join(self.snapshotDir, f'{name}.feather'))
+        except OSError:
+            pass
+
+    def invalidate(self, tableName=None):
+        """
+        Remove the snapshot entries for a table written by the ETL.
+
+        :param tableName: Table written, None all tables
+
+        :return: Number of entries removed
+        """
+
+        with self.lock:
+            names = [name for name, entry in list(self.manifest.items()) + list(self.pending.items())
+                     if tableName is None or entry['table'].lower() == tableName.lower()]
+            for name in names:
+                self.removeEntry(name)
+
+            if tableName is None:
+                self.fingerprintCache = {}
+            else:
+                self.fingerprintCache.pop(tableName.lower(), None)
+
+            if names:
+                self.dirty = True
+
+        return len(names)
+
+
+class exportCache:
+    """
+    Local cache of the extracted AGOL/Portal feature layer exports in the run workspace, keyed on the item id, the
+    service layer ids and the service version (latest 'editingInfo.lastEditDate', services without an edit date are
+    not cached).  A run against an unchanged service reuses the cached extraction rather than exporting the item
+    again.  Entries older than 'maxAgeDays' are evicted, then the least recently used entries beyond
+    'maxEntries'/'maxBytes'.
+    """
+
+    manifestName = 'exportCache.json'
+
+    def __init__(self, cacheDir, maxEntries=5, maxBytes=2 * 1024 ** 3, maxAgeDays=30):
+        """
+        Define the instantiated exportCache attributes
+
+        :param cacheDir: Directory the extracted exports are cached in (e.g. the run workspace)
+        :param maxEntries: Maximum number of cached exports retained
+        :param maxBytes: Maximum size in bytes of the cached exports retained
+        :param maxAgeDays: Days a cached export is retained after it was exported
+
+        :return: Instantiated exportCache
+        """
+
+        self.cacheDir = cacheDir
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        self.maxAgeDays = maxAgeDays
+        self.lock = threading.Lock()
+        self.hitCount = 0
+        self.missCount = 0
+        self.evictCount = 0
+        # Entry name: {'itemID', 'layerIDs', 'version', 'title', 'created', 'lastUsed', 'size'}
+        self.manifest = self.readManifest()
+
+    @staticmethod
+    def entryName(itemID, layerIDs, version):
+        """
+        Cache entry (directory) name for an item export.
+
+        :param itemID: AGOL/Portal item id
+        :param layerIDs: Layer/table ids in the feature service
+        :param version: Service version (edit date/modified time)
+
+        :return: Entry name
+        """
+
+        key = json.dumps([str(itemID), [str(layerID) for layerID in layerIDs], str(version)])
+        return f'{itemID}_{hashlib.sha1(key.encode()).hexdigest()[:12]}'
+
+    def readManifest(self):
+        """
+        Read the cache manifest, an empty manifest is returned if there is no prior cache.
+
+        :return: manifest: Dictionary entry name: entry definition
+        """
+
+        manifestPath = os.path.join(self.cacheDir, exportCache.manifestName)
+        if not os.path.exists(manifestPath):
+            return {}
+
+        try:
+            with open(manifestPath) as manifestFile:
+                return json.load(manifestFile)
+        except (OSError, ValueError) as e:
+            logging.warning(f'Unable to read the export cache manifest - {manifestPath} - {e}')
+            return {}
+
+    def writeManifest(self):
+        """
+        Write the cache manifest.
+        """
+
+        os.makedirs(self.cacheDir, exist_ok=True)
+        with open(os.path.join(self.cacheDir, exportCache.manifestName), 'w') as manifestFile:
+            json.dump(self.manifest, manifestFile, indent=1)
+
+    def get(self, itemID, layerIDs, version):
+        """
+        Directory of the cached extraction for the item version, None on a cache miss.
+
+        :param itemID: AGOL/Portal item id
+        :param layerIDs: Layer/table ids in the feature service
+        :param version: Service version (edit date/modified time)
+
+        :return: entryDir: Directory with the extracted export files, None if not cached
+        """
+
+        with self.lock:
+            self.evict()
+            name = exportCache.entryName(itemID, layerIDs, version)
+            entryDir = os.path.join(self.cacheDir, name)
+            entry = self.manifest.get(name)
+
+            if entry is None or not os.path.isdir(entryDir):
+                self.removeEntry(name)
+                self.missCount += 1
+                logMsg = f'Export cache miss - {itemID} - version {version}'
+                logging.info(logMsg)
+                return None
+
+            entry['lastUsed'] = time.time()
+            self.writeManifest()
+            self.hitCount += 1
+            logMsg = f"Export cache hit - {itemID} - version {version} - reusing the export '{entry['title']}'"
+            logging.info(logMsg)
+            return entryDir
+
+    def put(self, itemID, layerIDs, version, extractDir, title=None):
+        """
+        Add an extracted export to the cache.  Cached exports of prior versions of the item are removed.
+
+        :param itemID: AGOL/Portal item id
+        :param layerIDs: Layer/table ids in the feature service
+        :param version: Service version (edit date/modified time) the export was made at
+        :param extractDir: Directory with the extracted export files
+        :param title: Optional export title logged on cache hits
+
+        :return: entryDir: Cache directory of the entry
+        """
+
+        name = exportCache.entryName(itemID, layerIDs, version)
+        entryDir = os.path.join(self.cacheDir, name)
+
+        with self.lock:
+            for priorName in [priorName for priorName, entry in self.manifest.items()
+                              if entry['itemID'] == str(itemID) and priorName != name]:
+                self.removeEntry(priorName)
+
+            shutil.rmtree(entryDir, ignore_errors=True)
+            shutil.copytree(extractDir, entryDir)
+            size = sum(os.path.getsize(os.path.join(root, fileName))
+                       for root, dirs, files in os.walk(entryDir) for fileName in files)
+
+            now = time.time()
+            self.manifest[name] = {'itemID': str(itemID), 'layerIDs': [str(layerID) for layerID in layerIDs],
+                                   'version': str(version), 'title': title or name, 'created': now, 'lastUsed': now,
+                                   'size': size}
+            self.evict()
+            self.writeManifest()
+
+        return entryDir
+
+    def evict(self, now=None):
+        """
+        Evict the entries older than 'maxAgeDays', then the least recently used entries beyond 'maxEntries' or
+        'maxBytes'.  Called with the lock held.
+
+        :param now: Optional current time (epoch seconds)
+
+        :return: Number of entries evicted
+        """
+
+        now = time.time() if now is None else now
+        evictNames = [name for name, entry in self.manifest.items()
+                      if now - entry['created'] > self.maxAgeDays * 86400]
+
+        retained = sorted([(entry['lastUsed'], name) for name, entry in self.manifest.items()
+                           if name not in evictNames], reverse=True)
+        totalBytes = 0
+        for count, (lastUsed, name) in enumerate(retained, start=1):
+            totalBytes += self.manifest[name]['size']
+            if count > self.maxEntries or (totalBytes > self.maxBytes and count > 1):
+                evictNames.append(name)
+
+        for name in evictNames:
+            self.removeEntry(name)
+            logging.info(f'Export cache evicted - {name}')
+
+        self.evictCount += len(evictNames)
+        if evictNames:
+            self.writeManifest()
+
+        return len(evictNames)
+
+    def removeEntry(self, name):
+        """
+        Remove a cache entry and its directory.
+        """
+
+        self.manifest.pop(name, None)
+        shutil.rmtree(os.path.join(self.cacheDir, name), ignore_errors=True)
+
+    def summary(self):
+        """
+        Export cache hit/miss/eviction counts for the log file.
+        """
+
+        return (f'Export cache - {self.hitCount} hit(s), {self.missCount} miss(es), {self.evictCount} eviction(s) -'
+                f' {len(self.manifest)} cached export(s) in {self.cacheDir}')
+
+
+class extractWatermark:
+    """
+    Incremental extraction store for an AGOL/Portal feature service in the run workspace.  Per layer the high watermark
+    (last processed 'EditDate' and 'ObjectID') and the local base of the layer records extracted by the prior runs are
+    retained, runs query only the features created/edited since the watermark and merge them into the base.  Merged
+    bases and advanced watermarks are staged by 'merge' and only written by 'commit' after the run loads successfully,
+    a failed run extracts again from the prior watermark.
+    """
+
+    manifestName = 'watermarks.json'
+
+    def __init__(self, storeDir, itemID):
+        """
+        Define the instantiated extractWatermark attributes
+
+        :param storeDir: Directory the watermarks and layer bases are saved to (e.g. the run workspace)
+        :param itemID: AGOL/Portal item id of the feature service
+
+        :return: Instantiated extractWatermark
+        """
+
+        self.itemID = str(itemID)
+        self.storeDir = os.path.join(storeDir, self.itemID)
+        self.watermarks = self.readManifest()  # Layer key: {'editDate', 'objectID', 'records'}
+        self.staged = {}  # Layer key: (advanced watermark, merged base dataframe) written on commit
+
+    def readManifest(self):
+        """
+        Read the watermark manifest, an empty manifest is returned if there is no prior extraction.
+
+        :return: watermarks: Dictionary layer key: watermark
+        """
+
+        manifestPath = os.path.join(self.storeDir, extractWatermark.manifestName)
+        if not os.path.exists(manifestPath):
+            return {}
+
+        with open(manifestPath) as manifestFile:
+            return json.load(manifestFile)
+
+    def writeManifest(self):
+        """
+        Write the watermark manifest.
+        """
+
+        os.makedirs(self.storeDir, exist_ok=True)
+        with open(os.path.join(self.storeDir, extractWatermark.manifestName), 'w') as manifestFile:
+            json.dump(self.watermarks, manifestFile, indent=1)
+
+    def basePath(self, layerKey):
+        """
+        Path of the layer base file.
+        """
+
+        fileName = re.sub(r'[^\w-]', '_', layerKey)
+        return os.path.join(self.storeDir, f'{fileName}.pkl')
+
+    def readBase(self, layerKey):
+        """
+        Layer base extracted by the prior runs, None if there is no base (i.e. full extraction).
+
+        :param layerKey: Layer key (layer name_layer id)
+
+        :return: baseDF: Dataframe of the layer records
+        """
+
+        if layerKey not in self.watermarks or not os.path.exists(self.basePath(layerKey)):
+            return None
+
+        return pd.read_pickle(self.basePath(layerKey))
+
+    def whereClause(self, layerKey, editField=None, oidField='OBJECTID'):
+        """
+        Where clause of the layer features created/edited since the layer watermark.  Layers with editor tracking are
+        queried on the edit date (inclusive to the second, repeats are dropped by 'merge'), layers without on the
+        ObjectID (new records only).
+
+        :param layerKey: Layer key (layer name_layer id)
+        :param editField: Edit date field of the layer (e.g. 'EditDate'), None if editor tracking isn't enabled
+        :param oidField: ObjectID field of the layer
+
+        :return: Where clause, '1=1' when the layer has no watermark
+        """
+
+        watermark = self.watermarks.get(layerKey)
+        if watermark is None or not os.path.exists(self.basePath(layerKey)):
+            return '1=1'
+
+        if editField and watermark.get('editDate') is not None:
+            stamp = pd.Timestamp(watermark['editDate'], unit='ms').strftime('%Y-%m-%d %H:%M:%S')
+            return f"{editField} >= TIMESTAMP '{stamp}'"
+
+        return f"{oidField} > {int(watermark.get('objectID', 0))}"
+
+    def merge(self, layerKey, deltaDF, oidField='OBJECTID', editField=None, currentIDs=None):
+        """
+        Merge the features extracted since the watermark into the layer base (records matched on the ObjectID, the
+        extracted record replaces the base record) and stage the merged base with the advanced watermark.
+
+        :param layerKey: Layer key (layer name_layer id)
+        :param deltaDF: Dataframe of the features extracted since the watermark
+        :param oidField: ObjectID field of the layer
+        :param editField: Edit date field of the layer, None if editor tracking isn't enabled
+        :param currentIDs: Optional ObjectIDs currently in the layer, base records not in the list (deleted) are
+        dropped
+
+        :return: mergedDF: Dataframe of all layer records
+        """
+
+        baseDF = self.readBase(layerKey)
+        if baseDF is None or baseDF.empty:
+            mergedDF = deltaDF
+        elif deltaDF.empty:
+            mergedDF = baseDF
+        else:
+            mergedDF = pd.concat([baseDF, deltaDF], ignore_index=True)
+        mergedDF = mergedDF.drop_duplicates(subset=[oidField], keep='last')
+
+        if currentIDs is not None:
+            mergedDF = mergedDF[mergedDF[oidField].isin(currentIDs)]
+        mergedDF = mergedDF.sort_values(oidField).reset_index(drop=True)
+
+        watermark = dict(self.watermarks.get(layerKey) or {'editDate': None, 'objectID': 0})
+        if editField and editField in mergedDF.columns and mergedDF[editField].notna().any():
+            watermark['editDate'] = int(mergedDF[editField].max())
+        if not mergedDF.empty:
+            watermark['objectID'] = max(int(mergedDF[oidField].max()), int(watermark['objectID']))
+        watermark['records'] = len(mergedDF)
+
+        self.staged[layerKey] = (watermark, mergedDF)
+
+        return mergedDF.copy()
+
+    def commit(self):
+        """
+        Write the staged layer bases and advance the watermarks - called after the run loads successfully.
+
+        :return: Number of layers committed
+        """
+
+        os.makedirs(self.storeDir, exist_ok=True)
+        for layerKey, (watermark, mergedDF) in self.staged.items():
+            # Written to a temporary file then swapped in so an interrupted write doesn't corrupt the base
+            tempPath = f'{self.basePath(layerKey)}.tmp'
+            mergedDF.to_pickle(tempPath)
+            os.replace(tempPath, self.basePath(layerKey))
+            self.watermarks[layerKey] = watermark
+
+        self.writeManifest()
+        commitCount = len(self.staged)
+        self.staged = {}
+
+        logMsg = f'Advanced the extraction watermark for {commitCount} layer(s) of - {self.itemID}'
+        logging.info(logMsg)
+
+        return commitCount
+
+
+# Lookup cache shared by the generalDM helpers for the process
+backendLookups = lookupCache()
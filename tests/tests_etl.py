@@ -8,12 +8,24 @@ Updates:
 Seals - tblEvents load.....many more unit tests needed.
 
 """
+import os
+import re
+import json
+import urllib.parse
+import sqlite3
 import unittest
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import pandas as pd
 
 import ETL_Salmonids_Smolts
 import generalDM as dm
+import ArcGIS_API as agl
 import ETL_PINN_Elephant as PElephant
 
 class TestAppendDataSet(unittest.TestCase):
@@ -137,7 +149,9 @@ class TestAppendDataSet(unittest.TestCase):
         mock_connection.cursor.return_value = mock_cursor
 
         # Patch the connect_DB_Access function
-        dm.generalDMClass.connect_DB_Access = MagicMock(return_value=mock_connection)
+        patcher = patch.object(dm.generalDMClass, 'connect_DB_Access', return_value=mock_connection)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
         dmInstance = MagicMock()
         etlInstance = MagicMock()
@@ -180,7 +194,9 @@ class TestAppendDataSet(unittest.TestCase):
         mock_connection.cursor.return_value = mock_cursor
 
         # Patch the connect_DB_Access function
-        dm.generalDMClass.connect_DB_Access = MagicMock(return_value=mock_connection)
+        patcher = patch.object(dm.generalDMClass, 'connect_DB_Access', return_value=mock_connection)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
         dmInstance = MagicMock()
         etlInstance = MagicMock()
@@ -199,6 +215,1271 @@ class TestAppendDataSet(unittest.TestCase):
         # Add logic to confirm the test was successful
         print("Success 'test_record_count_SalmonidsSmolt_Counts' passed.")
 
+    @patch('generalDM.logging.error')
+    def test_failed_batch_bisect(self, mock_log):
+        # Unit Test that a failing record in an executemany batch is isolated by bisecting the batch and the append
+        # exits without committing the failed batch.
+
+        df = pd.DataFrame({"EventID": [1, 2, 3, 4, 5, 6], "Enumeration": [1, 2, -99, 4, 5, 6]})
+
+        def executemany(query, batch):
+            if any(values[1] == -99 for values in batch):
+                raise ValueError("Bad Enumeration")
+
+        mock_cursor = MagicMock()
+        mock_cursor.executemany.side_effect = executemany
+        mock_connection = MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+        insert_query = 'INSERT INTO tblSealCount (EventID, Enumeration) VALUES (?, ?)'
+
+        with self.assertRaises(SystemExit):
+            dm.generalDMClass.appendDataSet(mock_connection, df, 'tblSealCount', insert_query, MagicMock(),
+                                            batchSize=6)
+
+        log_messages = [call_args[0][0] for call_args in mock_log.call_args_list]
+        self.assertTrue(any("failing record 2: (3, -99)" in msg for msg in log_messages))
+        mock_connection.commit.assert_not_called()
+
+        print("Success 'test_failed_batch_bisect' passed.")
+
+    def test_append_returns_inserted_keys(self):
+        # Unit Test that the autonumber keys of the inserted records are read back per batch via the GlobalID, only
+        # keys greater than the maximum key prior to the insert are requested.
+
+        df = pd.DataFrame({"GlobalID": ['g1', 'g2', 'g3'], "ProjectCode": ['E_Seal', 'E_Seal', 'E_Seal']})
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = (100,)
+        mock_cursor.fetchall.side_effect = [[('g1', 101), ('g2', 102)], [('g3', 103)]]
+        mock_connection = MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+        insert_query = 'INSERT INTO tblEvents (GlobalID, ProjectCode) VALUES (?, ?)'
+
+        keysDF = dm.generalDMClass.appendDataSet(mock_connection, df, 'tblEvents', insert_query, MagicMock(),
+                                                 batchSize=2, returnKeys=('GlobalID', 'EventID'))
+
+        self.assertEqual(keysDF.to_dict('list'), {'GlobalID': ['g1', 'g2', 'g3'], 'EventID': [101, 102, 103]})
+        mock_cursor.execute.assert_any_call('SELECT MAX([EventID]) FROM [tblEvents];')
+        mock_cursor.execute.assert_any_call('SELECT [GlobalID], [EventID] FROM [tblEvents] WHERE [GlobalID] IN'
+                                            ' (?, ?) AND [EventID] > 100;', ['g1', 'g2'])
+
+        print("Success 'test_append_returns_inserted_keys' passed.")
+
+class TestBackendSession(unittest.TestCase):
+# Methods for testing the pooled backend session connection reuse
+
+    def test_connection_reused(self):
+        # Sequential checkouts on the same backend path reuse one pooled connection
+
+        with patch.object(dm.generalDMClass, 'connect_DB_Access', return_value=MagicMock()) as mock_connect:
+            session = dm.backendSession()
+            for _ in range(3):
+                cnxn = session.getConnection('mock_backend.accdb')
+                cnxn.cursor()
+                cnxn.close()
+
+            self.assertEqual(mock_connect.call_count, 1)
+            self.assertEqual(session.openCount, 1)
+            self.assertEqual(session.checkoutCount, 3)
+
+        print("Success 'test_connection_reused' passed.")
+
+    def test_stage_unit_of_work(self):
+        # In a 'Stage' unit of work helper commits are deferred to the stage checkpoint and a failed stage is rolled
+        # back leaving the prior checkpoint in place
+
+        mock_connection = MagicMock()
+        with patch.object(dm.generalDMClass, 'connect_DB_Access', return_value=mock_connection):
+            session = dm.backendSession()
+            session.beginUnitOfWork('Stage')
+
+            def stageWrite():
+                cnxn = session.getConnection('mock_backend.accdb')
+                cnxn.commit()
+                cnxn.close()
+                return "Success"
+
+            session.runStage('process_Survey', stageWrite)
+            self.assertEqual(mock_connection.commit.call_count, 1)
+
+            with self.assertRaises(RuntimeError):
+                session.runStage('process_Observations', lambda: None)
+            mock_connection.rollback.assert_called()
+            self.assertEqual(session.completedStages, ['process_Survey'])
+
+            session.endUnitOfWork(commit=False)
+
+        print("Success 'test_stage_unit_of_work' passed.")
+
+    def test_stage_without_unit_of_work_passes_none(self):
+        # With no unit of work the stage wrapper is a pass through - a None return isn't a failure
+
+        session = dm.backendSession()
+        self.assertIsNone(session.runStage('process_Survey', lambda: None))
+        self.assertEqual(session.completedStages, ['process_Survey'])
+
+        print("Success 'test_stage_without_unit_of_work_passes_none' passed.")
+
+    @patch('generalDM.logging.error')
+    def test_failed_batch_not_rolled_back_on_pinned_connection(self, mock_log):
+        # A failed batch on the pinned unit of work connection is bisected on a separate connection, the pinned
+        # connection (holding the prior work of the unit of work) is not rolled back by the append
+
+        def executemany(query, batch):
+            if any(values[1] == -99 for values in batch):
+                raise ValueError("Bad Enumeration")
+
+        pinnedConnection = MagicMock()
+        pinnedConnection.cursor.return_value.executemany.side_effect = executemany
+        probeConnection = MagicMock()
+        probeConnection.cursor.return_value.executemany.side_effect = executemany
+
+        df = pd.DataFrame({"EventID": [1, 2, 3], "Enumeration": [1, -99, 3]})
+        with patch.object(dm.generalDMClass, 'connect_DB_Access', side_effect=[pinnedConnection, probeConnection]):
+            session = dm.backendSession()
+            session.beginUnitOfWork('Run')
+            cnxn = session.getConnection('mock_backend.accdb')
+            with self.assertRaises(SystemExit):
+                dm.generalDMClass.appendDataSet(cnxn, df, 'tblSealCount',
+                                                'INSERT INTO tblSealCount (EventID, Enumeration) VALUES (?, ?)',
+                                                MagicMock())
+
+            pinnedConnection.rollback.assert_not_called()
+            probeConnection.rollback.assert_called()
+            log_messages = [call_args[0][0] for call_args in mock_log.call_args_list]
+            self.assertTrue(any("failing record 1: (2, -99)" in msg for msg in log_messages))
+
+        print("Success 'test_failed_batch_not_rolled_back_on_pinned_connection' passed.")
+
+class TestTableWriter(unittest.TestCase):
+# Methods for testing the schema driven table writer
+
+    def test_writer_column_order_and_types(self):
+        # Dataframe fields are reordered to the table order, converted to the table types and one insert is compiled
+
+        mock_cursor = MagicMock()
+        mock_cursor.columns.return_value = [
+            SimpleNamespace(column_name='SealCountID', type_name='COUNTER', ordinal_position=1),
+            SimpleNamespace(column_name='EventID', type_name='INTEGER', ordinal_position=2),
+            SimpleNamespace(column_name='MatureCode', type_name='VARCHAR', ordinal_position=3),
+            SimpleNamespace(column_name='Enumeration', type_name='SMALLINT', ordinal_position=4)]
+        mock_connection = MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+
+        with patch.object(dm.generalDMClass, 'connect_DB_Access', return_value=mock_connection), \
+                patch.object(dm.generalDMClass, 'appendDataSet') as mock_append:
+            session = dm.backendSession()
+            writer = session.getTableWriter('tblSealCount', 'mock_backend.accdb')
+            self.assertIs(writer, session.getTableWriter('tblSealCount', 'mock_backend.accdb'))
+
+            inDF = pd.DataFrame({'enumeration': ['3', None], 'MatureCode': ['Adult', None], 'EventID': [1, 2]})
+            writer.append(inDF, MagicMock())
+            writer.append(inDF, MagicMock())
+
+            outDF = mock_append.call_args[0][1]
+            insertQuery = mock_append.call_args[0][3]
+            self.assertEqual(outDF.columns.tolist(), ['EventID', 'MatureCode', 'Enumeration'])
+            self.assertEqual(insertQuery, "INSERT INTO [tblSealCount] ([EventID], [MatureCode], [Enumeration]) "
+                                          "VALUES (?, ?, ?)")
+            self.assertEqual(dm.generalDMClass.buildInsertPayload(outDF), [(1, 'Adult', 3), (2, None, None)])
+            self.assertEqual(len(writer.insertQueries), 1)
+
+            with self.assertRaises(ValueError):
+                writer.append(pd.DataFrame({'NotAField': [1]}), MagicMock())
+
+        print("Success 'test_writer_column_order_and_types' passed.")
+
+    def test_writer_reports_failed_conversions(self):
+        # Source values which can't be converted to the field type fail the append with the field and values rather
+        # than being loaded as Null
+
+        mock_cursor = MagicMock()
+        mock_cursor.columns.return_value = [
+            SimpleNamespace(column_name='EventID', type_name='INTEGER', ordinal_position=1),
+            SimpleNamespace(column_name='Weight', type_name='DOUBLE', ordinal_position=2),
+            SimpleNamespace(column_name='Tagged', type_name='BIT', ordinal_position=3)]
+        mock_connection = MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+
+        with patch.object(dm.generalDMClass, 'connect_DB_Access', return_value=mock_connection), \
+                patch.object(dm.generalDMClass, 'appendDataSet') as mock_append:
+            writer = dm.backendSession().getTableWriter('tblFish', 'mock_backend.accdb')
+
+            # Null source values (including their text representations) are loaded as Null
+            writer.append(pd.DataFrame({'EventID': [1, None], 'Weight': ['2.5', 'nan'], 'Tagged': ['Yes', None]}),
+                          MagicMock())
+            mock_append.assert_called_once()
+
+            with self.assertRaises(ValueError) as raised:
+                writer.append(pd.DataFrame({'EventID': ['1', '2.5'], 'Weight': ['heavy', '3'],
+                                            'Tagged': ['Maybe', 'No']}), MagicMock())
+
+        message = str(raised.exception)
+        self.assertIn("('EventID', ['2.5'])", message)
+        self.assertIn("('Weight', ['heavy'])", message)
+        self.assertIn("('Tagged', ['Maybe'])", message)
+
+        print("Success 'test_writer_reports_failed_conversions' passed.")
+
+    def test_writer_converts_numeric_yes_no(self):
+        # Numeric Yes/No source values - float fields with NaN and Access -1 - convert (nonzero Yes, NaN Null)
+
+        mock_cursor = MagicMock()
+        mock_cursor.columns.return_value = [
+            SimpleNamespace(column_name='Tagged', type_name='BIT', ordinal_position=1),
+            SimpleNamespace(column_name='Recaptured', type_name='BIT', ordinal_position=2)]
+        mock_connection = MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+
+        with patch.object(dm.generalDMClass, 'connect_DB_Access', return_value=mock_connection), \
+                patch.object(dm.generalDMClass, 'appendDataSet') as mock_append:
+            writer = dm.backendSession().getTableWriter('tblFish', 'mock_backend.accdb')
+            writer.append(pd.DataFrame({'Tagged': [1.0, 0.0, None], 'Recaptured': [-1, 0, -1]}), MagicMock())
+
+        outDF = mock_append.call_args[0][1]
+        self.assertEqual(outDF['Tagged'].tolist()[:2], [True, False])
+        self.assertTrue(pd.isna(outDF['Tagged'].iloc[2]))
+        self.assertEqual(outDF['Recaptured'].tolist(), [True, False, True])
+
+        print("Success 'test_writer_converts_numeric_yes_no' passed.")
+
+class TestBackendCatalog(unittest.TestCase):
+# Methods for testing the backend catalog snapshot
+
+    def test_catalog_snapshot_and_ddl_invalidation(self):
+        # Catalog is read once, existence/text length checks use the snapshot and DDL invalidates it
+
+        mock_cursor = MagicMock()
+        mock_cursor.tables.return_value = [SimpleNamespace(table_name='tblEvents', table_type='TABLE'),
+                                           SimpleNamespace(table_name='qsel_Events', table_type='VIEW')]
+        mock_cursor.columns.return_value = [
+            SimpleNamespace(column_name='EventID', type_name='COUNTER', column_size=10, ordinal_position=1),
+            SimpleNamespace(column_name='Notes', type_name='VARCHAR', column_size=5, ordinal_position=2)]
+        mock_connection = MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+
+        with patch.object(dm.generalDMClass, 'connect_DB_Access', return_value=mock_connection):
+            session = dm.backendSession()
+            catalog = session.getCatalog('mock_backend.accdb')
+
+            self.assertTrue(catalog.tableExists('TBLEVENTS'))
+            self.assertFalse(catalog.tableExists('qsel_Events'))
+            self.assertTrue(dm.generalDMClass.queryExistsDeleteODBC('qsel_Events', 'mock_backend.accdb',
+                                                                    session=session))
+            self.assertEqual(catalog.getDDLType('tblEvents', 'Notes'), 'TEXT(5)')
+            self.assertEqual(catalog.validateTextLengths('tblEvents', pd.DataFrame({'Notes': ['ok', 'too long']})),
+                             [('Notes', 8, 5)])
+            self.assertEqual(mock_cursor.tables.call_count, 1)
+            self.assertEqual(mock_cursor.columns.call_count, 1)
+
+            self.assertFalse(session.invalidateCatalog('mock_backend.accdb', inQuery='UPDATE tblEvents SET x = 1'))
+            self.assertTrue(session.invalidateCatalog('mock_backend.accdb', inQuery='DROP TABLE tmpTable_ETL'))
+            catalog.tableExists('tblEvents')
+            self.assertEqual(mock_cursor.tables.call_count, 2)
+
+        print("Success 'test_catalog_snapshot_and_ddl_invalidation' passed.")
+
+class TestStagingTable(unittest.TestCase):
+# Methods for testing the staging table loader
+
+    def test_extension_dtypes_and_reuse(self):
+        # Extension dtypes map to Access types and an existing staging table with the same fields is cleared and reused
+
+        df = pd.DataFrame({'EventID': pd.array([1, None], dtype='Int64'),
+                           'Notes': pd.array(['a', None], dtype='string'),
+                           'Code': pd.Categorical(['x', 'y']),
+                           'StartDate': pd.to_datetime(['2025-01-01', '2025-01-02']).tz_localize('UTC')})
+        self.assertEqual([dm.generalDMClass.defineDDLType(df[col]) for col in df.columns],
+                         ['LONG', 'TEXT(255)', 'TEXT(255)', 'DATETIME'])
+
+        ddlTypes = {'EventID': 'LONG', 'Notes': 'TEXT(255)', 'Code': 'TEXT(255)', 'StartDate': 'DATETIME'}
+        mock_catalog = MagicMock()
+        mock_catalog.tableExists.return_value = True
+        mock_catalog.getColumns.return_value = [{'columnName': col} for col in ddlTypes]
+        mock_catalog.getDDLType.side_effect = lambda table, col: ddlTypes[col]
+        mock_catalog.getIndexes.return_value = {'idx_EventID': ['EventID']}
+        mock_cursor = MagicMock()
+        mock_connection = MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+
+        with patch.object(dm.generalDMClass, 'getCatalog', return_value=mock_catalog), \
+                patch.object(dm.generalDMClass, 'connect_DB_Access', return_value=mock_connection), \
+                patch.object(dm.generalDMClass, 'appendDataSet') as mock_append, \
+                patch.object(dm.generalDMClass, 'excuteQuery') as mock_execute:
+            dm.generalDMClass.createTableFromDF(df, 'tmpTable_ETL', 'mock_backend.accdb', indexFields='EventID')
+
+            mock_cursor.execute.assert_called_once_with('DELETE FROM [tmpTable_ETL]')
+            mock_execute.assert_not_called()
+            stagedDF = mock_append.call_args[0][1]
+            self.assertIsNone(stagedDF['StartDate'].dt.tz)
+
+        print("Success 'test_extension_dtypes_and_reuse' passed.")
+
+    def test_staging_table_sweep(self):
+        # Stages get their own staging tables which are swept (with stale and legacy staging tables) at session close
+
+        mock_cursor = MagicMock()
+        mock_cursor.tables.return_value = [
+            SimpleNamespace(table_name='tmpETL_deleteNotMasterEvents', table_type='TABLE'),
+            SimpleNamespace(table_name='tmpTable_ETL', table_type='TABLE'),
+            SimpleNamespace(table_name='tblEvents', table_type='TABLE')]
+        mock_connection = MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+
+        with patch.object(dm.generalDMClass, 'connect_DB_Access', return_value=mock_connection):
+            session = dm.backendSession()
+            self.assertEqual(session.stagingTable('deleteNotMasterEvents', 'mock_backend.accdb'),
+                             'tmpETL_deleteNotMasterEvents')
+            self.assertNotEqual(session.stagingTable('updateToMasterEventID', 'mock_backend.accdb'),
+                                session.stagingTable('deleteNotMasterEvents', 'mock_backend.accdb'))
+            session.close()
+
+            dropped = [call_args[0][0] for call_args in mock_cursor.execute.call_args_list]
+            self.assertEqual(dropped, ['DROP TABLE [tmpETL_deleteNotMasterEvents]', 'DROP TABLE [tmpTable_ETL]'])
+            self.assertEqual(session.stagingTables, {})
+
+        print("Success 'test_staging_table_sweep' passed.")
+
+class TestUpsertDataSet(unittest.TestCase):
+# Methods for testing the set based upsert
+
+    def test_upsert_update_and_insert_missing(self):
+        # Records are staged once then updated on matching keys and appended where the key is not yet present
+
+        df = pd.DataFrame({'EventID': [1, 2], 'ObserverID': [10, 11], 'CreatedDate': ['2025-01-01', '2025-01-01']})
+        mock_cursor = MagicMock()
+        mock_cursor.rowcount = 1
+        mock_connection = MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+
+        with patch.object(dm.generalDMClass, 'connect_DB_Access', return_value=mock_connection), \
+                patch.object(dm.generalDMClass, 'createTableFromDF') as mock_stage:
+            session = dm.backendSession()
+            counts = dm.generalDMClass.upsertDataSet(df, 'tblEventObservers', ['EventID', 'ObserverID'],
+                                                     'mock_backend.accdb', session=session)
+
+            self.assertEqual(counts, (1, 1))
+            self.assertEqual(mock_stage.call_args[0][1], 'tmpETL_upsert_tblEventObservers')
+            statements = [call_args[0][0] for call_args in mock_cursor.execute.call_args_list]
+            self.assertTrue(statements[0].startswith('UPDATE tblEventObservers'))
+            self.assertIn('SET\n            tblEventObservers.[CreatedDate]', statements[0])
+            self.assertIn('WHERE NOT EXISTS', statements[1])
+            self.assertIn('tgt.[EventID] = tmpETL_upsert_tblEventObservers.[EventID] AND tgt.[ObserverID]',
+                          statements[1])
+
+            # Insert only
+            mock_cursor.execute.reset_mock()
+            dm.generalDMClass.upsertDataSet(df, 'tblEventObservers', ['EventID', 'ObserverID'], 'mock_backend.accdb',
+                                            session=session, updateFields=[])
+            self.assertEqual(mock_cursor.execute.call_count, 1)
+
+        print("Success 'test_upsert_update_and_insert_missing' passed.")
+
+    def test_delete_by_keys_strategy(self):
+        # Small key sets are deleted via chunked IN lists, large key sets via one staged key table for all tables
+
+        mock_cursor = MagicMock()
+        mock_cursor.rowcount = 2
+        mock_connection = MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+
+        with patch.object(dm.generalDMClass, 'connect_DB_Access', return_value=mock_connection), \
+                patch.object(dm.generalDMClass, 'createTableFromDF') as mock_stage:
+            session = dm.backendSession()
+            keysDF = pd.DataFrame({'EventID': [1, 2, 3, 3]})
+            deleted = dm.generalDMClass.delete_by_keys(['tblEvents', 'tblElephantEvents'], 'EventID', keysDF,
+                                                       'mock_backend.accdb', session=session, chunkSize=2)
+
+            self.assertEqual(deleted, {'tblEvents': 4, 'tblElephantEvents': 4})
+            mock_stage.assert_not_called()
+            mock_cursor.execute.assert_any_call('DELETE FROM [tblEvents] WHERE [EventID] IN (?, ?);', [1, 2])
+            mock_cursor.execute.assert_any_call('DELETE FROM [tblElephantEvents] WHERE [EventID] IN (?);', [3])
+
+            mock_cursor.execute.reset_mock()
+            dm.generalDMClass.delete_by_keys(['tblEvents', 'tblElephantEvents'], 'EventID', keysDF,
+                                             'mock_backend.accdb', session=session, inListThreshold=2)
+            self.assertEqual(mock_stage.call_count, 1)
+            self.assertEqual(mock_cursor.execute.call_count, 2)
+            self.assertTrue(mock_cursor.execute.call_args[0][0].startswith(
+                'DELETE tblElephantEvents.* FROM tblElephantEvents INNER JOIN tmpETL_deleteKeys_tblEvents'))
+
+        print("Success 'test_delete_by_keys_strategy' passed.")
+
+class TestLookupCache(unittest.TestCase):
+# Methods for testing the lookup table cache
+
+    def test_lookup_cache_lru_and_invalidation(self):
+        # Lookups are read once, re-read after a write to the table or a backend file change and evicted least
+        # recently used first
+
+        lookupDF = pd.DataFrame({'ObserverID': [1, 2], 'First_Last': ['Ann_Lee', 'Bo_Chan']})
+        cache = dm.lookupCache(maxEntries=2)
+
+        with patch.object(dm.generalDMClass, 'connect_to_AcessDB_DF', return_value=lookupDF) as mock_read, \
+                patch.object(dm.lookupCache, 'backendModified', return_value=1.0) as mock_modified, \
+                patch.object(dm, 'backendLookups', cache):
+            values = dm.generalDMClass.lookup_many('mock_backend.accdb', 'tluObservers', 'First_Last',
+                                                   ['Ann_Lee', 'Bo_Chan', 'Unknown'], 'ObserverID')
+            self.assertEqual(values, {'Ann_Lee': 1, 'Bo_Chan': 2})
+            dm.generalDMClass.lookup_many('mock_backend.accdb', 'tluObservers', 'First_Last', ['Ann_Lee'],
+                                          'ObserverID')
+            self.assertEqual(mock_read.call_count, 1)
+
+            # Write to the table via an executed statement
+            cache.invalidateStatement('mock_backend.accdb', 'UPDATE tluObservers SET Active = True;')
+            cache.read('SELECT * FROM tluObservers;', 'tluObservers', 'mock_backend.accdb')
+            self.assertEqual(mock_read.call_count, 2)
+            cache.invalidateStatement('mock_backend.accdb', 'SELECT * FROM tluObservers;')
+            cache.read('SELECT * FROM tluObservers;', 'tluObservers', 'mock_backend.accdb')
+            self.assertEqual(mock_read.call_count, 2)
+
+            # Backend file changed outside the ETL
+            mock_modified.return_value = 2.0
+            cache.read('SELECT * FROM tluObservers;', 'tluObservers', 'mock_backend.accdb')
+            self.assertEqual(mock_read.call_count, 3)
+
+            # Least recently used entry evicted
+            cache.read('SELECT * FROM tluDevices;', 'tluDevices', 'mock_backend.accdb')
+            cache.read('SELECT * FROM refSite;', 'refSite', 'mock_backend.accdb')
+            self.assertEqual(cache.evictCount, 1)
+            self.assertNotIn(('mock_backend.accdb', 'tluobservers', 'SELECT * FROM tluObservers;'), cache.entries)
+
+        print("Success 'test_lookup_cache_lru_and_invalidation' passed.")
+
+    @unittest.skipUnless(dm.lookupSnapshot.available(), 'pyarrow not installed')
+    def test_lookup_snapshot_fingerprint(self):
+        # Lookups saved to the on disk snapshot are loaded by the next run only while the table fingerprint matches
+
+        backend = {'lookupDF': pd.DataFrame({'ID': [1, 2], 'DeviceCode': ['D1', 'D2']}), 'RecordCount': 2}
+        catalog = MagicMock()
+        catalog.tableExists.return_value = True
+        catalog.getColumns.return_value = [{'columnName': 'ID', 'typeName': 'COUNTER', 'columnSize': 10}]
+
+        def read_backend(query, inDB, session=None):
+            if 'COUNT(*)' in query:
+                return pd.DataFrame({'TableName': ['tludevices'], 'RecordCount': [backend['RecordCount']],
+                                     'MaxID': [2], 'MaxModified': [None]})
+            return backend['lookupDF']
+
+        query = 'SELECT tluDevices.* FROM tluDevices;'
+        with tempfile.TemporaryDirectory() as snapshotDir, \
+                patch.object(dm.generalDMClass, 'connect_to_AcessDB_DF', side_effect=read_backend) as mock_read, \
+                patch.object(dm.generalDMClass, 'getCatalog', return_value=catalog):
+            firstRun = dm.lookupCache()
+            firstRun.snapshots['mock_backend.accdb'] = dm.lookupSnapshot(snapshotDir, 'mock_backend.accdb')
+            firstRun.read(query, 'tluDevices', 'mock_backend.accdb')
+
+            # Manifest is only written when the snapshot is flushed (stage checkpoint/end of run)
+            self.assertEqual(dm.lookupSnapshot(snapshotDir, 'mock_backend.accdb').load(dm.lookupCache()), 0)
+            self.assertEqual(firstRun.flushSnapshots(), 1)
+
+            # Next run - unchanged table is loaded from the snapshot without reading the lookup
+            secondRun = dm.lookupCache()
+            self.assertEqual(dm.lookupSnapshot(snapshotDir, 'mock_backend.accdb').load(secondRun), 1)
+            mock_read.reset_mock()
+            outDF = secondRun.read(query, 'tluDevices', 'mock_backend.accdb')
+            self.assertEqual(outDF['DeviceCode'].tolist(), ['D1', 'D2'])
+            mock_read.assert_not_called()
+
+            # Records added to the lookup table - snapshot is stale
+            backend['RecordCount'] = 3
+            thirdRun = dm.lookupCache()
+            self.assertEqual(dm.lookupSnapshot(snapshotDir, 'mock_backend.accdb').load(thirdRun), 0)
+            self.assertEqual(len(thirdRun.entries), 0)
+
+        print("Success 'test_lookup_snapshot_fingerprint' passed.")
+
+    def test_lookup_snapshot_fingerprint_queries(self):
+        # Fingerprints are read in one aggregate query (maximum modified date where the table has one), only tables
+        # without an autonumber or modified date are read in full, and flush reuses the fingerprints of the run
+
+        columns = {'tluObservers': [{'columnName': 'ObserverID', 'typeName': 'COUNTER', 'columnSize': 10},
+                                    {'columnName': 'Date_Modified', 'typeName': 'DATETIME', 'columnSize': 19}],
+                   'tluDevices': [{'columnName': 'ID', 'typeName': 'COUNTER', 'columnSize': 10}],
+                   'tluSpecies': [{'columnName': 'SpeciesCode', 'typeName': 'VARCHAR', 'columnSize': 10}]}
+        catalog = MagicMock()
+        catalog.tableExists.return_value = True
+        catalog.getColumns.side_effect = lambda table: columns[table]
+        backend = {'modified': pd.Timestamp('2024-05-01 10:00'), 'species': ['CHIN', 'COHO']}
+
+        def read_backend(query, inDB, session=None):
+            if 'COUNT(*)' in query:
+                countDF = pd.DataFrame({'TableName': ['tluobservers', 'tludevices', 'tluspecies'],
+                                        'RecordCount': [2, 2, 2], 'MaxID': [2, 2, 0],
+                                        'MaxModified': [backend['modified'], None, None]})
+                return countDF[[f"'{table}' AS" in query for table in countDF['TableName']]]
+            return pd.DataFrame({'SpeciesCode': backend['species']})
+
+        snapshot = dm.lookupSnapshot(tempfile.gettempdir(), 'mock_backend.accdb')
+        with patch.object(dm.generalDMClass, 'getCatalog', return_value=catalog), \
+                patch.object(dm.generalDMClass, 'connect_to_AcessDB_DF', side_effect=read_backend) as mock_read:
+            fingerprintDic = snapshot.fingerprints(['tluObservers', 'tluDevices', 'tluSpecies'])
+            queries = [call_args[0][0] for call_args in mock_read.call_args_list]
+            self.assertEqual(len(queries), 2)
+            self.assertIn('MAX([Date_Modified]) AS MaxModified FROM [tluObservers]', queries[0])
+            self.assertEqual(queries[1], 'SELECT * FROM [tluSpecies];')
+
+            # Observer edited in place (modified date) and species edited in place (row hash) - fingerprints change
+            backend['modified'] = pd.Timestamp('2024-05-02 09:00')
+            backend['species'] = ['CHIN', 'STHD']
+            editedDic = snapshot.fingerprints(['tluObservers', 'tluDevices', 'tluSpecies'])
+            self.assertNotEqual(editedDic['tluobservers'], fingerprintDic['tluobservers'])
+            self.assertEqual(editedDic['tludevices'], fingerprintDic['tludevices'])
+            self.assertNotEqual(editedDic['tluspecies'], fingerprintDic['tluspecies'])
+
+            # Flush reuses the fingerprints of the run, a table written by the ETL is fingerprinted again
+            mock_read.reset_mock()
+            snapshot.pending = {'devices': {'table': 'tluDevices', 'query': 'SELECT * FROM tluDevices;'}}
+            snapshot.dirty = True
+            with patch.object(dm.lookupSnapshot, 'writeManifest') as mock_write:
+                self.assertEqual(snapshot.flush(), 1)
+                mock_read.assert_not_called()
+                mock_write.assert_called_once()
+
+                snapshot.invalidate('tluDevices')
+                snapshot.pending = {'devices': {'table': 'tluDevices', 'query': 'SELECT * FROM tluDevices;'}}
+                snapshot.flush()
+                self.assertEqual(mock_read.call_count, 1)
+            self.assertEqual(snapshot.manifest['devices']['fingerprint'], editedDic['tludevices'])
+
+        print("Success 'test_lookup_snapshot_fingerprint_queries' passed.")
+
+
+class TestKeyResolver(unittest.TestCase):
+# Methods for testing the GlobalID to surrogate key resolver
+
+    def test_key_resolver_incremental_refresh(self):
+        # Keys are read once, appended parent records are added incrementally and deletes reload the resolver
+
+        reads = [pd.DataFrame({'GlobalID': ['g1', 'g2'], 'ID': [1, 2]}),
+                 pd.DataFrame({'GlobalID': ['g3'], 'ID': [3]}),
+                 pd.DataFrame({'GlobalID': ['g1', 'g3'], 'ID': [1, 3]})]
+
+        with patch.object(dm.generalDMClass, 'connect_to_AcessDB_DF', side_effect=reads) as mock_read:
+            session = dm.backendSession()
+            resolver = session.getKeyResolver('tblEventSurvey', 'mock_backend.accdb')
+            self.assertIs(resolver, session.getKeyResolver('tblEventSurvey', 'mock_backend.accdb'))
+
+            self.assertEqual(resolver.resolve(['g2', 'g1']).tolist(), [2, 1])
+            self.assertEqual(resolver.frame().columns.tolist(), ['GlobalID', 'ID'])
+            self.assertEqual(mock_read.call_count, 1)
+
+            # Records appended to the parent table - only the new keys are read
+            session.invalidateKeyResolvers('mock_backend.accdb', 'tblEventSurvey', insertOnly=True)
+            self.assertEqual(resolver.resolve(['g3']).tolist(), [3])
+            self.assertIn('[ID] > 2', mock_read.call_args[0][0])
+
+            # Records deleted from the parent table - full reload
+            session.invalidateKeyResolvers('mock_backend.accdb', inQuery='DELETE FROM tblEventSurvey WHERE ID = 2;')
+            self.assertTrue(resolver.resolve(['g2']).isna().all())
+            self.assertEqual(resolver.loadCount, 2)
+
+        print("Success 'test_key_resolver_incremental_refresh' passed.")
+
+
+class TestFilteredQuery(unittest.TestCase):
+# Methods for testing the projected, key filtered query builder
+
+    def test_filtered_query_chunks(self):
+        # Only the passed columns of the records matching the keys are read, in chunks of parameterized IN lists
+
+        queries = dm.generalDMClass.buildFilteredQueries('tblEvents', ['EventID', 'CreatedDate'], 'EventID',
+                                                         pd.Series([1, 2, 2, 3, None]), chunkSize=2)
+        self.assertEqual(queries, [('SELECT [EventID], [CreatedDate] FROM [tblEvents] WHERE [EventID] IN (?, ?);',
+                                    [1, 2]),
+                                   ('SELECT [EventID], [CreatedDate] FROM [tblEvents] WHERE [EventID] IN (?);', [3])])
+
+        # Composite keys - OR'd key groups within the parameter limit
+        keysDF = pd.DataFrame({'EventID': [1, 2], 'ObserverID': [10, 11]})
+        queries = dm.generalDMClass.buildFilteredQueries('tblEventObservers', ['EventID'], ['EventID', 'ObserverID'],
+                                                         keysDF, chunkSize=4)
+        self.assertEqual(len(queries), 1)
+        self.assertIn('([EventID] = ? AND [ObserverID] = ?) OR ([EventID] = ? AND [ObserverID] = ?)', queries[0][0])
+
+        mock_cursor = MagicMock()
+        mock_cursor.description = [('EventID', int), ('CreatedDate', str)]
+        mock_cursor.fetchmany.side_effect = [[(1, '2025-01-01'), (2, '2025-01-02')], [], [(3, '2025-01-03')], []]
+        mock_connection = MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+
+        with patch.object(dm.generalDMClass, 'connect_DB_Access', return_value=mock_connection) as mock_connect:
+            outDF = dm.generalDMClass.readFiltered('tblEvents', ['EventID', 'CreatedDate'], 'EventID', [1, 2, 3],
+                                                   'mock_backend.accdb', chunkSize=2)
+            self.assertEqual(outDF['EventID'].tolist(), [1, 2, 3])
+            self.assertEqual(mock_connect.call_count, 1)
+
+            emptyDF = dm.generalDMClass.readFiltered('tblEvents', ['EventID'], 'EventID', [], 'mock_backend.accdb')
+            self.assertTrue(emptyDF.empty)
+            self.assertEqual(mock_connect.call_count, 1)
+
+        print("Success 'test_filtered_query_chunks' passed.")
+
+
+class TestQueryReader(unittest.TestCase):
+# Methods for testing the streaming typed query reader
+
+    def test_typed_streaming_reader(self):
+        # Records are fetched in blocks into typed columns, optionally returned in chunks, on the session connection
+
+        from datetime import datetime
+        rows = [(1, 'CO', 1.5, True, datetime(2025, 1, 1)), (2, None, None, False, None),
+                (3, 'SH', 2.0, True, datetime(2025, 1, 3))]
+        mock_cursor = MagicMock()
+        mock_cursor.description = [('EventID', int), ('SpeciesCode', str), ('FishWeight', float), ('Dead', bool),
+                                   ('CreatedDate', datetime)]
+        mock_connection = MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+
+        with patch.object(dm.generalDMClass, 'connect_DB_Access', return_value=mock_connection):
+            session = dm.backendSession()
+            mock_cursor.fetchmany.side_effect = [rows[:2], rows[2:], []]
+            outDF = dm.generalDMClass.readQuery('SELECT * FROM tblSmoltMeasurements;', 'mock_backend.accdb',
+                                                session=session, fetchSize=2)
+
+            self.assertEqual(outDF.dtypes.astype(str).tolist(),
+                             ['int64', 'object', 'float64', 'bool', 'datetime64[ns]'])
+            self.assertTrue(pd.isna(outDF.loc[1, 'CreatedDate']))
+            self.assertEqual((session.readCount, session.readRows), (1, 3))
+            mock_connection.close.assert_called_once()
+
+            # Iterator mode
+            mock_cursor.fetchmany.side_effect = [rows, []]
+            chunks = list(dm.generalDMClass.readQuery('SELECT * FROM tblSmoltMeasurements;', 'mock_backend.accdb',
+                                                      session=session, chunksize=2))
+            self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+            self.assertEqual(chunks[1]['EventID'].tolist(), [3])
+
+        print("Success 'test_typed_streaming_reader' passed.")
+
+
+class TestReadMirror(unittest.TestCase):
+# Methods for testing the local SQLite read mirror
+
+    def test_read_mirror_applies_run_writes(self):
+        # Mirrored tables are served locally, appends without an autonumber are applied to the mirror, appends to
+        # autonumber tables pull only the new keys and other writes recopy the table
+
+        from datetime import datetime
+        columns = {'tblEvents': [{'columnName': 'EventID', 'typeName': 'COUNTER'},
+                                 {'columnName': 'StartDate', 'typeName': 'DATETIME'}],
+                   'tblEventObservers': [{'columnName': 'EventID', 'typeName': 'INTEGER'},
+                                         {'columnName': 'ObserverID', 'typeName': 'INTEGER'}]}
+        mock_catalog = MagicMock()
+        mock_catalog.getColumns.side_effect = lambda tableName: columns[tableName]
+        mock_catalog.getIndexes.return_value = {'PrimaryKey': ['EventID']}
+        backendReads = []
+
+        def mock_readQuery(query, inDB, session=None, chunksize=None):
+            backendReads.append(query)
+            if 'tblEvents]' in query:
+                keys = [3] if 'WHERE' in query else [1, 2]
+                return iter([pd.DataFrame({'EventID': keys, 'StartDate': [datetime(2025, 1, key) for key in keys]})])
+            return iter([pd.DataFrame({'EventID': [1], 'ObserverID': [10]})])
+
+        with tempfile.TemporaryDirectory() as tempDir, \
+                patch.object(dm.generalDMClass, 'getCatalog', return_value=mock_catalog), \
+                patch.object(dm.generalDMClass, 'readQuery', side_effect=mock_readQuery):
+            session = dm.backendSession()
+            session.openReadMirror('mock_backend.accdb', os.path.join(tempDir, 'readMirror.sqlite'),
+                                   ['tblEvents', 'tblEventObservers'])
+            self.assertIsNone(session.getMirror('mock_backend.accdb', ['tblEvents', 'tblContacts']))
+
+            query = ("SELECT tblEvents.EventID, tblEvents.StartDate, tblEventObservers.ObserverID FROM tblEvents "
+                     "INNER JOIN tblEventObservers ON tblEvents.EventID = tblEventObservers.EventID;")
+            outDF = dm.generalDMClass.readMirrored(query, ['tblEvents', 'tblEventObservers'], 'mock_backend.accdb',
+                                                   session=session)
+            self.assertEqual(outDF['ObserverID'].tolist(), [10])
+            self.assertEqual(str(outDF['StartDate'].dtype), 'datetime64[ns]')
+
+            # Inserted observers applied locally, inserted event pulled by key from the backend on the next read
+            session.invalidateMirror('mock_backend.accdb', 'tblEventObservers', insertOnly=True,
+                                     insertedRecords=(['EventID', 'ObserverID'], [(3, 11)]))
+            session.invalidateMirror('mock_backend.accdb', 'tblEvents', insertOnly=True)
+            backendCount = len(backendReads)
+            outDF = dm.generalDMClass.readMirrored(query, ['tblEvents', 'tblEventObservers'], 'mock_backend.accdb',
+                                                   session=session)
+            self.assertEqual(sorted(outDF['ObserverID'].tolist()), [10, 11])
+            self.assertEqual(backendReads[backendCount:], ['SELECT * FROM [tblEvents] WHERE [EventID] > 2;'])
+
+            # Update recopies the table
+            session.invalidateMirror('mock_backend.accdb', inQuery='UPDATE tblEventObservers SET ObserverID = 12;')
+            self.assertEqual(session.readMirrors['mock_backend.accdb'].tables['tbleventobservers']['state'], 'stale')
+            session.readMirrors['mock_backend.accdb'].close()
+
+        print("Success 'test_read_mirror_applies_run_writes' passed.")
+
+    def test_read_mirror_empty_table_keeps_types(self):
+        # Mirror of an empty table is created with the catalog types - appended keys are pulled by numeric maximum
+        # and read back as integers
+
+        mock_catalog = MagicMock()
+        mock_catalog.getColumns.return_value = [{'columnName': 'EventID', 'typeName': 'COUNTER'},
+                                                {'columnName': 'Temperature', 'typeName': 'DOUBLE'},
+                                                {'columnName': 'Notes', 'typeName': 'VARCHAR'}]
+        mock_catalog.getIndexes.return_value = {}
+        backendKeys = []
+        backendReads = []
+
+        def mock_readQuery(query, inDB, session=None, chunksize=None):
+            backendReads.append(query)
+            maxKey = int(query.split('>')[1].strip(' ;')) if 'WHERE' in query else 0
+            keys = [key for key in backendKeys if key > maxKey]
+            return iter([pd.DataFrame({'EventID': pd.Series(keys, dtype=object),
+                                       'Temperature': pd.Series([None] * len(keys), dtype=object),
+                                       'Notes': pd.Series(['Note'] * len(keys), dtype=object)})])
+
+        with tempfile.TemporaryDirectory() as tempDir, \
+                patch.object(dm.generalDMClass, 'getCatalog', return_value=mock_catalog), \
+                patch.object(dm.generalDMClass, 'readQuery', side_effect=mock_readQuery):
+            mirror = dm.readMirror('mock_backend.accdb', os.path.join(tempDir, 'readMirror.sqlite'))
+            self.assertEqual(mirror.addTable('tblEvents'), 0)
+            declared = {row[1]: row[2] for row in mirror.connection.execute('PRAGMA table_info("tblEvents")')}
+            self.assertEqual(declared, {'EventID': 'INTEGER', 'Temperature': 'REAL', 'Notes': 'TEXT'})
+
+            # Events 9 and 10 then 11 appended during the run - only 11 is pulled by the second refresh
+            backendKeys.extend([9, 10])
+            mirror.noteWrite('tblEvents', insertOnly=True)
+            mirror.read('SELECT * FROM tblEvents;', ['tblEvents'])
+            backendKeys.append(11)
+            mirror.noteWrite('tblEvents', insertOnly=True)
+            outDF = mirror.read('SELECT * FROM tblEvents ORDER BY EventID;', ['tblEvents'])
+            self.assertEqual(backendReads[-1], 'SELECT * FROM [tblEvents] WHERE [EventID] > 10;')
+            self.assertEqual(outDF['EventID'].tolist(), [9, 10, 11])
+            self.assertEqual(str(outDF['EventID'].dtype), 'int64')
+            mirror.close()
+
+        print("Success 'test_read_mirror_empty_table_keeps_types' passed.")
+
+
+class TestSQLiteBackend(unittest.TestCase):
+# Methods for testing the SQLite reference backend
+
+    def test_sqlite_backend_round_trip(self):
+        # Backend built from an Access DDL schema script, appends, set based upsert, keyed delete via a staging table
+        # and catalog introspection run on SQLite through the same generalDM helpers as the Access backend
+
+        schemaScript = ("CREATE TABLE [tblEvents] ([EventID] COUNTER, [GlobalID] TEXT(38), [StartDate] DATETIME, "
+                        "[QCFlag] YESNO, [Notes] MEMO);\n"
+                        "CREATE INDEX [GlobalID] ON [tblEvents] ([GlobalID]);")
+
+        with tempfile.TemporaryDirectory() as tempDir:
+            inDB = dm.generalDMClass.createBackendFromSchema(os.path.join(tempDir, 'mock_backend.sqlite'),
+                                                             schemaScript)
+            self.assertIs(dm.generalDMClass.getBackend(inDB), dm.sqliteBackend)
+            session = dm.backendSession()
+
+            catalog = dm.generalDMClass.getCatalog(inDB, session=session)
+            self.assertEqual([record['typeName'] for record in catalog.getColumns('tblEvents')],
+                             ['COUNTER', 'VARCHAR', 'DATETIME', 'BIT', 'LONGCHAR'])
+            self.assertEqual(catalog.getDDLType('tblEvents', 'GlobalID'), 'TEXT(38)')
+            self.assertEqual(catalog.getIndexes('tblEvents')['PrimaryKey'], ['EventID'])
+
+            inDF = pd.DataFrame({'GlobalID': ['g1', 'g2', 'g3'],
+                                 'StartDate': pd.to_datetime(['2025-01-01', '2025-01-02', '2025-01-03']),
+                                 'QCFlag': [True, False, True], 'Notes': [None, 'two', 'three']})
+            keysDF = session.getTableWriter('tblEvents', inDB).append(inDF, None, returnKeys=('GlobalID', 'EventID'))
+            self.assertEqual(keysDF['EventID'].tolist(), [1, 2, 3])
+
+            upsertDF = pd.DataFrame({'EventID': [1, 4], 'Notes': ['one', 'four']})
+            self.assertEqual(dm.generalDMClass.upsertDataSet(upsertDF, 'tblEvents', 'EventID', inDB,
+                                                             session=session), (1, 1))
+            deleted = dm.generalDMClass.delete_by_keys('tblEvents', 'EventID', pd.DataFrame({'EventID': [2]}), inDB,
+                                                       session=session, inListThreshold=0)
+            self.assertEqual(deleted, {'tblEvents': 1})
+
+            outDF = dm.generalDMClass.readQuery("SELECT * FROM tblEvents ORDER BY EventID;", inDB, session=session)
+            self.assertEqual(outDF['EventID'].tolist(), [1, 3, 4])
+            self.assertEqual(outDF['Notes'].tolist(), ['one', 'three', 'four'])
+            self.assertTrue(pd.api.types.is_datetime64_any_dtype(outDF['StartDate']))
+            self.assertEqual(outDF.loc[0, 'QCFlag'], True)
+            session.close()
+
+        print("Success 'test_sqlite_backend_round_trip' passed.")
+
+    def test_sqlite_translates_access_concatenation(self):
+        # Access '&' concatenation (Null operands as empty strings) is translated to '||', an '&' in a literal is kept
+        # and Access backends can't be built from a schema script
+
+        query = "SELECT tluObservers.ObserverID, [FirstName] & '_' & [LastName] AS First_Last FROM tluObservers;"
+        self.assertEqual(dm.sqliteBackend.translate(query),
+                         "SELECT tluObservers.ObserverID, (IFNULL([FirstName], '') || '_' || IFNULL([LastName], ''))"
+                         " AS First_Last FROM tluObservers;")
+        self.assertEqual(dm.sqliteBackend.translate("SELECT * FROM tluSites WHERE SiteName = 'Bolinas & Drakes';"),
+                         "SELECT * FROM tluSites WHERE SiteName = 'Bolinas & Drakes';")
+
+        schemaScript = ("CREATE TABLE [tluObservers] ([ObserverID] COUNTER, [FirstName] TEXT(50), [LastName] TEXT(50));"
+                        "\nINSERT INTO [tluObservers] ([FirstName], [LastName]) VALUES ('Ann', 'Lee');"
+                        "\nINSERT INTO [tluObservers] ([FirstName], [LastName]) VALUES ('Bo', NULL);")
+        with tempfile.TemporaryDirectory() as tempDir:
+            inDB = dm.generalDMClass.createBackendFromSchema(os.path.join(tempDir, 'mock_backend.sqlite'),
+                                                             schemaScript)
+            session = dm.backendSession()
+            outDF = dm.generalDMClass.readQuery(query, inDB, session=session)
+            self.assertEqual(outDF['First_Last'].tolist(), ['Ann_Lee', 'Bo_'])
+            session.close()
+
+            with self.assertRaises(ValueError):
+                dm.generalDMClass.createBackendFromSchema(os.path.join(tempDir, 'mock_backend.accdb'), schemaScript)
+
+        print("Success 'test_sqlite_translates_access_concatenation' passed.")
+
+
+class TestIndexAdvisor(unittest.TestCase):
+# Methods for testing the backend index advisor
+
+    def test_index_advisor_reports_and_creates(self):
+        # Join/filter columns of the update, upsert and keyed reads are compared with the catalog indexes, missing
+        # indexes are reported with the table record count and created in maintenance mode
+
+        advisor = dm.indexAdvisor()
+        update_sql = dm.generalDMClass.build_access_update_sql(pd.DataFrame({'EventID': [1], 'SealCountID': [2]}),
+                                                               'tblSealCount', 'tmpETL_stage', 'SealCountID')
+        self.assertEqual(advisor.record('mock_backend.accdb', update_sql), [('tblSealCount', 'SealCountID')])
+        self.assertEqual(advisor.record('mock_backend.accdb', "SELECT [ObserverID] FROM [tblEventObservers] WHERE "
+                                                              "[EventID] IN (?, ?);"),
+                         [('tblEventObservers', 'EventID')])
+
+        schemaScript = ("CREATE TABLE [tblEventObservers] ([ID] COUNTER, [EventID] LONG, [ObserverID] LONG);\n"
+                        "INSERT INTO [tblEventObservers] ([EventID], [ObserverID]) VALUES (1, 10), (2, 11);")
+
+        with tempfile.TemporaryDirectory() as tempDir:
+            inDB = dm.generalDMClass.createBackendFromSchema(os.path.join(tempDir, 'mock_backend.sqlite'),
+                                                             schemaScript)
+            session = dm.backendSession()
+            dm.generalDMClass.readFiltered('tblEventObservers', ['ObserverID'], 'EventID', [1], inDB,
+                                           session=session)
+
+            logMsgs = session.adviseIndexes(inDB)
+            self.assertEqual(len(logMsgs), 1)
+            self.assertIn('tblEventObservers.[EventID]', logMsgs[0])
+            self.assertIn('2 record(s)', logMsgs[0])
+
+            session.adviseIndexes(inDB, createIndexes=True, minRows=1)
+            self.assertEqual(session.adviseIndexes(inDB), [])
+            session.close()
+
+        print("Success 'test_index_advisor_reports_and_creates' passed.")
+
+
+class TestSavedQueryDDL(unittest.TestCase):
+# Methods for testing the COM free saved query/table management
+
+    def test_saved_query_ddl_and_com_batch(self):
+        # Saved queries and tables are created/dropped with SQL on the session connection, COM only operations (query
+        # descriptions) are batched into one Access session per database
+
+        with tempfile.TemporaryDirectory() as tempDir:
+            inDB = dm.generalDMClass.createBackendFromSchema(os.path.join(tempDir, 'mock_backend.sqlite'),
+                                                             "CREATE TABLE [tblEvents] ([EventID] COUNTER);")
+            session = dm.backendSession()
+            catalog = dm.generalDMClass.getCatalog(inDB, session=session)
+
+            dm.generalDMClass.pushQuery("SELECT EventID FROM tblEvents;", 'qry_Events', inDB, session=session)
+            self.assertTrue(catalog.queryExists('qry_Events'))
+            dm.generalDMClass.queryExistsDelete('qry_Events', inDB, session=session)
+            self.assertFalse(catalog.queryExists('qry_Events'))
+            dm.generalDMClass.tableExistsDelete('tblEvents', inDB, session=session)
+            self.assertFalse(catalog.tableExists('tblEvents'))
+            session.close()
+
+        mock_win32com = MagicMock()
+        qcCheckInstance = SimpleNamespace(inDBFE='mock_frontend.accdb')
+        with patch.object(dm, 'win32com', mock_win32com):
+            session = dm.backendSession()
+            dm.generalDMClass.queryDesc('qc_Check1', 'First check', qcCheckInstance, session=session)
+            dm.generalDMClass.queryDesc('qc_Check2', 'Second check', qcCheckInstance, session=session)
+            mock_win32com.client.Dispatch.assert_not_called()
+
+            session.close()
+            mock_win32com.client.Dispatch.assert_called_once_with('Access.Application')
+            self.assertEqual(mock_win32com.client.Dispatch.return_value.CurrentDb.return_value.QueryDefs.call_count, 2)
+
+        print("Success 'test_saved_query_ddl_and_com_batch' passed.")
+
+    def test_com_fallbacks_batched_in_order(self):
+        # Query/table DDL the Access driver rejects falls back to COM operations queued on the session, run in order
+        # in one Access session at close with the catalog invalidated only once they have run
+
+        mock_win32com = MagicMock()
+        mock_catalog = MagicMock()
+        mock_catalog.queryExists.return_value = True
+        mock_catalog.tableExists.return_value = True
+        with patch.object(dm, 'win32com', mock_win32com), \
+                patch.object(dm.generalDMClass, 'executeDDL', return_value=False):
+            session = dm.backendSession()
+            session.catalogs['mock_backend.accdb'] = mock_catalog
+            dm.generalDMClass.queryExistsDelete('qry_Events', 'mock_backend.accdb', session=session)
+            dm.generalDMClass.pushQuery('SELECT EventID FROM tblEvents;', 'qry_Events', 'mock_backend.accdb',
+                                        session=session)
+            dm.generalDMClass.tableExistsDelete('tbl_Staging', 'mock_backend.accdb', session=session)
+            mock_win32com.client.Dispatch.assert_not_called()
+            mock_catalog.invalidate.assert_not_called()
+
+            session.close()
+            mock_win32com.client.Dispatch.assert_called_once_with('Access.Application')
+            db = mock_win32com.client.Dispatch.return_value.CurrentDb.return_value
+            self.assertEqual([name for name, args, kwargs in db.mock_calls],
+                             ['QueryDefs.Delete', 'CreateQueryDef', 'TableDefs.Delete'])
+            mock_catalog.invalidate.assert_called_once()
+
+        print("Success 'test_com_fallbacks_batched_in_order' passed.")
+
+
+class TestTextBulkLoad(unittest.TestCase):
+# Methods for testing the Access text driver bulk load
+
+    def test_text_bulk_load_and_fallback(self):
+        # Writer appends are loaded in one INSERT ... SELECT FROM [Text;...] statement from a CSV with a schema.ini
+        # defining the backend field types, falling back to the ODBC append when the statement fails
+
+        from datetime import datetime
+        mock_catalog = MagicMock()
+        mock_catalog.getColumns.return_value = [
+            {'columnName': 'EventID', 'typeName': 'INTEGER', 'columnSize': None},
+            {'columnName': 'SurveyDate', 'typeName': 'DATETIME', 'columnSize': None},
+            {'columnName': 'Detection', 'typeName': 'BIT', 'columnSize': None},
+            {'columnName': 'Notes', 'typeName': 'VARCHAR', 'columnSize': 50}]
+        mock_catalog.validateTextLengths.return_value = []
+        inDF = pd.DataFrame({'EventID': [1, 2], 'SurveyDate': [datetime(2025, 5, 1, 8, 30), None],
+                             'Detection': ['Yes', 'No'], 'Notes': ['Owl "call"', 'nan']})
+        importFiles = {}
+
+        def mock_execute(statement, *args):
+            importDir = re.search(r'Database=([^;\]]+)\]', statement).group(1)
+            for fileName in os.listdir(importDir):
+                with open(os.path.join(importDir, fileName), encoding='utf-8') as importFile:
+                    importFiles[fileName] = importFile.read()
+
+        mock_cursor = MagicMock()
+        mock_cursor.execute.side_effect = mock_execute
+        mock_cursor.rowcount = 2
+        mock_connection = MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+
+        with tempfile.TemporaryDirectory() as tempDir, \
+                patch.object(dm.generalDMClass, 'getCatalog', return_value=mock_catalog), \
+                patch.object(dm.generalDMClass, 'connect_DB_Access', return_value=mock_connection), \
+                patch.object(dm.tableWriter, 'appendODBC') as mock_appendODBC:
+            session = dm.backendSession()
+            session.textImportDir = tempDir
+            writer = dm.tableWriter('tblMonitoringOwlCall', 'mock_backend.accdb', session=session)
+            writer.append(inDF, None)
+
+            statement = mock_cursor.execute.call_args[0][0]
+            self.assertTrue(statement.startswith('INSERT INTO [tblMonitoringOwlCall] ([EventID], [SurveyDate], '
+                                                 '[Detection], [Notes]) SELECT'))
+            self.assertIn('[tblMonitoringOwlCall#csv]', statement)
+            self.assertIn('Col4="Notes" Text Width 50', importFiles['schema.ini'])
+            self.assertEqual(importFiles['tblMonitoringOwlCall.csv'].splitlines()[1:],
+                             ['1,2025-05-01 08:30:00,True,"Owl ""call"""', '2,,False,'])
+            mock_appendODBC.assert_not_called()
+            self.assertEqual(os.listdir(tempDir), [])
+
+            # Text driver failure falls back to the ODBC append
+            mock_cursor.execute.side_effect = sqlite3.OperationalError('text driver')
+            writer.append(inDF, None)
+            mock_appendODBC.assert_called_once()
+
+        print("Success 'test_text_bulk_load_and_fallback' passed.")
+
+    def test_text_bulk_load_skipped_in_unit_of_work(self):
+        # While a unit of work is active writer appends go via the ODBC append on the pinned connection, the text
+        # bulk load (whose failure would roll back the pinned connection) is not used
+
+        mock_catalog = MagicMock()
+        mock_catalog.getColumns.return_value = [{'columnName': 'EventID', 'typeName': 'INTEGER', 'columnSize': None},
+                                                {'columnName': 'Notes', 'typeName': 'VARCHAR', 'columnSize': 50}]
+        mock_catalog.validateTextLengths.return_value = []
+        inDF = pd.DataFrame({'EventID': [1, 2], 'Notes': ['Owl call', None]})
+        pinnedConnection = MagicMock()
+
+        with tempfile.TemporaryDirectory() as tempDir, \
+                patch.object(dm.generalDMClass, 'getCatalog', return_value=mock_catalog), \
+                patch.object(dm.generalDMClass, 'connect_DB_Access', return_value=pinnedConnection), \
+                patch.object(dm.tableWriter, 'appendODBC') as mock_appendODBC:
+            session = dm.backendSession()
+            session.textImportDir = tempDir
+            session.beginUnitOfWork('Stage')
+            writer = dm.tableWriter('tblMonitoringOwlCall', 'mock_backend.accdb', session=session)
+            with session.stage('process_OwlCall'):
+                writer.append(inDF, None)
+
+            mock_appendODBC.assert_called_once()
+            pinnedConnection.cursor.return_value.execute.assert_not_called()
+            pinnedConnection.rollback.assert_not_called()
+            self.assertEqual(os.listdir(tempDir), [])
+            session.endUnitOfWork()
+
+        print("Success 'test_text_bulk_load_skipped_in_unit_of_work' passed.")
+
+
+class TestStartupPrefetch(unittest.TestCase):
+# Methods for testing the concurrent startup prefetch of the lookup tables
+
+    def test_prefetch_lookups_read_once(self):
+        # Lookups read by the prior run are prefetched on the thread pool, the protocol read waits on the prefetch
+        # rather than reading the table a second time
+
+        lookupDF = pd.DataFrame({'ObserverID': [1, 2], 'First_Last': ['Ann_Lee', 'Bo_Chan']})
+        query = 'SELECT * FROM tluObservers;'
+        release = threading.Event()
+
+        def read_backend(inQuery, inDB, session=None):
+            release.wait(5)
+            return lookupDF
+
+        with tempfile.TemporaryDirectory() as workspace, ThreadPoolExecutor(max_workers=2) as executor, \
+                patch.object(dm.generalDMClass, 'connect_to_AcessDB_DF', side_effect=read_backend) as mock_read, \
+                patch.object(dm.lookupCache, 'backendModified', return_value=1.0):
+            prefetchPath = os.path.join(workspace, 'lookupPrefetch_nsow.json')
+
+            # Prior run - lookups read are saved to the prefetch list
+            with patch.object(dm, 'backendLookups', dm.lookupCache()):
+                release.set()
+                dm.generalDMClass.readLookup(query, 'tluObservers', 'mock_backend.accdb')
+                self.assertEqual(dm.generalDMClass.saveLookupPrefetch('mock_backend.accdb', prefetchPath), 1)
+
+            # Next run - prefetched while the main thread does other work
+            release.clear()
+            mock_read.reset_mock()
+            cache = dm.lookupCache()
+            with patch.object(dm, 'backendLookups', cache):
+                self.assertEqual(dm.generalDMClass.prefetchLookups('mock_backend.accdb', prefetchPath, executor), 1)
+                self.assertEqual(len(cache.pending), 1)
+                threading.Timer(0.05, release.set).start()
+                outDF = dm.generalDMClass.readLookup(query, 'tluObservers', 'mock_backend.accdb')
+
+            self.assertEqual(outDF['First_Last'].tolist(), ['Ann_Lee', 'Bo_Chan'])
+            self.assertEqual(mock_read.call_count, 1)
+            self.assertEqual(cache.hitCount, 1)
+            self.assertEqual(cache.pending, {})
+
+        print("Success 'test_prefetch_lookups_read_once' passed.")
+
+    def test_prefetch_spanning_write_not_cached(self):
+        # A prefetch read which was in flight when the ETL wrote to the backend isn't cached
+
+        lookupDF = pd.DataFrame({'SiteID': [1], 'SiteCode': ['S1']})
+        started = threading.Event()
+        release = threading.Event()
+
+        def read_backend(inQuery, inDB, session=None):
+            started.set()
+            release.wait(5)
+            return lookupDF
+
+        cache = dm.lookupCache()
+        with ThreadPoolExecutor(max_workers=1) as executor, \
+                patch.object(dm.generalDMClass, 'connect_to_AcessDB_DF', side_effect=read_backend), \
+                patch.object(dm.lookupCache, 'backendModified', return_value=1.0):
+            future = cache.prefetch('SELECT * FROM refSite;', 'refSite', 'mock_backend.accdb', executor)
+            started.wait(5)
+            cache.invalidate('mock_backend.accdb', 'refSite')
+            release.set()
+            future.result()
+
+        self.assertEqual(len(cache.entries), 0)
+        self.assertEqual(cache.usedQueries('mock_backend.accdb'), [])
+
+        print("Success 'test_prefetch_spanning_write_not_cached' passed.")
+
+
+    def test_export_prefetch_daemon_thread(self):
+        # The export prefetch runs on a daemon thread (not joined at interpreter exit when the run fails), the result
+        # or exception is returned through the future
+
+        release = threading.Event()
+        future = dm.generalDMClass.submitDaemon('prefetchExport', lambda value: release.wait(5) and value, 'export')
+        thread = [thread for thread in threading.enumerate() if thread.name == 'prefetchExport'][0]
+        self.assertTrue(thread.daemon)
+        release.set()
+        self.assertEqual(future.result(timeout=5), 'export')
+
+        def failExport():
+            raise SystemExit('export failed')
+
+        with self.assertRaises(SystemExit):
+            dm.generalDMClass.submitDaemon('prefetchExport', failExport).result(timeout=5)
+
+        print("Success 'test_export_prefetch_daemon_thread' passed.")
+
+
+class TestExportCache(unittest.TestCase):
+# Methods for testing the AGOL/Portal export cache
+
+    def write_export(self, exportDir, records):
+        os.makedirs(exportDir, exist_ok=True)
+        pd.DataFrame({'GlobalID': list(range(records))}).to_csv(os.path.join(exportDir, 'Events_0.csv'), index=False)
+
+    def test_export_cache_hit_miss_and_eviction(self):
+        # Unchanged service versions reuse the cached extraction, a new version replaces the prior version and entries
+        # are evicted by count and age
+
+        with tempfile.TemporaryDirectory() as workspace:
+            cacheDir = os.path.join(workspace, 'exportCache')
+            exportDir = os.path.join(workspace, 'SFAN_NSOW_AGOL_20260101')
+            self.write_export(exportDir, 2)
+
+            cache = dm.exportCache(cacheDir, maxEntries=2)
+            self.assertIsNone(cache.get('item1', [0, 1], 1700000000000))
+            cache.put('item1', [0, 1], 1700000000000, exportDir, title='SFAN_NSOW_AGOL_20260101')
+
+            # Next run - unchanged service
+            cache = dm.exportCache(cacheDir, maxEntries=2)
+            cachedDir = cache.get('item1', [0, 1], 1700000000000)
+            outDFDic = dm.generalDMClass.importFilesToDF(inDir=cachedDir)
+            self.assertEqual(len(outDFDic['Events_0']), 2)
+            self.assertEqual((cache.hitCount, cache.missCount), (1, 0))
+
+            # Service edited - miss, the new export replaces the prior version
+            self.assertIsNone(cache.get('item1', [0, 1], 1700000005000))
+            self.write_export(exportDir, 3)
+            cache.put('item1', [0, 1], 1700000005000, exportDir)
+            self.assertEqual(len(cache.manifest), 1)
+            self.assertFalse(os.path.exists(cachedDir))
+
+            # Least recently used item evicted beyond maxEntries
+            cache.put('item2', [0], 1, exportDir)
+            cache.put('item3', [0], 1, exportDir)
+            self.assertIsNone(cache.get('item1', [0, 1], 1700000005000))
+            self.assertEqual(cache.evictCount, 1)
+
+            # Aged out
+            self.assertEqual(cache.evict(now=time.time() + 31 * 86400), 2)
+            self.assertEqual(cache.manifest, {})
+
+        print("Success 'test_export_cache_hit_miss_and_eviction' passed.")
+
+
+class TestExtractWatermark(unittest.TestCase):
+# Methods for testing the incremental extraction watermark store
+
+    def test_watermark_merge_and_commit(self):
+        # Extracted features are merged into the local base on the ObjectID, the watermark only advances on commit
+
+        with tempfile.TemporaryDirectory() as workspace:
+            store = dm.extractWatermark(workspace, 'item1')
+            self.assertEqual(store.whereClause('ElephantSeal_0', editField='EditDate'), '1=1')
+
+            firstDF = pd.DataFrame({'OBJECTID': [1, 2], 'Season': ['Breeding', 'Molt'],
+                                    'EditDate': [1735689600000, 1735693200000]})
+            store.merge('ElephantSeal_0', firstDF, editField='EditDate')
+            self.assertEqual(dm.extractWatermark(workspace, 'item1').watermarks, {})
+            self.assertEqual(store.commit(), 1)
+
+            # Next run - only edits since the watermark are queried
+            store = dm.extractWatermark(workspace, 'item1')
+            self.assertEqual(store.whereClause('ElephantSeal_0', editField='EditDate'),
+                             "EditDate >= TIMESTAMP '2025-01-01 01:00:00'")
+            self.assertEqual(store.whereClause('ElephantSeal_0', oidField='OBJECTID'), 'OBJECTID > 2')
+
+            deltaDF = pd.DataFrame({'OBJECTID': [2, 3], 'Season': ['Breeding', 'Breeding'],
+                                    'EditDate': [1735700000000, 1735700000000]})
+            mergedDF = store.merge('ElephantSeal_0', deltaDF, editField='EditDate', currentIDs=[2, 3])
+            self.assertEqual(mergedDF['OBJECTID'].tolist(), [2, 3])
+            self.assertEqual(mergedDF['Season'].tolist(), ['Breeding', 'Breeding'])
+
+            # Run failed - not committed, the next run extracts again from the prior watermark
+            store = dm.extractWatermark(workspace, 'item1')
+            self.assertEqual(store.watermarks['ElephantSeal_0']['editDate'], 1735693200000)
+            self.assertEqual(len(store.readBase('ElephantSeal_0')), 2)
+
+        print("Success 'test_watermark_merge_and_commit' passed.")
+
+
+class featureServerStandIn(BaseHTTPRequestHandler):
+    # Local stand-in for an AGOL/Portal FeatureServer - a survey layer and a repeat table
+
+    layers = {0: {'name': 'ElephantSeal', 'maxRecordCount': 2, 'geometryType': 'esriGeometryPoint',
+                  'features': [{'attributes': {'OBJECTID': oid, 'GlobalID': f'g{oid}', 'Season': 'Breeding',
+                                               'SurveyDate': 1735689600000},
+                                'geometry': {'x': -122.5, 'y': 37.9}} for oid in range(1, 6)]},
+              1: {'name': 'countsrepeats', 'maxRecordCount': 1000,
+                  'features': [{'attributes': {'OBJECTID': 1, 'GlobalID': 'c1', 'Season': None,
+                                               'SurveyDate': None}}]}}
+    fields = [{'name': 'OBJECTID', 'type': 'esriFieldTypeOID', 'alias': 'ObjectID'},
+              {'name': 'GlobalID', 'type': 'esriFieldTypeGlobalID', 'alias': 'GlobalID'},
+              {'name': 'Season', 'type': 'esriFieldTypeString', 'alias': 'Season'},
+              {'name': 'SurveyDate', 'type': 'esriFieldTypeDate', 'alias': 'Survey Date'}]
+    lock = threading.Lock()
+    active = 0
+    maxActive = 0
+    outSRs = set()
+    delay = 0.05
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        params = dict(urllib.parse.parse_qsl(self.rfile.read(int(self.headers['Content-Length'])).decode()))
+        parts = self.path.strip('/').split('/')
+
+        if parts[-1] == 'FeatureServer':
+            outJSON = {'layers': [{'id': 0, 'name': 'ElephantSeal'}], 'tables': [{'id': 1, 'name': 'countsrepeats'}]}
+        elif parts[-1] != 'query':
+            layer = featureServerStandIn.layers[int(parts[-1])]
+            outJSON = {'name': layer['name'], 'objectIdField': 'OBJECTID', 'fields': featureServerStandIn.fields,
+                       'maxRecordCount': layer['maxRecordCount'], 'geometryType': layer.get('geometryType')}
+        elif params.get('returnIdsOnly') == 'true':
+            layer = featureServerStandIn.layers[int(parts[-2])]
+            outJSON = {'objectIds': [feature['attributes']['OBJECTID'] for feature in layer['features']]}
+        else:
+            layer = featureServerStandIn.layers[int(parts[-2])]
+            firstID, lastID = map(int, re.findall(r'\d+', params['where']))
+            with featureServerStandIn.lock:
+                featureServerStandIn.outSRs.add(params.get('outSR'))
+                featureServerStandIn.active += 1
+                featureServerStandIn.maxActive = max(featureServerStandIn.maxActive, featureServerStandIn.active)
+            time.sleep(featureServerStandIn.delay)
+            with featureServerStandIn.lock:
+                featureServerStandIn.active -= 1
+            features = [feature for feature in layer['features']
+                        if firstID <= feature['attributes']['OBJECTID'] <= lastID]
+            outJSON = {'features': features[:layer['maxRecordCount']],
+                       'exceededTransferLimit': len(features) > layer['maxRecordCount']}
+
+        body = json.dumps(outJSON).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class TestFeatureServiceQuery(unittest.TestCase):
+# Methods for testing the paged direct feature service query
+
+    def test_query_feature_service_ranges(self):
+        # Layers are queried in concurrent ObjectID ranges within maxRecordCount and returned as the CSV export frames
+
+        self.assertEqual(agl.objectIDRanges([5, 1, 2, 3, 4], 2), [(1, 2), (3, 4), (5, 5)])
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), featureServerStandIn)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        serviceURL = f'http://127.0.0.1:{server.server_address[1]}/arcgis/rest/services/Survey/FeatureServer'
+        try:
+            outDFDic = agl.queryFeatureService(serviceURL, maxWorkers=2)
+            timings = agl.benchmarkFeatureService(serviceURL, workerCounts=(1, 4))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(sorted(outDFDic), ['ElephantSeal_0', 'countsrepeats_1'])
+        surveyDF = outDFDic['ElephantSeal_0']
+        self.assertEqual(surveyDF['ObjectID'].tolist(), [1, 2, 3, 4, 5])
+        self.assertEqual(surveyDF['Survey Date'].iloc[0], '01/01/2025 12:00:00 AM')
+        self.assertEqual(surveyDF['x'].iloc[0], -122.5)
+        self.assertEqual(featureServerStandIn.outSRs, {'4326'})
+        self.assertEqual(len(outDFDic['countsrepeats_1']), 1)
+
+        # Bounded worker pool - ranges fetched concurrently, never more than the workers
+        self.assertGreater(featureServerStandIn.maxActive, 1)
+        self.assertLessEqual(featureServerStandIn.maxActive, 4)
+        self.assertEqual(sorted(timings), [1, 4])
+
+        print("Success 'test_query_feature_service_ranges' passed.")
+
+
 class TestETLTargetSchema(unittest.TestCase):
     #Methds for testing expected data types are compatiable with target schema (i.e. field type match)
     '''